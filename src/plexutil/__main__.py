@@ -1,11 +1,11 @@
+from __future__ import annotations
+
 import sys
 import time
+from typing import TYPE_CHECKING
 
-from plexapi.exceptions import Unauthorized
-
-from plexutil.core.auth import Auth
-from plexutil.core.library_factory import LibraryFactory
 from plexutil.core.prompt import Prompt
+from plexutil.dto.server_profile_dto import ServerProfileDTO
 from plexutil.enums.user_request import UserRequest
 from plexutil.exception.auth_error import AuthError
 from plexutil.exception.bootstrap_error import BootstrapError
@@ -30,25 +30,100 @@ from plexutil.exception.user_error import UserError
 from plexutil.plex_util_logger import PlexUtilLogger
 from plexutil.util.file_importer import FileImporter
 from plexutil.util.icons import Icons
-from plexutil.util.plex_ops import PlexOps
+
+if TYPE_CHECKING:
+    from plexutil.dto.bootstrap_paths_dto import BootstrapPathsDTO
+    from plexutil.util.cached_plex_account import CachedPlexAccount
+
+
+def get_account(
+    bootstrap_paths_dto: BootstrapPathsDTO,
+) -> CachedPlexAccount:
+    """
+    Login to Plex, reauthenticating once if the saved token is refused
+
+    Args:
+        bootstrap_paths_dto (BootstrapPathsDTO): Used to locate auth dir
+
+    Returns:
+        CachedPlexAccount: The logged in account
+    """
+    from plexapi.exceptions import Unauthorized  # noqa: PLC0415
+
+    from plexutil.core.auth import Auth  # noqa: PLC0415
+
+    try:
+        return Auth.get_account(bootstrap_paths_dto)
+    except Unauthorized:
+        description = f"{Icons.WARNING} Reauthentication required\n"
+        PlexUtilLogger.get_logger().warning(description)
+        time.sleep(1)
+        bootstrap_paths_dto.private_key_dir.unlink(missing_ok=True)
+        bootstrap_paths_dto.public_key_dir.unlink(missing_ok=True)
+        # The token file is kept, it holds the client identifier
+        bootstrap_paths_dto.account_cache_dir.unlink(missing_ok=True)
+        return Auth.get_account(bootstrap_paths_dto)
 
 
 def main() -> None:
     try:
         bootstrap_paths_dto = FileImporter.bootstrap()
         user_request = Prompt.confirm_user_request()
-        try:
-            plex_account = Auth.get_account(bootstrap_paths_dto)
-        except Unauthorized:
-            description = f"{Icons.WARNING} Reauthentication required\n"
-            PlexUtilLogger.get_logger().warning(description)
-            time.sleep(1)
-            bootstrap_paths_dto.private_key_dir.unlink(missing_ok=True)
-            bootstrap_paths_dto.public_key_dir.unlink(missing_ok=True)
-            bootstrap_paths_dto.token_dir.unlink(missing_ok=True)
-            plex_account = Auth.get_account(bootstrap_paths_dto)
+        max_workers = Prompt.confirm_max_workers()
+
+        # Loaded past the quick exits (i.e --version), plexapi and every
+        # Library pull in most of the startup time
+        from plexutil.core.library_factory import (  # noqa: PLC0415
+            LibraryFactory,
+        )
+        from plexutil.core.spec_applier import SpecApplier  # noqa: PLC0415
+        from plexutil.util.plex_ops import PlexOps  # noqa: PLC0415
+
+        if user_request is UserRequest.APPLY:
+            # Fail on a malformed spec before authenticating
+            server_specs = FileImporter.get_spec(Prompt.confirm_spec_path())
+            SpecApplier(
+                plex_account=get_account(bootstrap_paths_dto),
+                bootstrap_paths_dto=bootstrap_paths_dto,
+            ).apply(server_specs)
+            sys.exit(0)
+
+        plex_server = None
+        server_profile = Prompt.confirm_server_profile(
+            FileImporter.get_server_profiles(
+                bootstrap_paths_dto.server_profiles_dir
+            )
+        )
+        if server_profile:
+            from plexutil.core.auth import Auth  # noqa: PLC0415
+
+            Auth.set_headers(bootstrap_paths_dto)
+            try:
+                plex_server = Prompt.connect_server_profile(server_profile)
+            except ServerConnectionError as e:
+                description = (
+                    f"{Icons.WARNING} {e!s}\nDiscovering servers instead"
+                )
+                PlexUtilLogger.get_logger().warning(description)
+
+        if plex_server is None:
+            plex_account = get_account(bootstrap_paths_dto)
+            try:
+                plex_server = Prompt.confirm_server(plex_account=plex_account)
+            except ServerConnectionError:
+                # The cached connections may be stale, refetch next time
+                plex_account.invalidate()
+                raise
 
-        plex_server = Prompt.confirm_server(plex_account=plex_account)
+        FileImporter.save_server_profile(
+            bootstrap_paths_dto.server_profiles_dir,
+            ServerProfileDTO(
+                name=plex_server.friendlyName,
+                machine_identifier=plex_server.machineIdentifier,
+                base_url=plex_server._baseurl,
+                token=plex_server._token,
+            ),
+        )
 
         release = plex_server.checkForUpdate()
         current_version = plex_server.version
@@ -91,6 +166,7 @@ def main() -> None:
                 user_request=user_request,
                 plex_server=plex_server,
                 bootstrap_paths_dto=bootstrap_paths_dto,
+                max_workers=max_workers,
             )
             library.do()
 
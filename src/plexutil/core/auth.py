@@ -1,12 +1,14 @@
 import uuid
 from importlib.metadata import PackageNotFoundError, version
 
-from plexapi.myplex import MyPlexAccount, MyPlexJWTLogin
+import plexapi
+from plexapi.myplex import MyPlexJWTLogin
 
 from plexutil.dto.bootstrap_paths_dto import BootstrapPathsDTO
 from plexutil.exception.auth_error import AuthError
 from plexutil.plex_util_logger import PlexUtilLogger
 from plexutil.static import Static
+from plexutil.util.cached_plex_account import CachedPlexAccount
 from plexutil.util.file_importer import FileImporter
 from plexutil.util.icons import Icons
 
@@ -15,7 +17,7 @@ class Auth(Static):
     @staticmethod
     def get_account(
         bootstrap_paths_dto: BootstrapPathsDTO,
-    ) -> MyPlexAccount:
+    ) -> CachedPlexAccount:
         """
         Login to Plex and returns a list of all the available Plex Resources
         (Servers and Clients)
@@ -27,23 +29,13 @@ class Auth(Static):
             bootstrap_paths_dto (BootstrapPathsDTO): Used to locate auth dir
 
         Returns:
-            list[MyPlexResource]: Plex Resources
+            CachedPlexAccount: The account, its plex.tv responses cached
         """
         private_key_path = bootstrap_paths_dto.private_key_dir
         public_key_path = bootstrap_paths_dto.public_key_dir
         token_path = bootstrap_paths_dto.token_dir
 
-        try:
-            plexutil_version = version("plexutil")
-
-        except PackageNotFoundError:
-            pyproject = FileImporter.get_pyproject()
-            plexutil_version = pyproject["project"]["version"]
-
-        headers = {}
-        headers["X-Plex-Client-Identifier"] = f"{uuid.uuid4()!s}"
-        headers["X-Plex-Product"] = f"Plexutil {plexutil_version} via Plexapi"
-        headers["X-Plex-Version"] = plexutil_version
+        headers = Auth.set_headers(bootstrap_paths_dto)
 
         if (
             not private_key_path.exists()
@@ -82,4 +74,41 @@ class Auth(Static):
         description = "Auth exists"
         PlexUtilLogger.get_logger().debug(description)
         token, _ = FileImporter.get_jwt(bootstrap_paths_dto.token_dir)
-        return MyPlexAccount(token=token)
+        return CachedPlexAccount(
+            token=token, cache_path=bootstrap_paths_dto.account_cache_dir
+        )
+
+    @staticmethod
+    def set_headers(bootstrap_paths_dto: BootstrapPathsDTO) -> dict[str, str]:
+        """
+        Headers identifying plexutil to Plex, applied to every plexapi
+        request. The client identifier is kept with the token, this
+        device is registered once and recognized on every run
+
+        Args:
+            bootstrap_paths_dto (BootstrapPathsDTO): Used to locate auth dir
+
+        Returns:
+            dict[str, str]: The headers
+        """
+        try:
+            _, client_identifier = FileImporter.get_jwt(
+                bootstrap_paths_dto.token_dir
+            )
+        except (OSError, ValueError, KeyError):
+            client_identifier = f"{uuid.uuid4()!s}"
+
+        try:
+            plexutil_version = version("plexutil")
+
+        except PackageNotFoundError:
+            pyproject = FileImporter.get_pyproject()
+            plexutil_version = pyproject["project"]["version"]
+
+        headers = {}
+        headers["X-Plex-Client-Identifier"] = client_identifier
+        headers["X-Plex-Product"] = f"Plexutil {plexutil_version} via Plexapi"
+        headers["X-Plex-Version"] = plexutil_version
+
+        plexapi.BASE_HEADERS.update(headers)
+        return headers
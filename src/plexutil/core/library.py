@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import threading
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -11,22 +13,23 @@ from plexutil.core.prompt import Prompt
 from plexutil.enums.agent import Agent
 from plexutil.enums.language import Language
 from plexutil.enums.library_setting import LibrarySetting
+from plexutil.enums.refresh_mode import RefreshMode
 from plexutil.enums.scanner import Scanner
 from plexutil.enums.user_request import UserRequest
-from plexutil.exception.library_illegal_state_error import (
-    LibraryIllegalStateError,
-)
-from plexutil.exception.library_poll_timeout_error import (
-    LibraryPollTimeoutError,
-)
 from plexutil.exception.library_section_missing_error import (
     LibrarySectionMissingError,
 )
 from plexutil.plex_util_logger import PlexUtilLogger
+from plexutil.util.dir_watcher import DirWatcher
 from plexutil.util.icons import Icons
 from plexutil.util.plex_ops import PlexOps
+from plexutil.util.query_builder import QueryBuilder
+from plexutil.util.scan_monitor import ScanMonitor
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
     from plexapi.audio import Track
     from plexapi.library import (
         LibrarySection,
@@ -36,13 +39,23 @@ if TYPE_CHECKING:
 
     from plexutil.dto.bootstrap_paths_dto import BootstrapPathsDTO
 
-from alive_progress import alive_bar
 
 from plexutil.enums.library_type import LibraryType
 from plexutil.exception.library_op_error import LibraryOpError
 
 
 class Library(ABC):
+    # Sections rarely change outside of plexutil, a short TTL is enough
+    SECTIONS_TTL_SECONDS = 30
+    # Slow devices need more time to reflect a created/deleted Section
+    SECTIONS_READY_TIMEOUT_SECONDS = 30
+    SECTIONS_READY_INTERVAL_SECONDS = 1
+    # Items requested per page when streaming a Section
+    QUERY_PAGE_SIZE = 500
+    # Per item refresh limits, small NAS servers can't take much more
+    REFRESH_MAX_WORKERS = 4
+    REFRESH_MAX_PER_SECOND = 10
+
     def __init__(
         self,
         supported_requests: list[UserRequest],
@@ -66,6 +79,11 @@ class Library(ABC):
         self.language = language
         self.user_request = user_request
         self.bootstrap_paths_dto = bootstrap_paths_dto
+        self.sections_cache: list[LibrarySection] = []
+        self.sections_cached_at = 0.0
+        self.is_sections_stale = True
+        self.is_section_expected: bool | None = None
+        self.refresh_mode = RefreshMode.get_default()
 
     def do(self) -> None:
         match self.user_request:
@@ -84,7 +102,19 @@ class Library(ABC):
                 self.display(expect_input=False)
             case UserRequest.UPDATE:
                 self.display(expect_input=True)
-                self.update()
+                paths = self.confirm_update_paths()
+                self.refresh_mode = Prompt.confirm_refresh_mode()
+                self.update(paths=paths)
+            case UserRequest.WATCH:
+                self.display(expect_input=True)
+                poll_interval, debounce, max_delay = (
+                    Prompt.confirm_watch_timings()
+                )
+                self.watch(
+                    poll_interval_seconds=poll_interval,
+                    debounce_seconds=debounce,
+                    max_delay_seconds=max_delay,
+                )
             case UserRequest.MODIFY:
                 self.display(expect_input=True)
                 self.modify()
@@ -110,6 +140,42 @@ class Library(ABC):
     def query(self) -> list[Track] | list[Show] | list[Movie] | list[Playlist]:
         raise NotImplementedError
 
+    def iter_query(
+        self, page_size: int = QUERY_PAGE_SIZE, filters: dict | None = None
+    ) -> Iterator[Track | Show | Movie]:
+        """
+        Streams the media items of the current LibrarySection page by page,
+        keeping memory bounded regardless of the Section size
+
+        Args:
+            page_size (int): Amount of items requested per page
+            filters (dict | None): plexapi advanced filters
+
+        Returns:
+            Iterator[Track | Show | Movie]: Media from the current Section
+        """
+        op_type = "QUERY"
+        self.log_library(operation=op_type, is_info=False, is_debug=True)
+        yield from PlexOps.iter_section(
+            section=self.get_section(),
+            libtype=self.library_type.get_media_type(),
+            page_size=page_size,
+            filters=filters,
+        )
+
+    def count(self) -> int:
+        """
+        Counts the media items of the current LibrarySection
+        without downloading them
+
+        Returns:
+            int: Amount of media items in the current Section
+        """
+        return PlexOps.get_count(
+            section=self.get_section(),
+            libtype=self.library_type.get_media_type(),
+        )
+
     @abstractmethod
     def display_media(
         self, expect_input: bool = False
@@ -117,44 +183,249 @@ class Library(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def update(self) -> None:
+    def update(self, paths: list[Path] | None = None) -> None:
         """
-        Updates and Refreshes a Library, including each of its media items
+        Updates a Library and refreshes its media according to
+        self.refresh_mode:
+        SECTION -> a single refresh request for the whole Library
+        CHANGED -> only items updated since the last Library update
+        ALL -> every item, on a bounded and rate limited pool
+
+        When paths are supplied only those directories are scanned,
+        and CHANGED/ALL only refresh the items located under them
+
+        Args:
+            paths (list[Path] | None): Directories under self.locations
+            to scan, scans the whole Library if none supplied
 
         Returns:
             None: This method does not return a value
+
+        Raises:
+            LibraryOpError: If a path is not under self.locations
         """
         start = time.time()
         section = self.get_section()
-        section.update()
-        section.refresh()
-        [media.refresh() for media in self.query()]
+        last_updated_at = section.updatedAt
+        scan_paths = self.resolve_update_paths(paths or [])
+
+        # Listen before triggering, so no scan event is missed
+        scan_monitor = ScanMonitor(plex_server=self.plex_server)
+        scan_monitor.start()
+        try:
+            if scan_paths:
+                for scan_path in scan_paths:
+                    section.update(path=scan_path)
+            else:
+                section.update()
+            self.refresh_media(
+                last_updated_at=last_updated_at, paths=scan_paths
+            )
 
-        is_updating = any(
-            "updating" in x.title.lower() or "scanning" in x.title.lower()
-            for x in self.plex_server.activities
-        )
-        while is_updating:
             with yaspin(text="Updating", color="yellow") as spinner:
-                elapsed = time.time() - start
-                spinner.write(
-                    f"# of items: {len(self.query())!s} [{elapsed:.2f}s]"
-                )
-                is_updating = any(
-                    "updating" in x.title.lower()
-                    or "scanning" in x.title.lower()
-                    for x in self.plex_server.activities
-                )
-                if not is_updating:
-                    spinner.text = ""
-                    spinner.ok(f"{Icons.SUCCESS} Updated")
+
+                def on_progress(activities: str) -> None:
+                    elapsed = time.time() - start
+                    spinner.text = f"Updating {activities} [{elapsed:.2f}s]"
+
+                scan_monitor.wait(on_progress=on_progress)
+                spinner.text = ""
+                spinner.ok(f"{Icons.SUCCESS} Updated")
+        finally:
+            scan_monitor.stop()
 
         elapsed = time.time() - start
         description = (
             f"\nFinished update in {elapsed:.2f}s\n"
-            f"# of items: {len(self.query())!s}"
+            f"# of items: {self.count()!s}"
+        )
+        PlexUtilLogger.get_console_logger().info(description)
+
+    def refresh_media(
+        self,
+        last_updated_at: datetime | None,
+        paths: list[str] | None = None,
+    ) -> None:
+        """
+        Refreshes the media of the current LibrarySection
+        according to self.refresh_mode
+        If paths are supplied, CHANGED and ALL only refresh the items
+        located under them, SECTION still refreshes the whole Library
+
+        Args:
+            last_updated_at (datetime | None): When the Section was last
+            updated, prior to the current update
+            paths (list[str] | None): Server paths to limit the refresh to
+
+        Returns:
+            None: This method does not return a value
+        """
+        section = self.get_section()
+        refresh_mode = self.refresh_mode
+        if refresh_mode is RefreshMode.CHANGED and not last_updated_at:
+            refresh_mode = RefreshMode.ALL
+
+        match refresh_mode:
+            case RefreshMode.SECTION:
+                section.refresh()
+                return
+            case RefreshMode.CHANGED:
+                media = self.iter_query(
+                    filters={"updatedAt>>": last_updated_at}
+                )
+            case RefreshMode.ALL:
+                media = self.iter_query()
+
+        if paths:
+            media = (x for x in media if PlexOps.is_under_paths(x, paths))
+
+        refreshed = PlexOps.refresh_media(
+            media=media,
+            max_workers=Library.REFRESH_MAX_WORKERS,
+            max_per_second=Library.REFRESH_MAX_PER_SECOND,
+        )
+        description = (
+            f"Refreshed {refreshed!s} items ({refresh_mode.get_value()})"
+        )
+        PlexUtilLogger.get_logger().debug(description)
+
+    def watch(
+        self,
+        stop_event: threading.Event | None = None,
+        poll_interval_seconds: float = DirWatcher.POLL_INTERVAL_SECONDS,
+        debounce_seconds: float = DirWatcher.DEBOUNCE_SECONDS,
+        max_delay_seconds: float = DirWatcher.MAX_DELAY_SECONDS,
+    ) -> None:
+        """
+        Watches self.locations and scans the changed directories only,
+        once their changes have settled
+        Expects the locations to be reachable from this machine
+        under the same paths as on the server
+        Runs until stop_event is set or the user interrupts
+
+        Args:
+            stop_event (threading.Event | None): Set to stop watching
+            poll_interval_seconds (float): Time between two checks
+            debounce_seconds (float): Quiet period before a directory
+            is scanned
+            max_delay_seconds (float): Max time a directory is held back
+            while it keeps changing
+
+        Returns:
+            None: This method does not return a value
+
+        Raises:
+            LibraryOpError: If a location is not a local directory
+        """
+        op_type = "WATCH"
+        self.log_library(operation=op_type, is_info=False, is_debug=True)
+
+        missing = [x for x in self.locations if not x.is_dir()]
+        if missing:
+            description = (
+                f"Locations not found on this machine: {missing!s}\n"
+                "Watch must run where the Library files are reachable"
+            )
+            raise LibraryOpError(
+                op_type=op_type,
+                library_type=self.library_type,
+                description=description,
+            )
+
+        # Only what the scans touched needs a refresh
+        self.refresh_mode = RefreshMode.CHANGED
+        stop_event = stop_event or threading.Event()
+        watcher = DirWatcher(
+            roots=self.locations,
+            poll_interval_seconds=poll_interval_seconds,
+            debounce_seconds=debounce_seconds,
+            max_delay_seconds=max_delay_seconds,
+        )
+
+        def on_batch(paths: list[Path]) -> None:
+            description = f"Changes detected: {[str(x) for x in paths]!s}"
+            PlexUtilLogger.get_console_logger().info(description)
+            try:
+                self.update(paths=paths)
+            except Exception as e:  # noqa: BLE001
+                description = (
+                    f"{Icons.WARNING} Scan failed for {paths!s}: {e!s}"
+                )
+                PlexUtilLogger.get_logger().warning(description)
+
+        description = (
+            f"Watching {self.name}: {[str(x) for x in self.locations]!s}\n"
+            "Press Ctrl+C to stop"
         )
         PlexUtilLogger.get_console_logger().info(description)
+        try:
+            watcher.run(on_batch=on_batch, stop_event=stop_event)
+        except KeyboardInterrupt:
+            description = f"Stopped watching {self.name}"
+            PlexUtilLogger.get_console_logger().info(description)
+
+    def confirm_update_paths(self) -> list[Path]:
+        """
+        Ask user for the directories to scan, or the whole Library
+        if none provided
+
+        Returns:
+            list[Path]: The directories to scan
+        """
+        locations = ", ".join(str(x) for x in self.locations)
+        description = (
+            "Type the directories to scan, separated by comma\n"
+            "Relative paths are resolved against the first location\n"
+            f"Locations: {locations}\n"
+            "Leave empty to scan the whole Library"
+        )
+        paths = Prompt.confirm_text(
+            title="Paths",
+            description=description,
+            question="",
+        )
+        return [Path(x.strip()) for x in paths if x.strip()]
+
+    def resolve_update_paths(self, paths: list[Path]) -> list[str]:
+        """
+        Resolves directories to server paths, ensuring each one
+        is under one of self.locations
+
+        Args:
+            paths (list[Path]): Absolute paths, or paths relative
+            to the first location
+
+        Returns:
+            list[str]: The server paths
+
+        Raises:
+            LibraryOpError: If a path is not under self.locations
+        """
+        resolved = []
+        for path in paths:
+            candidate = path
+            if not path.is_absolute() and self.locations:
+                candidate = self.locations[0] / path
+            # is_relative_to is lexical, sub/../../elsewhere must not pass
+            candidate = Path(os.path.normpath(candidate))
+
+            if not any(
+                candidate.is_relative_to(os.path.normpath(location))
+                for location in self.locations
+            ):
+                description = (
+                    f"Path is not under the Library locations: {path!s}\n"
+                    f"Locations: {self.locations!s}"
+                )
+                raise LibraryOpError(
+                    op_type="UPDATE",
+                    library_type=self.library_type,
+                    description=description,
+                )
+
+            resolved.append(candidate)
+
+        return self.get_server_locations(resolved)
 
     @abstractmethod
     def modify(self, is_modify_media: bool = False) -> None:
@@ -194,6 +465,7 @@ class Library(ABC):
                 scanner=self.scanner.get_value(),
                 language=self.language.get_value(),
             )
+            self.invalidate_sections()
 
             PlexOps.set_library_settings(
                 section=self.get_section(),
@@ -203,8 +475,9 @@ class Library(ABC):
     @abstractmethod
     def create(self) -> None:
         """
-        Creates a Library
-        Logs a warning if a specific Library Setting is rejected by the server
+        Creates a Library along with its Library Settings
+        in a single request, then waits for the Section to be listed
+        Logs a warning for every Library Setting not valid
 
         Returns:
             None: This method does not return a value
@@ -219,33 +492,166 @@ class Library(ABC):
         self.assign_agent()
         self.assign_language()
 
-        op_type = "CREATE"
+        library_settings = [
+            x.to_dto() for x in LibrarySetting.get_all(self.library_type)
+        ]
 
-        self.log_library(operation=op_type, is_info=False, is_debug=True)
+        prefs = {}
+        for setting in library_settings:
+            response = Prompt.confirm_library_setting(setting)
+            prefs[setting.name] = response.user_response
 
-        locations = self.locations
-        if "linux" in self.plex_server.platform.lower():
-            locations = [location.as_posix() for location in self.locations]
+        self.add_section(prefs=prefs)
+
+    def add_section(self, prefs: dict[str, bool | int | str]) -> None:
+        """
+        Adds this Library to the server along with its Library Settings
+        in a single request, then waits for the Section to be listed
+        Does not prompt, expects every attribute to be assigned
+
+        Settings known to plexutil are validated against LibrarySetting
+        and sent with the request, a warning is logged for the invalid ones
+        Any other setting is applied once the Section exists, validated
+        against the settings the server reports
+
+        Args:
+            prefs (dict[str, bool | int | str]): Library Settings
+            keyed by setting id
+
+        Returns:
+            None: This method does not return a value
+        """
+        op_type = "CREATE"
+        library_settings = {
+            x.get_name(): x for x in LibrarySetting.get_all(self.library_type)
+        }
+        inline_prefs = {}
+        deferred_prefs = {}
+        for name, value in prefs.items():
+            library_setting = library_settings.get(name)
+            if library_setting is None:
+                deferred_prefs[name] = value
+            elif PlexOps.is_library_setting_valid(
+                value=value,
+                is_toggle=library_setting.is_toggle(),
+                enum_values=[x.value for x in library_setting.get_dropdown()]
+                if library_setting.is_dropdown()
+                else None,
+            ):
+                inline_prefs[name] = value
+            else:
+                PlexOps.warn_library_setting_rejected(name=name, value=value)
 
-        self.plex_server.library.add(
+        part = QueryBuilder(
+            "/library/sections",
             name=self.name,
-            type=self.library_type.get_value(),
+            the_type=self.library_type.get_value(),
             agent=self.agent.get_value(),
             scanner=self.scanner.get_value(),
-            location=[str(x) for x in locations],
             language=self.language.get_value(),
+            location=self.get_server_locations(),
+            prefs=inline_prefs,
+        ).build()
+
+        description = f"Query: {part}"
+        PlexUtilLogger.get_logger().debug(description)
+
+        self.log_library(operation=op_type, is_info=False, is_debug=True)
+
+        self.plex_server.query(
+            part,
+            method=self.plex_server._session.post,
         )
+        self.invalidate_sections(is_section_expected=True)
+        # Waits until the server lists the new Section, the cache serves
+        # any later lookup
+        section = self.get_section()
 
-        library_settings = [
-            x.to_dto() for x in LibrarySetting.get_all(self.library_type)
+        if deferred_prefs:
+            PlexOps.apply_library_settings(
+                section=section,
+                plan=deferred_prefs,
+                server_settings={x.id: x for x in section.settings() if x},
+                is_plan_logged=False,
+            )
+
+        description = f"Successfully created: {self.name}"
+        PlexUtilLogger.get_logger().debug(description)
+
+    def converge(self, prefs: dict[str, bool | int | str]) -> list[str]:
+        """
+        Brings the Section in line with the attributes of this Library
+        and the supplied Library Settings, creating it if missing
+        Does not prompt, only what differs from the server is sent
+
+        Args:
+            prefs (dict[str, bool | int | str]): Library Settings
+            keyed by setting id
+
+        Returns:
+            list[str]: Description of every operation performed
+        """
+        if not self.exists():
+            self.add_section(prefs=prefs)
+            return [f"Created library: {self.name}"]
+
+        operations = []
+        section = self.get_section()
+        locations = self.get_server_locations()
+        changed = [
+            name
+            for name, current, desired in (
+                ("agent", section.agent, self.agent.get_value()),
+                ("scanner", section.scanner, self.scanner.get_value()),
+                ("language", section.language, self.language.get_value()),
+                ("locations", sorted(section.locations), sorted(locations)),
+            )
+            if current != desired
         ]
+        if changed:
+            section.edit(
+                agent=self.agent.get_value(),
+                scanner=self.scanner.get_value(),
+                language=self.language.get_value(),
+                location=locations,
+            )
+            self.invalidate_sections()
+            section = self.get_section()
+            operations.append(
+                f"Modified library: {self.name} ({', '.join(changed)})"
+            )
 
-        PlexOps.set_library_settings(
-            section=self.get_section(),
-            settings=library_settings,
-        )
+        if prefs:
+            applied = PlexOps.apply_library_settings(
+                section=section,
+                plan=prefs,
+                server_settings={x.id: x for x in section.settings() if x},
+                is_plan_logged=False,
+            )
+            operations.extend(
+                f"Set library setting: {self.name} | {name} -> {value!s}"
+                for name, value in applied.items()
+            )
+
+        return operations
+
+    def get_server_locations(
+        self, locations: list[Path] | None = None
+    ) -> list[str]:
+        """
+        Locations as the server expects them
 
-        self.get_section().refresh()
+        Args:
+            locations (list[Path] | None): Defaults to self.locations
+
+        Returns:
+            list[str]: The locations, with forward slashes on linux servers
+        """
+        if locations is None:
+            locations = self.locations
+        if "linux" in self.plex_server.platform.lower():
+            return [location.as_posix() for location in locations]
+        return [str(location) for location in locations]
 
     def assign_language(
         self,
@@ -350,6 +756,7 @@ class Library(ABC):
 
         if self.exists():
             self.get_section().delete()
+            self.invalidate_sections(is_section_expected=False)
         else:
             description = f"Does not exist: {self.name}"
             raise LibraryOpError(
@@ -419,91 +826,6 @@ class Library(ABC):
                 description=description,
             )
 
-    def poll(
-        self,
-        requested_attempts: int = 0,
-        expected_count: int = 0,
-        interval_seconds: int = 0,
-    ) -> None:
-        """
-        Performs a query based on the supplied parameters
-
-        Args:
-            requested_attempts (int): Amount of times to poll
-            expected_count (int): Polling terminates when reaching this amount
-            interval_seconds (int): timeout before making a new attempt
-
-        Returns:
-            None: This method does not return a value
-
-        Raises:
-            LibraryPollTimeoutError: If expected_count not reached
-        """
-        current_count = len(self.query())
-        init_offset = abs(expected_count - current_count)
-        time_start = time.time()
-
-        debug = (
-            f"\n{Icons.BANNER_LEFT}POLL BEGIN{Icons.BANNER_RIGHT}\n"
-            f"Attempts: {requested_attempts!s}\n"
-            f"Interval: {interval_seconds!s}\n"
-            f"Current count: {current_count!s}\n"
-            f"Expected count: {expected_count!s}\n"
-            f"Net change: {init_offset!s}\n"
-        )
-
-        PlexUtilLogger.get_logger().debug(debug)
-
-        with alive_bar(init_offset) as bar:
-            attempts = 0
-            display_count = 0
-            offset = init_offset
-
-            while attempts < requested_attempts:
-                updated_current_count = len(self.query())
-                offset = abs(updated_current_count - current_count)
-                current_count = updated_current_count
-
-                for _ in range(offset):
-                    display_count = display_count + 1
-                    bar()
-
-                if current_count == expected_count:
-                    break
-
-                if current_count > expected_count:
-                    time_end = time.time()
-                    time_complete = time_end - time_start
-                    description = (
-                        f"Expected {expected_count!s} items in the library "
-                        f"but Plex Server has {current_count!s}\n"
-                        f"Failed in {time_complete:.2f}s\n"
-                        f"{Icons.BANNER_LEFT}POLL END{Icons.BANNER_RIGHT}\n"
-                    )
-                    raise LibraryIllegalStateError(description)
-
-                time.sleep(interval_seconds)
-                attempts = attempts + 1
-                if attempts >= requested_attempts:
-                    time_end = time.time()
-                    time_complete = time_end - time_start
-                    description = (
-                        "Did not reach the expected"
-                        f"library count: {expected_count!s}\n"
-                        f"Failed in {time_complete:.2f}s\n"
-                        f"{Icons.BANNER_LEFT}POLL END{Icons.BANNER_RIGHT}\n"
-                    )
-                    raise LibraryPollTimeoutError(description)
-
-        time_end = time.time()
-        time_complete = time_end - time_start
-        debug = (
-            f"Reached expected: {expected_count!s} in {time_complete:.2f}s\n"
-            f"{Icons.BANNER_LEFT}POLL END{Icons.BANNER_RIGHT}\n"
-        )
-
-        PlexUtilLogger.get_logger().debug(debug)
-
     def log_library(
         self,
         operation: str,
@@ -573,19 +895,78 @@ class Library(ABC):
 
     def get_sections(self) -> list[LibrarySection]:
         """
-        Gets an up-to-date list of all Sections for this LibraryType
+        Gets a list of all Sections for this LibraryType
+        Served from the section cache unless it is older than
+        SECTIONS_TTL_SECONDS or has been invalidated by a mutation
 
         Returns:
             list[LibrarySection]: A current list of all Sections
             for this LibraryType
 
         """
-        time.sleep(1)  # Slow devices need more time
-        sections = self.plex_server.library.sections()
+        elapsed = time.monotonic() - self.sections_cached_at
+        if self.is_sections_stale or elapsed > Library.SECTIONS_TTL_SECONDS:
+            self.sections_cache = self.__await_sections()
+            self.sections_cached_at = time.monotonic()
+            self.is_sections_stale = False
+            self.is_section_expected = None
 
-        description = (
-            f"Section to find: {self.name} {self.library_type.get_value()}"
-        )
+        return self.sections_cache
+
+    def invalidate_sections(
+        self, is_section_expected: bool | None = None
+    ) -> None:
+        """
+        Marks the section cache as stale, to be called after any operation
+        that creates, deletes or edits a Section
+
+        Args:
+            is_section_expected (bool | None): Whether a Section named
+            self.name should be (True) or should no longer be (False)
+            listed by the server. None skips the readiness check
+
+        Returns:
+            None: This method does not return a value
+        """
+        self.is_sections_stale = True
+        self.is_section_expected = is_section_expected
+
+    def __await_sections(self) -> list[LibrarySection]:
+        """
+        Fetches the Sections for this LibraryType
+        If a mutation was just performed, polls until the server reflects it
+        or SECTIONS_READY_TIMEOUT_SECONDS elapses
+
+        Returns:
+            list[LibrarySection]: A current list of all Sections
+            for this LibraryType
+        """
+        sections = self.__fetch_sections()
+        if self.is_section_expected is None:
+            return sections
+
+        deadline = time.monotonic() + Library.SECTIONS_READY_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            is_listed = any(x.title == self.name for x in sections)
+            if is_listed is self.is_section_expected:
+                break
+            time.sleep(Library.SECTIONS_READY_INTERVAL_SECONDS)
+            sections = self.__fetch_sections()
+
+        return sections
+
+    def __fetch_sections(self) -> list[LibrarySection]:
+        """
+        Gets an up-to-date list of all Sections for this LibraryType
+        directly from the server
+
+        Returns:
+            list[LibrarySection]: A current list of all Sections
+            for this LibraryType
+        """
+        # plexapi memoizes the sections, force a new request
+        self.plex_server.library._invalidateCachedProperties()
+        sections = self.plex_server.library.sections()
 
         description = f"All Sections: {sections!s}"
         PlexUtilLogger.get_logger().debug(description)
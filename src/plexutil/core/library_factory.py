@@ -24,6 +24,7 @@ class LibraryFactory(Static):
         plex_server: PlexServer,
         user_request: UserRequest,
         bootstrap_paths_dto: BootstrapPathsDTO,
+        max_workers: int | None = None,
     ) -> Library:
         """
         Prompts user for a LibraryType
@@ -32,6 +33,8 @@ class LibraryFactory(Static):
             plex_server (PlexServer): Used by Libraries
             user_request (UserRequest): Used by Libraries
             bootstrap_paths_dto (BootstrapPathsDTO): Used by Libraries
+            max_workers (int | None): Max Playlists fetched concurrently,
+            MusicPlaylist.MAX_WORKERS if None
 
         Returns:
             Library: The initiazed Library chosen by the user
@@ -63,6 +66,7 @@ class LibraryFactory(Static):
                 plex_server=plex_server,
                 user_request=user_request,
                 bootstrap_paths_dto=bootstrap_paths_dto,
+                max_workers=max_workers or MusicPlaylist.MAX_WORKERS,
             )
         )
         return Prompt.confirm_library(
@@ -40,6 +40,7 @@ class MovieLibrary(Library):
                 UserRequest.DELETE,
                 UserRequest.DISPLAY,
                 UserRequest.UPDATE,
+                UserRequest.WATCH,
                 UserRequest.MODIFY,
             ],
             plex_server=plex_server,
@@ -65,8 +66,8 @@ class MovieLibrary(Library):
     def remove_item(self) -> None:
         raise NotImplementedError
 
-    def update(self) -> None:
-        super().update()
+    def update(self, paths: list[Path] | None = None) -> None:
+        super().update(paths=paths)
 
     def modify(self, is_modify_media: bool = False) -> None:
         is_modify_media = Prompt.confirm_media_modification()
@@ -82,7 +83,7 @@ class MovieLibrary(Library):
             DropdownItemDTO(
                 display_name=movie.title, value=movie, is_default=False
             )
-            for movie in self.query()
+            for movie in self.iter_query()
         ]
 
         return Prompt.draw_dropdown(
@@ -3,11 +3,6 @@ from __future__ import annotations
 from dataclasses import field
 from typing import TYPE_CHECKING, cast
 
-from plexutil.core.prompt import Prompt
-from plexutil.enums.library_setting import LibrarySetting
-from plexutil.plex_util_logger import PlexUtilLogger
-from plexutil.util.query_builder import QueryBuilder
-
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -22,7 +17,6 @@ from plexutil.enums.language import Language
 from plexutil.enums.library_type import LibraryType
 from plexutil.enums.scanner import Scanner
 from plexutil.enums.user_request import UserRequest
-from plexutil.exception.library_op_error import LibraryOpError
 
 
 class MusicLibrary(Library):
@@ -41,6 +35,7 @@ class MusicLibrary(Library):
             supported_requests=[
                 UserRequest.CREATE,
                 UserRequest.UPDATE,
+                UserRequest.WATCH,
                 UserRequest.DELETE,
                 UserRequest.DISPLAY,
                 UserRequest.MODIFY,
@@ -71,8 +66,8 @@ class MusicLibrary(Library):
     def display_media(self, expect_input: bool = False) -> Track:
         raise NotImplementedError
 
-    def update(self) -> None:
-        super().update()
+    def update(self, paths: list[Path] | None = None) -> None:
+        super().update(paths=paths)
 
     def modify(self, is_modify_media: bool = False) -> None:
         super().modify(is_modify_media=is_modify_media)
@@ -87,71 +82,7 @@ class MusicLibrary(Library):
         return super().exists()
 
     def create(self) -> None:
-        """
-        Creates a Music Library
-
-        Returns:
-            None: This method does not return a value
-
-        Raises:
-            LibraryOpError: If Library already exists
-            or when failure to create a Query
-        """
-        super().assign_name()
-        super().error_if_exists()
-        super().assign_locations()
-        super().assign_scanner()
-        super().assign_agent()
-        super().assign_language()
-
-        library_settings = [
-            x.to_dto() for x in LibrarySetting.get_all(self.library_type)
-        ]
-
-        prefs = {}
-        for setting in library_settings:
-            response = Prompt.confirm_library_setting(setting)
-            prefs[setting.name] = response.user_response
-
-        locations = self.locations
-        if "linux" in self.plex_server.platform.lower():
-            locations = [location.as_posix() for location in self.locations]
-
-        part = ""
-        query_builder = QueryBuilder(
-            "/library/sections",
-            name=self.name,
-            the_type="music",
-            agent=self.agent.get_value(),
-            scanner=self.scanner.get_value(),
-            language=self.language.get_value(),
-            location=locations,
-            prefs=prefs,
-        )
-        part = query_builder.build()
-
-        description = f"Query: {part}"
-        PlexUtilLogger.get_logger().debug(description)
-
-        # This posts a music library
-        if part:
-            op_type = "CREATE"
-
-            self.log_library(operation=op_type, is_info=False, is_debug=True)
-
-            self.plex_server.query(
-                part,
-                method=self.plex_server._session.post,
-            )
-            description = f"Successfully created: {self.name}"
-            PlexUtilLogger.get_logger().debug(description)
-        else:
-            description = "Malformed Music Query"
-            raise LibraryOpError(
-                op_type="CREATE",
-                library_type=self.library_type,
-                description=description,
-            )
+        super().create()
 
     def query(self) -> list[Track]:
         """
@@ -1,25 +1,30 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import field
 from typing import TYPE_CHECKING, cast
 
 from plexutil.core.prompt import Prompt
 from plexutil.dto.dropdown_item_dto import DropdownItemDTO
-from plexutil.exception.plex_media_missing_error import PlexMediaMissingError
+from plexutil.service.db_manager import delete_db
 from plexutil.service.music_playlist_service import MusicPlaylistService
 from plexutil.service.song_music_playlist_composite_service import (
     SongMusicPlaylistCompositeService,
 )
 from plexutil.util.icons import Icons
+from plexutil.util.track_index import TrackIndex
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
     from plexapi.audio import Track
     from plexapi.library import MusicSection
+    from plexapi.playlist import Playlist
     from plexapi.server import PlexServer
 
     from plexutil.dto.bootstrap_paths_dto import BootstrapPathsDTO
+    from plexutil.dto.song_dto import SongDTO
 from plexutil.core.library import Library
 from plexutil.dto.music_playlist_dto import MusicPlaylistDTO
 from plexutil.enums.agent import Agent
@@ -33,6 +38,9 @@ from plexutil.util.plex_ops import PlexOps
 
 
 class MusicPlaylist(Library):
+    # Max playlists fetched concurrently from the server
+    MAX_WORKERS = 8
+
     def __init__(
         self,
         plex_server: PlexServer,
@@ -44,6 +52,7 @@ class MusicPlaylist(Library):
         language: Language = Language.get_default(),
         agent: Agent = Agent.get_default(LibraryType.MUSIC_PLAYLIST),
         scanner: Scanner = Scanner.get_default(LibraryType.MUSIC_PLAYLIST),
+        max_workers: int = MAX_WORKERS,
     ) -> None:
         super().__init__(
             supported_requests=[
@@ -65,27 +74,18 @@ class MusicPlaylist(Library):
             bootstrap_paths_dto=bootstrap_paths_dto,
         )
         self.playlist_name = ""
+        self.max_workers = max_workers
 
     def add_item(self) -> None:
+        track_index = self.__get_track_index(self.iter_query())
         songs = Prompt.graphical_confirm_songs(
-            songs=[PlexOps.get_song_dto(track=x) for x in self.query()],
+            songs=track_index.get_songs(),
             playlist_name=self.playlist_name,
             command="Add",
         )
         if not songs:
             return
-        server_tracks = self.query()
-        tracks = []
-        for song in songs:
-            try:
-                tracks.append(
-                    PlexOps.get_track(song_dto=song, tracks=server_tracks)
-                )
-            except PlexMediaMissingError:
-                description = (
-                    f"{Icons.WARNING} Song not found: {song!s} | Skipping..."
-                )
-                PlexUtilLogger.get_logger().warning(description)
+        tracks = self.__get_tracks(track_index=track_index, songs=songs)
 
         if self.user_request is UserRequest.CREATE:
             self.get_section().createPlaylist(
@@ -97,29 +97,16 @@ class MusicPlaylist(Library):
 
     def remove_item(self) -> None:
         playlist = self.get_section().playlist(self.playlist_name)
-        playlist_tracks = playlist.items()
-        playlist_songs = [
-            PlexOps.get_song_dto(track=x) for x in playlist_tracks
-        ]
+        track_index = self.__get_track_index(playlist.items())
 
         songs = Prompt.graphical_confirm_songs(
-            songs=playlist_songs,
+            songs=track_index.get_songs(),
             playlist_name=self.playlist_name,
             command="Remove",
         )
         if not songs:
             return
-        tracks = []
-        for song in songs:
-            try:
-                tracks.append(
-                    PlexOps.get_track(song_dto=song, tracks=playlist_tracks)
-                )
-            except PlexMediaMissingError:
-                description = (
-                    f"{Icons.WARNING} Song not found: {song!s} | Skipping..."
-                )
-                PlexUtilLogger.get_logger().warning(description)
+        tracks = self.__get_tracks(track_index=track_index, songs=songs)
 
         playlist.removeItems(tracks)
 
@@ -141,10 +128,7 @@ class MusicPlaylist(Library):
                 description="No name supplied?",
             )
         self.playlist_name = text[0]
-        exists = any(
-            x.name == self.playlist_name for x in self.__get_all_playlists()
-        )
-        if exists:
+        if self.exists_playlist():
             description = (
                 f"{self.playlist_name} already exists in Library ({self.name})"
             )
@@ -156,7 +140,7 @@ class MusicPlaylist(Library):
 
         self.add_item()
 
-    def update(self) -> None:
+    def update(self, paths: list[Path] | None = None) -> None:  # noqa: ARG002
         # None of MusicPlaylist operations benefit from a refresh/reload
         # Cannot be NotImplemented!
         return
@@ -199,14 +183,7 @@ class MusicPlaylist(Library):
             or self.user_request is UserRequest.CREATE
         ):
             return
-        dropdown = []
         playlists = self.get_section().playlists()
-        for playlist in playlists:
-            media_count = len(playlist.items())
-            display_name = f"{playlist.title} ({media_count!s} items)"
-            dropdown.append(
-                DropdownItemDTO(display_name=display_name, value=playlist)
-            )
 
         selected_playlist = Prompt.confirm_playlist(
             playlists=playlists,
@@ -276,17 +253,28 @@ class MusicPlaylist(Library):
 
     def download(self) -> None:
         # Remove existing playlist.db file
-        self.bootstrap_paths_dto.plexutil_playlists_db_dir.unlink(
-            missing_ok=True
-        )
+        delete_db(self.bootstrap_paths_dto.plexutil_playlists_db_dir)
 
-        music_playlist_dtos = self.__get_all_playlists()
+        music_playlist_dtos, failed = self.__get_all_playlists()
 
         service = SongMusicPlaylistCompositeService(
             self.bootstrap_paths_dto.plexutil_playlists_db_dir
         )
         service.add_many(music_playlist_dtos)
 
+        description = (
+            f"{Icons.SUCCESS} Downloaded {len(music_playlist_dtos)!s} "
+            f"playlists from {self.name}"
+        )
+        PlexUtilLogger.get_console_logger().info(description)
+        if failed:
+            description = (
+                f"{Icons.WARNING} {len(failed)!s} playlists could not be "
+                f"downloaded (see log for reasons):\n"
+                + "".join(f"-> {x}\n" for x in failed)
+            )
+            PlexUtilLogger.get_console_logger().warning(description)
+
     def upload(self) -> None:
         composite_service = SongMusicPlaylistCompositeService(
             self.bootstrap_paths_dto.plexutil_playlists_db_dir
@@ -299,34 +287,24 @@ class MusicPlaylist(Library):
         )
 
         section = self.get_section()
-        server_tracks = self.query()
+        # Indexed once, kept current as playlists are created
+        plex_playlists = {x.title: x for x in section.playlists()}
+        track_index = self.__get_track_index(self.iter_query())
         for dto in music_playlist_dtos:
             self.playlist_name = dto.name
 
-            if self.exists_playlist():
+            if self.playlist_name in plex_playlists:
                 info = (
                     f"{Icons.WARNING} {self.playlist_name} already exists "
                     f"| Skipping..."
                 )
                 PlexUtilLogger.get_logger().warning(info)
             else:
-                db_songs = dto.songs
-                tracks = []
-                for db_song in db_songs:
-                    try:
-                        tracks.append(
-                            PlexOps.get_track(
-                                song_dto=db_song, tracks=server_tracks
-                            )
-                        )
-                    except PlexMediaMissingError:
-                        description = (
-                            f"{Icons.WARNING} Song not found: {db_song!s} "
-                            "| Skipping..."
-                        )
-                        PlexUtilLogger.get_logger().warning(description)
-
-                section.createPlaylist(
+                tracks = self.__get_tracks(
+                    track_index=track_index, songs=dto.songs
+                )
+
+                plex_playlists[self.playlist_name] = section.createPlaylist(
                     title=self.playlist_name,
                     items=tracks,
                 )
@@ -334,25 +312,157 @@ class MusicPlaylist(Library):
                 description = f"Created Playlist: {self.playlist_name}"
                 PlexUtilLogger.get_logger().info(description)
 
-    def __get_all_playlists(self) -> list[MusicPlaylistDTO]:
+    def converge(
+        self, music_playlist_dtos: list[MusicPlaylistDTO]
+    ) -> list[str]:
         """
-        Gets ALL Playlists in a Library as a list of MusicPlaylistDTO
+        Brings the Playlists of this Library in line with the supplied ones,
+        creating the missing Playlists and adding/removing songs
+        Does not prompt, Playlists not supplied are left untouched
+
+        Args:
+            music_playlist_dtos (list[MusicPlaylistDTO]): The Playlists
+            as they should be
 
         Returns:
-            list[MusicPlaylistDTO]: All the playlists in the current Library
+            list[str]: Description of every operation performed
         """
+        operations = []
         section = self.get_section()
-        plex_playlists = section.playlists()
+        plex_playlists = {x.title: x for x in section.playlists()}
+        # Indexed on first use, no Playlist might need it
+        track_index = None
 
-        playlists = []
-        for plex_playlist in plex_playlists:
-            music_playlist_dto = MusicPlaylistDTO(name=plex_playlist.title)
+        for dto in music_playlist_dtos:
+            self.playlist_name = dto.name
+            plex_playlist = plex_playlists.get(dto.name)
+
+            if plex_playlist is None:
+                track_index = track_index or self.__get_track_index(
+                    self.iter_query()
+                )
+                tracks = self.__get_tracks(
+                    track_index=track_index, songs=dto.songs
+                )
+                if not tracks:
+                    description = (
+                        f"{Icons.WARNING} No songs found for {dto.name} "
+                        f"| Skipping..."
+                    )
+                    PlexUtilLogger.get_logger().warning(description)
+                    continue
+                plex_playlists[dto.name] = section.createPlaylist(
+                    title=dto.name, items=tracks
+                )
+                operations.append(
+                    f"Created playlist: {dto.name} ({len(tracks)!s} songs)"
+                )
+                continue
+
+            playlist_index = self.__get_track_index(plex_playlist.items())
+            current = set(playlist_index.get_songs())
+            desired = set(dto.songs)
 
-            for track in plex_playlist.items():
-                song_dto = PlexOps.get_song_dto(track)
-                music_playlist_dto.songs.append(song_dto)
+            to_add = [x for x in dto.songs if x not in current]
+            if to_add:
+                track_index = track_index or self.__get_track_index(
+                    self.iter_query()
+                )
+                tracks = self.__get_tracks(
+                    track_index=track_index, songs=to_add
+                )
+                if tracks:
+                    plex_playlist.addItems(tracks)
+                    operations.append(
+                        f"Added to playlist: {dto.name} "
+                        f"({len(tracks)!s} songs)"
+                    )
+
+            to_remove = [x for x in current if x not in desired]
+            if to_remove:
+                tracks, _ = playlist_index.get_tracks(to_remove)
+                plex_playlist.removeItems(tracks)
+                operations.append(
+                    f"Removed from playlist: {dto.name} "
+                    f"({len(tracks)!s} songs)"
+                )
 
-            playlists.append(music_playlist_dto)
+        return operations
+
+    def __get_track_index(self, tracks: Iterable[Track]) -> TrackIndex:
+        """
+        Indexes Tracks by (artist, title)
+        Logs a warning for every Track with an unexpected naming pattern
+
+        Args:
+            tracks (Iterable[Track]): The Tracks to index
+
+        Returns:
+            TrackIndex: The index of the supplied Tracks
+        """
+        track_index = TrackIndex(tracks)
+        for track in track_index.unexpected_naming_tracks:
+            description = (
+                f"{Icons.WARNING} Track with unexpected naming pattern: "
+                f"{track.title} | Skipping..."
+            )
+            PlexUtilLogger.get_logger().warning(description)
+        return track_index
+
+    def __get_tracks(
+        self, track_index: TrackIndex, songs: list[SongDTO]
+    ) -> list[Track]:
+        """
+        Matches Songs to the Tracks in the index
+        Logs a warning for every Song not found
+
+        Args:
+            track_index (TrackIndex): Where to look for the Songs
+            songs (list[SongDTO]): The Songs to find
+
+        Returns:
+            list[Track]: The found Tracks
+        """
+        tracks, missing = track_index.get_tracks(songs)
+        for song in missing:
+            description = (
+                f"{Icons.WARNING} Song not found: {song!s} | Skipping..."
+            )
+            PlexUtilLogger.get_logger().warning(description)
+        return tracks
+
+    def __get_all_playlists(
+        self,
+    ) -> tuple[list[MusicPlaylistDTO], list[str]]:
+        """
+        Gets ALL Playlists in a Library as a list of MusicPlaylistDTO,
+        fetching up to self.max_workers Playlists concurrently
+
+        Returns:
+            tuple[list[MusicPlaylistDTO], list[str]]: The playlists
+            in the current Library, the titles of those that failed
+        """
+        section = self.get_section()
+        plex_playlists = section.playlists()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.__get_playlist, plex_playlist)
+                for plex_playlist in plex_playlists
+            ]
+
+        playlists = []
+        failed = []
+        for plex_playlist, future in zip(plex_playlists, futures, strict=True):
+            try:
+                playlists.append(future.result())
+            except Exception as e:  # noqa: BLE001
+                description = (
+                    f"{Icons.WARNING} Could not download playlist: "
+                    f"{plex_playlist.title} | Reason: {e!s} | Skipping..."
+                )
+                PlexUtilLogger.get_logger().warning(description)
+                failed.append(plex_playlist.title)
 
         description = f"All Playlists found in {self.name}:\n"
         for playlist in playlists:
@@ -361,4 +471,22 @@ class MusicPlaylist(Library):
                 + f"->{playlist.name} ({len(playlist.songs)} tracks)\n"
             )
         PlexUtilLogger.get_logger().debug(description)
-        return playlists
+        return playlists, failed
+
+    def __get_playlist(self, plex_playlist: Playlist) -> MusicPlaylistDTO:
+        """
+        Maps a Plex Playlist and its items to a MusicPlaylistDTO
+
+        Args:
+            plex_playlist (Playlist): The Playlist to map
+
+        Returns:
+            MusicPlaylistDTO: The Playlist with all of its songs
+        """
+        music_playlist_dto = MusicPlaylistDTO(name=plex_playlist.title)
+
+        for track in plex_playlist.items():
+            song_dto = PlexOps.get_song_dto(track)
+            music_playlist_dto.songs.append(song_dto)
+
+        return music_playlist_dto
@@ -4,30 +4,26 @@ import argparse
 import os
 import platform
 import sys
+import threading
+import time
 from argparse import RawTextHelpFormatter
-from importlib.metadata import PackageNotFoundError, version
-from typing import TYPE_CHECKING, cast
-
-from plexapi.exceptions import NotFound
-from yaspin import yaspin
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, cast
 
 from plexutil.exception.device_error import DeviceError
 from plexutil.exception.server_connection_error import ServerConnectionError
-from plexutil.graphical.selection_window import SelectionWindow
 
 if TYPE_CHECKING:
     from plexapi.audio import Audio, Playlist
     from plexapi.library import (
         LibrarySection,
-        MovieSection,
-        MusicSection,
-        ShowSection,
     )
-    from plexapi.myplex import MyPlexAccount
+    from plexapi.myplex import MyPlexAccount, MyPlexResource
     from plexapi.server import PlexServer
     from plexapi.video import Movie, Show
 
     from plexutil.core.library import Library
+    from plexutil.dto.server_profile_dto import ServerProfileDTO
     from plexutil.dto.song_dto import SongDTO
 
 from plexutil.dto.dropdown_item_dto import DropdownItemDTO
@@ -35,18 +31,36 @@ from plexutil.dto.library_setting_dto import LibrarySettingDTO
 from plexutil.enums.agent import Agent
 from plexutil.enums.language import Language
 from plexutil.enums.library_type import LibraryType
+from plexutil.enums.refresh_mode import RefreshMode
 from plexutil.enums.scanner import Scanner
 from plexutil.enums.user_request import UserRequest
 from plexutil.exception.unexpected_argument_error import (
     UnexpectedArgumentError,
 )
+from plexutil.exception.user_error import UserError
 from plexutil.plex_util_logger import PlexUtilLogger
 from plexutil.static import Static
+from plexutil.util.answer_provider import AnswerProvider
+from plexutil.util.dir_watcher import DirWatcher
 from plexutil.util.file_importer import FileImporter
 from plexutil.util.icons import Icons
 
 
 class Prompt(Static):
+    # Section counts are reused across pickers within this window
+    SECTION_COUNT_TTL_SECONDS = 60
+    SECTION_COUNT_MAX_WORKERS = 8
+    # (Section uuid, media type) -> (count, counted at)
+    section_counts: ClassVar[dict[tuple[str, str], tuple[int, float]]] = {}
+    # (Section uuid, media type) being counted in the background
+    section_counts_pending: ClassVar[set[tuple[str, str]]] = set()
+    section_counts_lock = threading.Lock()
+    section_count_slots = threading.BoundedSemaphore(SECTION_COUNT_MAX_WORKERS)
+    # Max time to reach a saved server before falling back to discovery
+    SERVER_PROFILE_TIMEOUT_SECONDS = 5
+    # Consulted before asking the user, see AnswerProvider
+    answer_provider = AnswerProvider()
+
     @staticmethod
     def confirm_user_request() -> UserRequest:
         """
@@ -56,6 +70,124 @@ class Prompt(Static):
         Returns:
             UserRequest: Based on user's input
         """
+        args = Prompt.__get_args()
+        replay_path, replay_session = (
+            AnswerProvider.parse_replay(args.replay)
+            if args.replay
+            else (None, None)
+        )
+        Prompt.answer_provider = AnswerProvider(
+            answers_path=args.answers,
+            replay_path=replay_path,
+            replay_session=replay_session,
+        )
+
+        request = args.request
+        is_version = args.version
+
+        if is_version:
+            from importlib.metadata import (  # noqa: PLC0415
+                PackageNotFoundError,
+                version,
+            )
+
+            plexutil_version = ""
+
+            try:
+                plexutil_version = version("plexutil")
+
+            except PackageNotFoundError:
+                pyproject = FileImporter.get_pyproject()
+                plexutil_version = pyproject["project"]["version"]
+
+            debug = "Received a User Request: version"
+            PlexUtilLogger.get_logger().debug(debug)
+            PlexUtilLogger.get_logger().info(plexutil_version)
+            sys.exit(0)
+
+        debug = f"Received a User Request: {request or None}"
+        PlexUtilLogger.get_logger().debug(debug)
+
+        return UserRequest.get_user_request_from_str(request)
+
+    @staticmethod
+    def confirm_watch_timings() -> tuple[float, float, float]:
+        """
+        Receives the timings of the watch request
+
+        Returns:
+            tuple[float, float, float]: Poll interval, debounce
+            and max delay in seconds
+
+        Raises:
+            UserError: If a timing is not positive
+        """
+        args = Prompt.__get_args()
+        timings = (args.poll_interval, args.debounce, args.max_delay)
+        if any(x <= 0 for x in timings):
+            description = (
+                "--poll-interval, --debounce and --max-delay "
+                "must be greater than 0"
+            )
+            raise UserError(description)
+
+        debug = f"Received watch timings: {timings!s}"
+        PlexUtilLogger.get_logger().debug(debug)
+        return timings
+
+    @staticmethod
+    def confirm_max_workers() -> int | None:
+        """
+        Receives the concurrency limit supplied with --workers
+
+        Returns:
+            int | None: The limit, None if not supplied
+
+        Raises:
+            UserError: If the limit is not positive
+        """
+        max_workers = Prompt.__get_args().workers
+        if max_workers is not None and max_workers < 1:
+            description = "--workers must be greater than 0"
+            raise UserError(description)
+        return max_workers
+
+    @staticmethod
+    def confirm_spec_path() -> Path:
+        """
+        Receives the spec file supplied after the request
+
+        Returns:
+            Path: Location of the spec file
+
+        Raises:
+            UserError: If no spec supplied or the file does not exist
+        """
+        spec = Prompt.__get_args().spec
+        if not spec:
+            description = "A spec file is required: plexutil apply spec.yaml"
+            raise UserError(description)
+
+        spec_path = Path(spec)
+        if not spec_path.is_file():
+            description = f"Spec file not found: {spec_path!s}"
+            raise UserError(description)
+
+        debug = f"Received a spec: {spec_path!s}"
+        PlexUtilLogger.get_logger().debug(debug)
+        return spec_path
+
+    @staticmethod
+    def __get_args() -> argparse.Namespace:
+        """
+        Parses the command line
+
+        Returns:
+            argparse.Namespace: The parsed arguments
+
+        Raises:
+            UnexpectedArgumentError: If any argument is unrecognized
+        """
         parser = argparse.ArgumentParser(
             description="Plexutil", formatter_class=RawTextHelpFormatter
         )
@@ -73,6 +205,75 @@ class Prompt(Static):
             help=request_help_str,
         )
 
+        parser.add_argument(
+            "spec",
+            metavar="Spec",
+            type=str,
+            nargs="?",
+            help=("YAML/TOML spec file, used by: apply"),
+        )
+
+        parser.add_argument(
+            "--answers",
+            metavar="File",
+            type=Path,
+            help=("YAML file answering prompts by title"),
+        )
+
+        parser.add_argument(
+            "--replay",
+            metavar="Log[:Session]",
+            type=str,
+            help=(
+                "Log of a previous session to answer prompts from, "
+                "the last session in the log unless one is given"
+            ),
+        )
+
+        parser.add_argument(
+            "--poll-interval",
+            metavar="Seconds",
+            type=float,
+            default=DirWatcher.POLL_INTERVAL_SECONDS,
+            help=("Time between two checks of the watched directories"),
+        )
+
+        parser.add_argument(
+            "--debounce",
+            metavar="Seconds",
+            type=float,
+            default=DirWatcher.DEBOUNCE_SECONDS,
+            help=("Quiet time before a changed directory is scanned"),
+        )
+
+        parser.add_argument(
+            "--max-delay",
+            metavar="Seconds",
+            type=float,
+            default=DirWatcher.MAX_DELAY_SECONDS,
+            help=("Max time a directory that keeps changing is held back"),
+        )
+
+        parser.add_argument(
+            "--workers",
+            metavar="Count",
+            type=int,
+            help=("Max playlists downloaded concurrently, used by: download"),
+        )
+
+        parser.add_argument(
+            "--server",
+            metavar="Name",
+            type=str,
+            help=("Saved server to connect to, skips plex.tv discovery"),
+        )
+
+        parser.add_argument(
+            "--discover",
+            action="store_true",
+            help=("Chooses the server from plex.tv, ignores saved servers"),
+        )
+
         parser.add_argument(
             "-v",
             "--version",
@@ -85,28 +286,7 @@ class Prompt(Static):
         if unknown:
             raise UnexpectedArgumentError(unknown)
 
-        request = args.request
-        is_version = args.version
-
-        if is_version:
-            plexutil_version = ""
-
-            try:
-                plexutil_version = version("plexutil")
-
-            except PackageNotFoundError:
-                pyproject = FileImporter.get_pyproject()
-                plexutil_version = pyproject["project"]["version"]
-
-            debug = "Received a User Request: version"
-            PlexUtilLogger.get_logger().debug(debug)
-            PlexUtilLogger.get_logger().info(plexutil_version)
-            sys.exit(0)
-
-        debug = f"Received a User Request: {request or None}"
-        PlexUtilLogger.get_logger().debug(debug)
-
-        return UserRequest.get_user_request_from_str(request)
+        return args
 
     @staticmethod
     def confirm_library_setting(
@@ -281,6 +461,34 @@ class Prompt(Static):
         )
         return user_response.value
 
+    @staticmethod
+    def confirm_refresh_mode() -> RefreshMode:
+        """
+        Prompts user for how the media of a Library should be refreshed
+
+        Returns:
+            RefreshMode: The chosen RefreshMode
+        """
+        description = ""
+        for refresh_mode in RefreshMode.get_all():
+            description = (
+                f"{description}{refresh_mode.get_display_name()} -> "
+                f"{refresh_mode.get_description()}\n"
+            )
+        dropdown = [
+            DropdownItemDTO(
+                display_name=refresh_mode.get_display_name(),
+                value=refresh_mode,
+                is_default=refresh_mode is RefreshMode.get_default(),
+            )
+            for refresh_mode in RefreshMode.get_all()
+        ]
+        return Prompt.draw_dropdown(
+            title="Refresh Mode",
+            description=description,
+            dropdown=dropdown,
+        ).value
+
     @staticmethod
     def confirm_library(
         user_request: UserRequest,
@@ -330,26 +538,22 @@ class Prompt(Static):
         expect_input: bool,
         sections: list[LibrarySection],
     ) -> LibrarySection:
+        counts = Prompt.get_section_counts(
+            sections=sections, library_type=library_type
+        )
         dropdown = []
         for section in sections:
+            count = counts.get(section.uuid)
+            media_count = "?" if count is None else str(count)
             if library_type is LibraryType.MOVIE:
-                media_count = len(
-                    cast("list[MovieSection]", section.searchMovies())
-                )
-                display_name = f"{section.title} ({media_count!s} Movies)"
+                display_name = f"{section.title} ({media_count} Movies)"
             elif library_type is LibraryType.TV:
-                media_count = len(
-                    cast("list[ShowSection]", section.searchShows())
-                )
-                display_name = f"{section.title} ({media_count!s} Shows)"
+                display_name = f"{section.title} ({media_count} Shows)"
             elif (
                 library_type is LibraryType.MUSIC
                 or library_type is LibraryType.MUSIC_PLAYLIST
             ):
-                media_count = len(
-                    cast("list[MusicSection]", section.searchTracks())
-                )
-                display_name = f"{section.title} ({media_count!s} Tracks)"
+                display_name = f"{section.title} ({media_count} Tracks)"
 
             dropdown.append(
                 DropdownItemDTO(display_name=display_name, value=section)
@@ -364,6 +568,82 @@ class Prompt(Static):
             expect_input=expect_input,
         ).value
 
+    @staticmethod
+    def get_section_counts(
+        sections: list[LibrarySection], library_type: LibraryType
+    ) -> dict[str, int | None]:
+        """
+        Counts the media of every Section from a short-lived cache,
+        never waits on the server: the Sections missing from the cache
+        are counted in the background, one count-only request per
+        Section, and show up the next time the Sections are displayed
+        Counting runs on daemon threads, a slow Section never delays
+        the exit
+
+        Args:
+            sections (list[LibrarySection]): The Sections to count
+            library_type (LibraryType): Determines the media to count
+
+        Returns:
+            dict[str, int | None]: Counts keyed by Section uuid,
+            None for the counts not available yet
+        """
+        libtype = library_type.get_media_type()
+        now = time.monotonic()
+        counts: dict[str, int | None] = {}
+        to_count = []
+
+        with Prompt.section_counts_lock:
+            for section in sections:
+                key = (section.uuid, libtype)
+                cached = Prompt.section_counts.get(key)
+                if (
+                    cached is not None
+                    and now - cached[1] < Prompt.SECTION_COUNT_TTL_SECONDS
+                ):
+                    counts[section.uuid] = cached[0]
+                    continue
+                counts[section.uuid] = None
+                if key not in Prompt.section_counts_pending:
+                    Prompt.section_counts_pending.add(key)
+                    to_count.append(section)
+
+        if not to_count:
+            return counts
+
+        # PlexOps depends on Prompt, loaded once both are defined
+        from plexutil.util.plex_ops import PlexOps  # noqa: PLC0415
+
+        def count(section: LibrarySection) -> None:
+            key = (section.uuid, libtype)
+            try:
+                with Prompt.section_count_slots:
+                    media_count = PlexOps.get_count(
+                        section=section, libtype=libtype
+                    )
+            except Exception as e:  # noqa: BLE001
+                description = f"Could not count {section.title}: {e!s}"
+                PlexUtilLogger.get_logger().debug(description)
+            else:
+                with Prompt.section_counts_lock:
+                    Prompt.section_counts[key] = (
+                        media_count,
+                        time.monotonic(),
+                    )
+            finally:
+                with Prompt.section_counts_lock:
+                    Prompt.section_counts_pending.discard(key)
+
+        for section in to_count:
+            threading.Thread(
+                target=count,
+                args=(section,),
+                name=f"count-{section.title}",
+                daemon=True,
+            ).start()
+
+        return counts
+
     @staticmethod
     def confirm_playlist(
         library_type: LibraryType,
@@ -373,7 +653,8 @@ class Prompt(Static):
         dropdown = []
 
         for playlist in playlists:
-            media_count = len(playlist.items())
+            # leafCount is returned with the listing, no need for items()
+            media_count = playlist.leafCount or 0
             display_name = f"{playlist.title} ({media_count!s} items)"
             dropdown.append(
                 DropdownItemDTO(display_name=display_name, value=playlist)
@@ -426,6 +707,132 @@ class Prompt(Static):
             dropdown=dropdown,
         ).value
 
+        return Prompt.connect_server(plex_resource=plex_resource)
+
+    @staticmethod
+    def confirm_server_profile(
+        server_profiles: list[ServerProfileDTO],
+    ) -> ServerProfileDTO | None:
+        """
+        Picks the saved server to connect to directly, by --server,
+        as the only one saved, or by prompting the user
+
+        Args:
+            server_profiles (list[ServerProfileDTO]): Saved servers,
+            most recently used first
+
+        Returns:
+            ServerProfileDTO | None: The chosen server,
+            None to discover the servers from plex.tv
+        """
+        args = Prompt.__get_args()
+        if args.discover or not server_profiles:
+            return None
+
+        if args.server:
+            server = args.server.lower()
+            for server_profile in server_profiles:
+                if server in (
+                    server_profile.name.lower(),
+                    server_profile.machine_identifier.lower(),
+                ):
+                    return server_profile
+            description = f"No saved server named: {args.server}"
+            PlexUtilLogger.get_logger().debug(description)
+            return None
+
+        if len(server_profiles) == 1:
+            return server_profiles[0]
+
+        dropdown = [
+            DropdownItemDTO(
+                display_name=x.name, value=x, is_default=index == 0
+            )
+            for index, x in enumerate(server_profiles)
+        ]
+        dropdown.append(
+            DropdownItemDTO(display_name="Discover servers", value=None)
+        )
+        return Prompt.draw_dropdown(
+            title="Saved Servers",
+            description="Choose a server to connect to",
+            dropdown=dropdown,
+        ).value
+
+    @staticmethod
+    def connect_server_profile(server_profile: ServerProfileDTO) -> PlexServer:
+        """
+        Connects to a saved server directly, a single request
+        to the server and none to plex.tv
+
+        Args:
+            server_profile (ServerProfileDTO): The server to connect to
+
+        Returns:
+            PlexServer: The connected Plex Media Server
+        Raises:
+            ServerConnectionError: If unable to connect, or the server
+            at the saved address is not the saved server
+        """
+        from plexapi import TIMEOUT  # noqa: PLC0415
+        from plexapi.server import PlexServer  # noqa: PLC0415
+        from yaspin import yaspin  # noqa: PLC0415
+
+        with yaspin(text="Connecting", color="yellow") as spinner:
+            try:
+                # Fail fast on a stale address, discovery is the fallback
+                plex_server = PlexServer(
+                    baseurl=server_profile.base_url,
+                    token=server_profile.token,
+                    timeout=Prompt.SERVER_PROFILE_TIMEOUT_SECONDS,
+                )
+            except Exception as e:
+                spinner.text = ""
+                spinner.fail(f"{Icons.FAILURE} Connection Failure")
+                description = (
+                    f"Failed to connect to: {server_profile.name} "
+                    f"({server_profile.base_url})\n"
+                    f"Reason: {type(e).__name__}"
+                )
+                raise ServerConnectionError(description) from e
+
+            if (
+                plex_server.machineIdentifier
+                != server_profile.machine_identifier
+            ):
+                spinner.text = ""
+                spinner.fail(f"{Icons.FAILURE} Connection Failure")
+                description = (
+                    f"{server_profile.base_url} is no longer "
+                    f"{server_profile.name}"
+                )
+                raise ServerConnectionError(description)
+
+            spinner.text = ""
+            spinner.ok(f"{Icons.SUCCESS} Connected")
+
+        # The short timeout only applies to reaching the server
+        plex_server._timeout = TIMEOUT
+        description = f"Connected directly to: {plex_server}"
+        PlexUtilLogger.get_logger().debug(description)
+        return plex_server
+
+    @staticmethod
+    def connect_server(plex_resource: MyPlexResource) -> PlexServer:
+        """
+        Connects to a Plex Media Server
+
+        Args:
+            plex_resource (MyPlexResource): The server to connect to
+
+        Returns:
+            PlexServer: The connected Plex Media Server
+        Raises:
+            ServerConnectionError: If unable to connect
+        """
+        from plexapi.exceptions import NotFound  # noqa: PLC0415
+        from yaspin import yaspin  # noqa: PLC0415
+
         with yaspin(text="Connecting", color="yellow") as spinner:
             try:
                 plex_server = plex_resource.connect()
@@ -671,7 +1078,7 @@ class Prompt(Static):
         else:
             description = f"\nAnswer (y/{Icons.STAR}n) {Icons.CHEVRON_RIGHT}"
 
-        response = input(description).strip().lower()
+        response = Prompt.__get_input(title, description).strip().lower()
 
         description = f"{question}? User chose: {response}"
         PlexUtilLogger.get_logger().debug(description)
@@ -696,6 +1103,34 @@ class Prompt(Static):
             PlexUtilLogger.get_logger().warning(description)
             return default_selection
 
+    @staticmethod
+    def __get_input(title: str, description: str) -> str:
+        """
+        Gets the answer to a prompt from the answer provider,
+        falling back to the user
+        Every answer is recorded so the session can be replayed
+
+        Args:
+            title (str): The prompt title, identifies the prompt
+            description (str): Shown before the answer
+
+        Returns:
+            str: The answer, empty when no one is there to answer
+        """
+        response = Prompt.answer_provider.get_answer(title)
+        if response is None:
+            try:
+                response = input(description)
+            except EOFError:
+                # Unattended with nothing left to answer, defaults apply
+                response = ""
+        else:
+            PlexUtilLogger.get_console_logger().info(
+                f"{description}{response}"
+            )
+        AnswerProvider.record(title=title, answer=response.strip())
+        return response
+
     @staticmethod
     def __get_text_response(
         title: str,
@@ -727,7 +1162,7 @@ class Prompt(Static):
             )
         else:
             description = f"\nEnter text {Icons.CHEVRON_RIGHT}"
-        response = input(description).strip()
+        response = Prompt.__get_input(title, description).strip()
 
         description = f"{question}? User chose: {response}"
         PlexUtilLogger.get_logger().debug(description)
@@ -763,7 +1198,7 @@ class Prompt(Static):
         default_item = next(x for x in dropdown if x.is_default)
 
         description = f"Pick (1-{dropdown_length!s}) {Icons.CHEVRON_RIGHT} "
-        response = input(description).strip()
+        response = Prompt.__get_input(title, description).strip()
 
         if response.isdigit():
             int_response = int(response)
@@ -773,6 +1208,13 @@ class Prompt(Static):
                 PlexUtilLogger.get_logger().debug(description)
                 return response
 
+        # Scripted answers may name the item instead of its number
+        for item in dropdown:
+            if response and response.lower() == item.display_name.lower():
+                description = f"{title} | User chose: {item.display_name}"
+                PlexUtilLogger.get_logger().debug(description)
+                return item
+
         if is_from_server:
             description = (
                 f"{Icons.WARNING} Did not understand your input: "
@@ -799,6 +1241,11 @@ class Prompt(Static):
             DropdownItemDTO(display_name=str(song), value=song)
             for song in songs
         ]
+        # tkinter/ttkthemes are only needed by the graphical prompts
+        from plexutil.graphical.selection_window import (  # noqa: PLC0415
+            SelectionWindow,
+        )
+
         window = SelectionWindow(
             items=items,
             items_label="Songs",
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from plexapi.exceptions import NotFound
+
+from plexutil.core.movie_library import MovieLibrary
+from plexutil.core.music_library import MusicLibrary
+from plexutil.core.music_playlist import MusicPlaylist
+from plexutil.core.prompt import Prompt
+from plexutil.core.tv_library import TVLibrary
+from plexutil.enums.library_type import LibraryType
+from plexutil.enums.user_request import UserRequest
+from plexutil.exception.server_connection_error import ServerConnectionError
+from plexutil.plex_util_logger import PlexUtilLogger
+from plexutil.util.icons import Icons
+from plexutil.util.plex_ops import PlexOps
+
+if TYPE_CHECKING:
+    from plexapi.myplex import MyPlexAccount
+    from plexapi.server import PlexServer
+
+    from plexutil.core.library import Library
+    from plexutil.dto.bootstrap_paths_dto import BootstrapPathsDTO
+    from plexutil.dto.library_spec_dto import LibrarySpecDTO
+    from plexutil.dto.server_spec_dto import ServerSpecDTO
+
+
+class SpecApplier:
+    def __init__(
+        self,
+        plex_account: MyPlexAccount,
+        bootstrap_paths_dto: BootstrapPathsDTO,
+    ) -> None:
+        """
+        Converges servers to the state declared in a spec, without prompts
+        Only what differs from the servers is changed, applying the same
+        spec twice performs no operation the second time
+
+        Args:
+            plex_account (MyPlexAccount): Used to reach the servers
+            bootstrap_paths_dto (BootstrapPathsDTO): Used by Libraries
+        """
+        self.plex_account = plex_account
+        self.bootstrap_paths_dto = bootstrap_paths_dto
+
+    def apply(self, server_specs: list[ServerSpecDTO]) -> list[str]:
+        """
+        Converges every server in the spec, in order
+
+        Args:
+            server_specs (list[ServerSpecDTO]): The servers as they should be
+
+        Returns:
+            list[str]: Description of every operation performed
+        """
+        operations = []
+        for server_spec in server_specs:
+            operations.extend(self.apply_server(server_spec))
+
+        if operations:
+            description = f"{Icons.SUCCESS} Performed {len(operations)!s} ops"
+        else:
+            description = f"{Icons.SUCCESS} Up-to-date, nothing to apply"
+        PlexUtilLogger.get_console_logger().info(description)
+        return operations
+
+    def apply_server(self, server_spec: ServerSpecDTO) -> list[str]:
+        """
+        Converges the settings, Libraries and Playlists of a server
+
+        Args:
+            server_spec (ServerSpecDTO): The server as it should be
+
+        Returns:
+            list[str]: Description of every operation performed
+
+        Raises:
+            ServerConnectionError: If the server is not found or unreachable
+        """
+        try:
+            plex_resource = self.plex_account.resource(server_spec.name)
+        except NotFound as e:
+            description = f"Server not found: {server_spec.name}"
+            raise ServerConnectionError(description) from e
+        plex_server = Prompt.connect_server(plex_resource=plex_resource)
+
+        operations = []
+
+        if server_spec.settings:
+            applied = PlexOps.apply_server_settings(
+                plex_server=plex_server,
+                desired=server_spec.settings,
+                is_plan_logged=False,
+            )
+            operations.extend(
+                f"Set server setting: {name} -> {value!s}"
+                for name, value in applied.items()
+            )
+
+        for library_spec in server_spec.libraries:
+            library = self.__get_library(
+                plex_server=plex_server, library_spec=library_spec
+            )
+            operations.extend(library.converge(prefs=library_spec.settings))
+
+        for library_name, playlists in server_spec.playlists.items():
+            music_playlist = MusicPlaylist(
+                plex_server=plex_server,
+                user_request=UserRequest.APPLY,
+                bootstrap_paths_dto=self.bootstrap_paths_dto,
+                name=library_name,
+            )
+            operations.extend(music_playlist.converge(playlists))
+
+        for operation in operations:
+            description = f"{server_spec.name} | {operation}"
+            PlexUtilLogger.get_console_logger().info(description)
+
+        return operations
+
+    def __get_library(
+        self, plex_server: PlexServer, library_spec: LibrarySpecDTO
+    ) -> Library:
+        libraries = {
+            LibraryType.MOVIE: MovieLibrary,
+            LibraryType.TV: TVLibrary,
+            LibraryType.MUSIC: MusicLibrary,
+        }
+        return libraries[library_spec.library_type](
+            plex_server=plex_server,
+            user_request=UserRequest.APPLY,
+            bootstrap_paths_dto=self.bootstrap_paths_dto,
+            locations=library_spec.locations,
+            agent=library_spec.agent,
+            scanner=library_spec.scanner,
+            name=library_spec.name,
+            language=library_spec.language,
+        )
@@ -39,6 +39,7 @@ class TVLibrary(Library):
             supported_requests=[
                 UserRequest.CREATE,
                 UserRequest.UPDATE,
+                UserRequest.WATCH,
                 UserRequest.DELETE,
                 UserRequest.DISPLAY,
                 UserRequest.MODIFY,
@@ -66,8 +67,8 @@ class TVLibrary(Library):
     def remove_item(self) -> None:
         raise NotImplementedError
 
-    def update(self) -> None:
-        super().update()
+    def update(self, paths: list[Path] | None = None) -> None:
+        super().update(paths=paths)
 
     def modify(self, is_modify_media: bool = False) -> None:
         is_modify_media = Prompt.confirm_media_modification()
@@ -83,7 +84,7 @@ class TVLibrary(Library):
             DropdownItemDTO(
                 display_name=series.title, value=series, is_default=False
             )
-            for series in self.query()
+            for series in self.iter_query()
         ]
 
         return Prompt.draw_dropdown(
@@ -97,7 +98,7 @@ class TVLibrary(Library):
         super().create()
 
     def modify_show_language(self) -> None:
-        shows = self.query()
+        shows = cast("list[Show]", list(self.iter_query()))
 
         show = cast(
             "Show",
@@ -7,7 +7,10 @@ from pathlib import Path
 class BootstrapPathsDTO:
     auth_dir: Path
     log_dir: Path
+    cache_dir: Path
     public_key_dir: Path
     private_key_dir: Path
     token_dir: Path
+    server_profiles_dir: Path
+    account_cache_dir: Path
     plexutil_playlists_db_dir: Path
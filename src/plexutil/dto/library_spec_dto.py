@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from plexutil.enums.agent import Agent
+    from plexutil.enums.language import Language
+    from plexutil.enums.library_type import LibraryType
+    from plexutil.enums.scanner import Scanner
+
+
+# Frozen=True creates an implicit hash method, eq is created by default
+@dataclass(frozen=True)
+class LibrarySpecDTO:
+    name: str
+    library_type: LibraryType
+    agent: Agent
+    scanner: Scanner
+    language: Language
+    locations: list[Path] = field(default_factory=list)
+    # Library Setting values keyed by setting id
+    settings: dict[str, bool | int | str] = field(default_factory=dict)
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+# Frozen=True creates an implicit hash method, eq is created by default
+@dataclass(frozen=True)
+class ServerProfileDTO:
+    name: str
+    machine_identifier: str
+    base_url: str
+    token: str
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from plexutil.dto.library_spec_dto import LibrarySpecDTO
+    from plexutil.dto.music_playlist_dto import MusicPlaylistDTO
+
+
+# Frozen=True creates an implicit hash method, eq is created by default
+@dataclass(frozen=True)
+class ServerSpecDTO:
+    name: str
+    # Server Setting values keyed by setting id
+    settings: dict[str, bool | int | str] = field(default_factory=dict)
+    libraries: list[LibrarySpecDTO] = field(default_factory=list)
+    # Playlists keyed by the name of their Music Library
+    playlists: dict[str, list[MusicPlaylistDTO]] = field(default_factory=dict)
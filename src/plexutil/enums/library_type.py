@@ -1,22 +1,19 @@
 from __future__ import annotations
 
 from enum import Enum
-
-from plexapi.library import (
-    LibrarySection,
-    MovieSection,
-    MusicSection,
-    ShowSection,
-)
+from typing import TYPE_CHECKING
 
 from plexutil.exception.user_error import UserError
 
+if TYPE_CHECKING:
+    from plexapi.library import LibrarySection
+
 
 class LibraryType(Enum):
-    MOVIE = ("movie", "Movies")
-    TV = ("show", "TV Shows")
-    MUSIC = ("music", "Music")
-    MUSIC_PLAYLIST = ("audio", "Music Playlist")
+    MOVIE = ("movie", "Movies", "movie")
+    TV = ("show", "TV Shows", "show")
+    MUSIC = ("music", "Music", "track")
+    MUSIC_PLAYLIST = ("audio", "Music Playlist", "track")
 
     @staticmethod
     def get_all() -> list[LibraryType]:
@@ -41,6 +38,15 @@ class LibraryType(Enum):
     def get_display_name(self) -> str:
         return self.value[1]
 
+    def get_media_type(self) -> str:
+        """
+        The plexapi libtype of the media items held by this LibraryType
+
+        Returns:
+            str: The libtype i.e. movie, show, track
+        """
+        return self.value[2]
+
     @staticmethod
     def get_default() -> LibraryType:
         return LibraryType.MOVIE
@@ -49,6 +55,13 @@ class LibraryType(Enum):
     def is_eq(
         library_type: LibraryType, library_section: LibrarySection
     ) -> bool:
+        # plexapi is slow to import, loaded once a Section is at hand
+        from plexapi.library import (  # noqa: PLC0415
+            MovieSection,
+            MusicSection,
+            ShowSection,
+        )
+
         return (
             (
                 isinstance(library_section, MovieSection)
@@ -70,6 +83,12 @@ class LibraryType(Enum):
 
     @staticmethod
     def get_from_section(library_section: LibrarySection) -> LibraryType:
+        from plexapi.library import (  # noqa: PLC0415
+            MovieSection,
+            MusicSection,
+            ShowSection,
+        )
+
         match library_section:
             case MovieSection():
                 return LibraryType.MOVIE
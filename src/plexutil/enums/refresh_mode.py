@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class RefreshMode(Enum):
+    SECTION = (
+        "section",
+        "Library",
+        "Refresh the metadata of the whole Library in a single request",
+    )
+    CHANGED = (
+        "changed",
+        "Changed items",
+        "Refresh only the items updated since the last Library update",
+    )
+    ALL = (
+        "all",
+        "All items",
+        "Refresh every item individually, rate limited to spare the server",
+    )
+
+    @staticmethod
+    def get_all() -> list[RefreshMode]:
+        return list(RefreshMode)
+
+    @staticmethod
+    def get_default() -> RefreshMode:
+        return RefreshMode.SECTION
+
+    def get_value(self) -> str:
+        return self.value[0]
+
+    def get_display_name(self) -> str:
+        return self.value[1]
+
+    def get_description(self) -> str:
+        return self.value[2]
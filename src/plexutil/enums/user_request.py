@@ -12,6 +12,8 @@ class UserRequest(Enum):
     UPLOAD = "upload"
     DISPLAY = "display"
     UPDATE = "update"
+    WATCH = "watch"
+    APPLY = "apply"
     CHANGELOG = "changelog"
 
     @staticmethod
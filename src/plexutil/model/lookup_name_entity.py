@@ -0,0 +1,9 @@
+from peewee import Model, TextField
+
+
+class LookupNameEntity(Model):
+    name = TextField(primary_key=True)
+
+    class Meta:
+        table_name = "lookup_name"
+        temporary = True
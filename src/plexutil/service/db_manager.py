@@ -1,21 +1,165 @@
+import atexit
+import sqlite3
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
 
-from peewee import SqliteDatabase
+from peewee import SqliteDatabase, chunked
+
+from plexutil.model.lookup_name_entity import LookupNameEntity
+
+# One long-lived handle per database file, shared by every service
+databases: dict[Path, SqliteDatabase] = {}
+# Tables already created per database file
+created_tables: dict[Path, set[str]] = {}
+
+
+def read_max_variables() -> int:
+    """
+    Max bound parameters per statement of the linked SQLite library,
+    builds set their own SQLITE_MAX_VARIABLE_NUMBER
+
+    Returns:
+        int: The bound-parameter limit
+    """
+    try:
+        connection = sqlite3.connect(":memory:")
+        try:
+            return connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        finally:
+            connection.close()
+    except (AttributeError, sqlite3.Error):
+        # SQLITE_MAX_VARIABLE_NUMBER defaults to 999 before SQLite 3.32.0
+        return 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+
+max_variables = read_max_variables()
+
+pragmas = {
+    "foreign_keys": 1,
+    "journal_mode": "wal",
+    # Safe with WAL, only the last transactions are at risk on power loss
+    "synchronous": 1,
+    # Negative value is in KiB -> 64MB
+    "cache_size": -64 * 1024,
+}
+
+
+def get_db(db_path: Path) -> SqliteDatabase:
+    """
+    Gets the shared handle for a database file, opening it if needed
+
+    Args:
+        db_path (Path): Location of the database file
+
+    Returns:
+        SqliteDatabase: An open handle to the database
+    """
+    key = Path(db_path).resolve()
+    db = databases.get(key)
+    if db is None:
+        db = SqliteDatabase(key, pragmas=pragmas)
+        databases[key] = db
+        created_tables[key] = set()
+    db.connect(reuse_if_open=True)
+    return db
+
+
+def close_db(db_path: Path) -> None:
+    """
+    Closes and forgets the shared handle for a database file
+
+    Args:
+        db_path (Path): Location of the database file
+
+    Returns:
+        None: This method does not return a value
+    """
+    key = Path(db_path).resolve()
+    db = databases.pop(key, None)
+    created_tables.pop(key, None)
+    if db is not None:
+        db.close()
+
+
+def delete_db(db_path: Path) -> None:
+    """
+    Closes the shared handle and removes the database file
+    along with its WAL files
+
+    Args:
+        db_path (Path): Location of the database file
+
+    Returns:
+        None: This method does not return a value
+    """
+    close_db(db_path)
+    db_path = Path(db_path)
+    for suffix in ("", "-wal", "-shm"):
+        db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
+
+
+def get_chunk_size(field_count: int) -> int:
+    """
+    Amount of rows that fit in a single multi-row INSERT without
+    exceeding the SQLite bound-parameter limit
+
+    Args:
+        field_count (int): Amount of fields inserted per row
+
+    Returns:
+        int: Max rows per statement
+    """
+    return max_variables // field_count
+
+
+def load_lookup_names(db: SqliteDatabase, names: list[str]) -> None:
+    """
+    Replaces the contents of the temporary lookup table with names
+    Joining against it avoids IN clauses that exceed the SQLite
+    bound-parameter limit for large sets of names
+
+    Args:
+        db (SqliteDatabase): The database to hold the lookup table
+        names (list[str]): The names to look up
+
+    Returns:
+        None: This method does not return a value
+    """
+    db.bind([LookupNameEntity])
+    # Temporary tables live per connection, create on demand
+    LookupNameEntity.create_table(safe=True)
+    LookupNameEntity.delete().execute()
+
+    rows = [(name,) for name in dict.fromkeys(names)]
+    for batch in chunked(rows, get_chunk_size(1)):
+        LookupNameEntity.insert_many(
+            batch, fields=[LookupNameEntity.name]
+        ).execute()
+
+
+@atexit.register
+def close_all_db() -> None:
+    for db_path in list(databases):
+        close_db(db_path)
 
 
 @contextmanager
 def db_manager(
     db_path: Path, entities: list, is_atomic: bool = False
 ) -> Generator[SqliteDatabase, None, None]:
-    db = SqliteDatabase(db_path, pragmas={"foreign_keys": 1})
+    db = get_db(db_path)
     db.bind(entities)
-    db.create_tables(entities)
+
+    tables = created_tables[Path(db_path).resolve()]
+    missing = [x for x in entities if x._meta.table_name not in tables]
+    if missing:
+        db.create_tables(missing)
+        tables.update(x._meta.table_name for x in missing)
 
     if is_atomic:
         with db.atomic() as transaction:
             yield transaction
     else:
-        with db:
+        with db.atomic():
             yield db
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from peewee import chunked
+
 if TYPE_CHECKING:
     from pathlib import Path
 
+from plexutil.model.lookup_name_entity import LookupNameEntity
 from plexutil.model.music_playlist_entity import MusicPlaylistEntity
-from plexutil.service.db_manager import db_manager
+from plexutil.service.db_manager import (
+    db_manager,
+    get_chunk_size,
+    load_lookup_names,
+)
 
 
 class MusicPlaylistService:
@@ -26,10 +33,13 @@ class MusicPlaylistService:
     def get_many(
         self, entities: list[MusicPlaylistEntity]
     ) -> list[MusicPlaylistEntity]:
-        with db_manager(self.db_path, [MusicPlaylistEntity]):
-            names = [x.name for x in entities]
-            return MusicPlaylistEntity.select().where(
-                MusicPlaylistEntity.name.in_(names)
+        with db_manager(self.db_path, [MusicPlaylistEntity]) as db:
+            load_lookup_names(db, [x.name for x in entities])
+            return list(
+                MusicPlaylistEntity.select().join(
+                    LookupNameEntity,
+                    on=(MusicPlaylistEntity.name == LookupNameEntity.name),
+                )
             )
 
     def get_all(
@@ -53,9 +63,7 @@ class MusicPlaylistService:
 
     def add_many(self, entities: list[MusicPlaylistEntity]) -> None:
         with db_manager(self.db_path, [MusicPlaylistEntity], is_atomic=True):
-            bulk = [(entity.name,) for entity in entities]
-            for idx in range(0, len(bulk), 100):
-                MusicPlaylistEntity.insert_many(
-                    bulk[idx : idx + 100],
-                    fields=[MusicPlaylistEntity.name],
-                ).execute()
+            fields = [MusicPlaylistEntity.id, MusicPlaylistEntity.name]
+            bulk = [(entity.id, entity.name) for entity in entities]
+            for batch in chunked(bulk, get_chunk_size(len(fields))):
+                MusicPlaylistEntity.insert_many(batch, fields=fields).execute()
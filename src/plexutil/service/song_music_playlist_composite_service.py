@@ -2,17 +2,25 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from peewee import chunked
+
 if TYPE_CHECKING:
     from pathlib import Path
 
     from plexutil.dto.music_playlist_dto import MusicPlaylistDTO
+    from plexutil.dto.song_dto import SongDTO
 
 from plexutil.mapper.music_playlist_mapper import MusicPlaylistMapper
 from plexutil.mapper.song_mapper import SongMapper
+from plexutil.model.lookup_name_entity import LookupNameEntity
 from plexutil.model.music_playlist_entity import MusicPlaylistEntity
 from plexutil.model.song_entity import SongEntity
 from plexutil.model.song_music_playlist_entity import SongMusicPlaylistEntity
-from plexutil.service.db_manager import db_manager
+from plexutil.service.db_manager import (
+    db_manager,
+    get_chunk_size,
+    load_lookup_names,
+)
 from plexutil.service.music_playlist_service import MusicPlaylistService
 from plexutil.service.song_service import SongService
 
@@ -29,8 +37,8 @@ class SongMusicPlaylistCompositeService:
         with db_manager(
             self.db_path,
             [MusicPlaylistEntity, SongEntity, SongMusicPlaylistEntity],
-        ):
-            playlist_names = [x.name for x in entities]
+        ) as db:
+            load_lookup_names(db, [x.name for x in entities])
             song_playlists = (
                 SongMusicPlaylistEntity.select(
                     SongMusicPlaylistEntity, SongEntity, MusicPlaylistEntity
@@ -38,7 +46,11 @@ class SongMusicPlaylistCompositeService:
                 .join(MusicPlaylistEntity)
                 .switch(SongMusicPlaylistEntity)
                 .join(SongEntity)
-                .where(MusicPlaylistEntity.name.in_(playlist_names))
+                .switch(MusicPlaylistEntity)
+                .join(
+                    LookupNameEntity,
+                    on=(MusicPlaylistEntity.name == LookupNameEntity.name),
+                )
             )
 
             playlists = {}
@@ -71,55 +83,50 @@ class SongMusicPlaylistCompositeService:
         self.add_many([music_playlist_dto])
 
     def add_many(self, music_playlist_dtos: list[MusicPlaylistDTO]) -> None:
+        """
+        Persists playlists, their songs and the links between them
+        in a single transaction
+        Entity IDs are generated client side and resolved from memory,
+        so the amount of statements doesn't depend on the playlist count
+
+        Args:
+            music_playlist_dtos (list[MusicPlaylistDTO]): Playlists to save
+
+        Returns:
+            None: This method does not return a value
+        """
         with db_manager(
             self.db_path,
             [MusicPlaylistEntity, SongEntity, SongMusicPlaylistEntity],
+            is_atomic=True,
         ):
             song_service = SongService(self.db_path)
             music_playlist_service = MusicPlaylistService(self.db_path)
             song_mapper = SongMapper()
             music_playlist_mapper = MusicPlaylistMapper()
 
-            playlists = [
-                music_playlist_mapper.get_entity(x)
-                for x in music_playlist_dtos
-            ]
-            music_playlist_service.add_many(playlists)
-
-            songs = [
-                list(music_playlist_dto.songs)
-                for music_playlist_dto in music_playlist_dtos
-            ]
-
-            flattened_songs = [item for sublist in songs for item in sublist]
-            unique_song_dtos = set(flattened_songs)
-            unique_song_entities = [
-                song_mapper.get_entity(x) for x in unique_song_dtos
-            ]
-
-            song_service.add_many(unique_song_entities)
+            playlists: dict[str, MusicPlaylistEntity] = {}
+            songs: dict[SongDTO, SongEntity] = {}
+            links = {}
 
             for music_playlist_dto in music_playlist_dtos:
-                playlist = music_playlist_service.get(
-                    music_playlist_mapper.get_entity(music_playlist_dto)
+                playlist = playlists.setdefault(
+                    music_playlist_dto.name,
+                    music_playlist_mapper.get_entity(music_playlist_dto),
                 )
-                songs = [
-                    song_mapper.get_entity(x) for x in music_playlist_dto.songs
-                ]
-                songs = song_service.get_many(songs)
-                to_save = [
-                    SongMusicPlaylistEntity(playlist=playlist.id, song=song.id)
-                    for song in songs
-                ]
+                for song_dto in music_playlist_dto.songs:
+                    if song_dto not in songs:
+                        songs[song_dto] = song_mapper.get_entity(song_dto)
+                    links[(playlist.id, songs[song_dto].id)] = None
 
-                bulk = [(entity.playlist, entity.song) for entity in to_save]
+            music_playlist_service.add_many(list(playlists.values()))
+            song_service.add_many(list(songs.values()))
 
+            fields = [
+                SongMusicPlaylistEntity.playlist,
+                SongMusicPlaylistEntity.song,
+            ]
+            for batch in chunked(links, get_chunk_size(len(fields))):
                 SongMusicPlaylistEntity.insert_many(
-                    bulk,
-                    fields=[
-                        SongMusicPlaylistEntity.playlist,
-                        SongMusicPlaylistEntity.song,
-                    ],
+                    batch, fields=fields
                 ).execute()
-
-            return
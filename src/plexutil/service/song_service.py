@@ -2,12 +2,19 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from peewee import chunked
+
 if TYPE_CHECKING:
     from pathlib import Path
 
 
+from plexutil.model.lookup_name_entity import LookupNameEntity
 from plexutil.model.song_entity import SongEntity
-from plexutil.service.db_manager import db_manager
+from plexutil.service.db_manager import (
+    db_manager,
+    get_chunk_size,
+    load_lookup_names,
+)
 
 
 class SongService:
@@ -21,9 +28,14 @@ class SongService:
             )
 
     def get_many(self, entities: list[SongEntity]) -> list[SongEntity]:
-        with db_manager(self.db_path, [SongEntity]):
-            names = [x.name for x in entities]
-            return SongEntity.select().where(SongEntity.name.in_(names))
+        with db_manager(self.db_path, [SongEntity]) as db:
+            load_lookup_names(db, [x.name for x in entities])
+            return list(
+                SongEntity.select().join(
+                    LookupNameEntity,
+                    on=(SongEntity.name == LookupNameEntity.name),
+                )
+            )
 
     def save(self, entity: SongEntity) -> SongEntity:
         force_insert = not self.exists(entity)
@@ -41,10 +53,7 @@ class SongService:
 
     def add_many(self, entities: list[SongEntity]) -> None:
         with db_manager(self.db_path, [SongEntity], is_atomic=True):
-            bulk = [(song.name,) for song in entities]
-
-            for idx in range(0, len(bulk), 100):
-                SongEntity.insert_many(
-                    bulk[idx : idx + 100],
-                    fields=[SongEntity.name],
-                ).execute()
+            fields = [SongEntity.id, SongEntity.name]
+            bulk = [(entity.id, entity.name) for entity in entities]
+            for batch in chunked(bulk, get_chunk_size(len(fields))):
+                SongEntity.insert_many(batch, fields=fields).execute()
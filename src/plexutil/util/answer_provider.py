@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import uuid
+from collections import deque
+from pathlib import Path
+
+from plexutil.exception.user_error import UserError
+from plexutil.plex_util_logger import PlexUtilLogger
+
+
+class AnswerProvider:
+    # PLEXUTIL_ANSWER_LIBRARY_NAME answers the "Library Name" prompt
+    ENV_PREFIX = "PLEXUTIL_ANSWER_"
+    # Marks the log lines a session is replayed from
+    RECORD_PREFIX = "Answer recorded | "
+    # Tells apart the runs sharing a log file, set once per run
+    SESSION_ID = uuid.uuid4().hex
+    ENCODING = "utf-8"
+
+    def __init__(
+        self,
+        answers_path: Path | None = None,
+        replay_path: Path | None = None,
+        replay_session: str | None = None,
+    ) -> None:
+        """
+        Supplies prompt answers ahead of the user, from (by precedence):
+        environment variables, an answers file and a session replayed
+        from a log
+        Every answer given, from any source, is recorded to the log
+        tagged with the run's session, a log shared by several runs
+        replays a single one of them
+
+        Answers file (YAML), keyed by prompt title, a list is consumed
+        in order when a prompt is asked more than once:
+            Library Name: Movies
+            Locations: /storage/media/movies
+            Enable Cinema Trailers: [y, n]
+
+        Args:
+            answers_path (Path | None): YAML answers file
+            replay_path (Path | None): A log of a previous session
+            replay_session (str | None): The session to replay,
+            the last one in the log if None
+
+        Raises:
+            UserError: If the answers file or log cannot be read,
+            or the log has no such session
+        """
+        self.answers: dict[str, deque[str]] = {}
+        self.replay: dict[str, deque[str]] = {}
+
+        if answers_path:
+            answers = AnswerProvider.__load_answers(answers_path)
+            for title, answer in answers.items():
+                values = answer if isinstance(answer, list) else [answer]
+                self.answers[str(title).lower()] = deque(
+                    AnswerProvider.__to_str(x) for x in values
+                )
+
+        if replay_path:
+            self.replay = AnswerProvider.__load_replay(
+                replay_path, replay_session
+            )
+
+    def get_answer(self, title: str) -> str | None:
+        """
+        The answer to a prompt, if any source has one
+
+        Args:
+            title (str): The prompt title
+
+        Returns:
+            str | None: The answer, None if the user should be asked
+        """
+        env_key = AnswerProvider.get_env_key(title)
+        answer = os.getenv(env_key)
+        source = env_key
+        if answer is None:
+            answers = self.answers.get(title.lower())
+            if answers:
+                # The last answer keeps answering once the others are used
+                answer = answers.popleft() if len(answers) > 1 else answers[0]
+                source = "answers file"
+        if answer is None:
+            # Only consumed when used, sources above keep precedence
+            replays = self.replay.get(title.lower())
+            if replays:
+                answer = replays.popleft()
+                source = "replay"
+
+        if answer is not None:
+            description = f"{title} | Answered from {source}: {answer}"
+            PlexUtilLogger.get_logger().debug(description)
+        return answer
+
+    @staticmethod
+    def record(title: str, answer: str) -> None:
+        """
+        Logs an answer so the session can be replayed
+
+        Args:
+            title (str): The prompt title
+            answer (str): The answer given
+
+        Returns:
+            None: This method does not return a value
+        """
+        record = json.dumps(
+            {
+                "session": AnswerProvider.SESSION_ID,
+                "title": title,
+                "answer": answer,
+            }
+        )
+        description = f"{AnswerProvider.RECORD_PREFIX}{record}"
+        PlexUtilLogger.get_logger().debug(description)
+
+    @staticmethod
+    def parse_replay(replay: str) -> tuple[Path, str | None]:
+        """
+        Splits a --replay value into the log and the session to replay
+
+        Args:
+            replay (str): i.e 2026-1-1.log or 2026-1-1.log:<session>
+
+        Returns:
+            tuple[Path, str | None]: The log, and the session
+            or None for the last one in the log
+        """
+        log, separator, session = replay.rpartition(":")
+        # Windows drive letters contain a colon too, sessions are uuids
+        if separator and re.fullmatch(r"[0-9a-f]{32}", session):
+            return Path(log), session
+        return Path(replay), None
+
+    @staticmethod
+    def get_env_key(title: str) -> str:
+        """
+        The environment variable that answers a prompt
+
+        Args:
+            title (str): The prompt title
+
+        Returns:
+            str: i.e PLEXUTIL_ANSWER_LIBRARY_NAME for "Library Name"
+        """
+        key = re.sub(r"[^A-Z0-9]+", "_", title.upper()).strip("_")
+        return f"{AnswerProvider.ENV_PREFIX}{key}"
+
+    @staticmethod
+    def __load_answers(answers_path: Path) -> dict:
+        import yaml  # noqa: PLC0415
+
+        try:
+            with answers_path.open(
+                "r", errors="strict", encoding=AnswerProvider.ENCODING
+            ) as file:
+                answers = yaml.safe_load(file) or {}
+        except (OSError, yaml.YAMLError) as e:
+            description = f"Could not read answers {answers_path!s}: {e!s}"
+            raise UserError(description) from e
+
+        if not isinstance(answers, dict):
+            description = f"Answers must be a mapping: {answers_path!s}"
+            raise UserError(description)
+        return answers
+
+    @staticmethod
+    def __load_replay(
+        replay_path: Path, replay_session: str | None
+    ) -> dict[str, deque[str]]:
+        # Session -> (title, answer) in the order asked
+        sessions: dict[str, list[tuple[str, str]]] = {}
+        try:
+            with replay_path.open(
+                "r", errors="replace", encoding=AnswerProvider.ENCODING
+            ) as file:
+                for line in file:
+                    _, found, record = line.partition(
+                        AnswerProvider.RECORD_PREFIX
+                    )
+                    if not found:
+                        continue
+                    data = json.loads(record)
+                    session = sessions.setdefault(data.get("session", ""), [])
+                    session.append((data["title"], data["answer"]))
+        except (OSError, ValueError, KeyError) as e:
+            description = f"Could not replay {replay_path!s}: {e!s}"
+            raise UserError(description) from e
+
+        if replay_session is None:
+            # Dicts keep insertion order, the last session ran last
+            replay_session = next(reversed(sessions), None)
+        if replay_session not in sessions:
+            description = (
+                f"No session {replay_session or ''} to replay "
+                f"in {replay_path!s}"
+            )
+            raise UserError(description)
+
+        description = f"Replaying session {replay_session} of {replay_path!s}"
+        PlexUtilLogger.get_logger().debug(description)
+
+        replay: dict[str, deque[str]] = {}
+        for title, answer in sessions[replay_session]:
+            replay.setdefault(title.lower(), deque()).append(answer)
+        return replay
+
+    @staticmethod
+    def __to_str(answer: bool | int | str | None) -> str:
+        if isinstance(answer, bool):
+            return "y" if answer else "n"
+        return "" if answer is None else str(answer)
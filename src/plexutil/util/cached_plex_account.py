@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING
+
+from plexapi.myplex import MyPlexAccount, MyPlexResource
+
+from plexutil.plex_util_logger import PlexUtilLogger
+from plexutil.util.file_importer import FileImporter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from xml.etree.ElementTree import Element
+
+
+class CachedPlexAccount(MyPlexAccount):
+    # plex.tv responses are reused this long
+    # A single TTL keeps the account from outliving the resources, a
+    # refused token surfaces when signing in rather than mid request
+    TTL_SECONDS = 600
+    ENCODING = "utf-8"
+
+    def __init__(self, token: str, cache_path: Path) -> None:
+        """
+        MyPlexAccount that keeps the plex.tv responses for the account
+        and its resources on disk, repeated runs within TTL_SECONDS
+        make no request to plex.tv
+        The cache is bound to the token, a new token starts afresh
+
+        Args:
+            token (str): The plex.tv token
+            cache_path (Path): Location of the cache file
+        """
+        self._cache_path = cache_path
+        self._cache_key = hashlib.sha256(token.encode()).hexdigest()
+        self._cache = self.__load()
+        super().__init__(token=token)
+
+    def _signin(
+        self,
+        username: str | None,
+        password: str | None,
+        code: str | None,
+        remember: bool,
+        timeout: int | None,
+    ) -> tuple[Element, str]:
+        data = self.__get_cached("account")
+        if data is not None:
+            return data, self.key
+
+        data, initpath = super()._signin(
+            username, password, code, remember, timeout
+        )
+        self.__set_cached("account", data)
+        return data, initpath
+
+    def resources(self) -> list[MyPlexResource]:
+        """
+        Returns every resource (servers, clients) of the account,
+        served from the cache within TTL_SECONDS
+
+        Returns:
+            list[MyPlexResource]: The resources of the account
+        """
+        data = self.__get_cached("resources")
+        if data is None:
+            data = self.query(MyPlexResource.key)
+            self.__set_cached("resources", data)
+        return [MyPlexResource(self, elem) for elem in data]
+
+    def invalidate(self) -> None:
+        """
+        Drops the cache, i.e when a cached resource could not be reached
+
+        Returns:
+            None: This method does not return a value
+        """
+        self._cache = {"key": self._cache_key}
+        self._cache_path.unlink(missing_ok=True)
+
+    def __get_cached(self, name: str) -> Element | None:
+        try:
+            fetched_at, xml = self._cache[name]
+            if not 0 <= time.time() - fetched_at < self.TTL_SECONDS:
+                return None
+            # Only ever holds what plex.tv sent over TLS
+            data = ET.fromstring(xml)  # noqa: S314
+        except (KeyError, TypeError, ValueError, ET.ParseError):
+            return None
+        description = f"Using cached plex.tv {name}"
+        PlexUtilLogger.get_logger().debug(description)
+        return data
+
+    def __set_cached(self, name: str, data: Element) -> None:
+        self._cache[name] = [
+            time.time(),
+            ET.tostring(data, encoding="unicode"),
+        ]
+        # Written aside then renamed, concurrent runs never
+        # read a partial cache
+        temp_path = self._cache_path.with_name(
+            f"{self._cache_path.name}.{os.getpid()!s}.tmp"
+        )
+        try:
+            # Holds the account token, readable by its owner only
+            with FileImporter.open_private(temp_path) as file:
+                json.dump(self._cache, file)
+            temp_path.replace(self._cache_path)
+        except OSError as e:
+            description = f"Could not cache plex.tv {name}: {e!s}"
+            PlexUtilLogger.get_logger().debug(description)
+            temp_path.unlink(missing_ok=True)
+
+    def __load(self) -> dict:
+        empty = {"key": self._cache_key}
+        try:
+            with self._cache_path.open(
+                "r", errors="strict", encoding=self.ENCODING
+            ) as file:
+                cache = json.load(file)
+        except FileNotFoundError:
+            return empty
+        except (OSError, ValueError) as e:
+            description = f"Ignoring unreadable {self._cache_path!s}: {e!s}"
+            PlexUtilLogger.get_logger().debug(description)
+            return empty
+
+        if not isinstance(cache, dict) or cache.get("key") != self._cache_key:
+            return empty
+        return cache
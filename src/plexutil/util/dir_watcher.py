@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from plexutil.plex_util_logger import PlexUtilLogger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from threading import Event
+
+# Entry name -> (is_dir, size, mtime_ns)
+Entries = dict[str, tuple[bool, int, int]]
+# Directory -> (directory mtime_ns, entries)
+Snapshot = dict[Path, tuple[int, Entries]]
+
+
+class DirWatcher:
+    # Time between two snapshots of the watched directories
+    POLL_INTERVAL_SECONDS = 5
+    # A directory is batched once it has been quiet for this long
+    DEBOUNCE_SECONDS = 30
+    # A directory that never goes quiet is batched after this long
+    MAX_DELAY_SECONDS = 300
+    # Coarse filesystems (FAT, some SMB shares) tick mtimes every 2s,
+    # a directory changed within that window is listed regardless
+    MTIME_GRANULARITY_SECONDS = 2
+
+    def __init__(
+        self,
+        roots: list[Path],
+        poll_interval_seconds: float = POLL_INTERVAL_SECONDS,
+        debounce_seconds: float = DEBOUNCE_SECONDS,
+        max_delay_seconds: float = MAX_DELAY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Portable poller that detects changes under a set of directories
+        by comparing snapshots of their entries
+        A quiet directory whose mtime is unchanged is not listed again,
+        a poll costs a stat per directory rather than one per file
+        Changes are debounced and coalesced per directory, a directory
+        and its descendants are reported as the topmost changed directory
+
+        Args:
+            roots (list[Path]): The directories to watch, recursively
+            poll_interval_seconds (float): Time between two snapshots
+            debounce_seconds (float): Quiet period before a directory
+            is reported
+            max_delay_seconds (float): Max time a directory is held back
+            while it keeps changing
+            clock (Callable[[], float]): Monotonic time source
+        """
+        self.roots = roots
+        self.poll_interval_seconds = poll_interval_seconds
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.clock = clock
+        # Directory -> (first change seen, last change seen)
+        self.pending: dict[Path, tuple[float, float]] = {}
+        self.snapshot = self.take_snapshot()
+
+    def take_snapshot(self, previous: Snapshot | None = None) -> Snapshot:
+        """
+        Reads the entries of every directory under the roots
+        The entries of a directory are reused from the previous snapshot
+        when its mtime is unchanged, unless changes are pending under it:
+        adding, removing or renaming an entry changes the directory mtime,
+        a file growing in place does not and is only seen while pending
+
+        Args:
+            previous (Snapshot | None): The previous snapshot,
+            None to read every directory
+
+        Returns:
+            Snapshot: Entries keyed by directory
+        """
+        snapshot = {}
+        directories = list(self.roots)
+        while directories:
+            directory = directories.pop()
+            try:
+                # Stat before listing, a change in between shows next poll
+                mtime_ns = directory.stat().st_mtime_ns
+                cached = previous.get(directory) if previous else None
+                is_settled = (
+                    time.time_ns() - mtime_ns
+                    > DirWatcher.MTIME_GRANULARITY_SECONDS * 1_000_000_000
+                )
+                if (
+                    cached is not None
+                    and cached[0] == mtime_ns
+                    and is_settled
+                    and not self.is_pending(directory)
+                ):
+                    entries = cached[1]
+                else:
+                    entries = DirWatcher.read_entries(directory)
+            except OSError as e:
+                # Removed between listing its parent and now, or unreadable
+                description = f"Cannot read directory {directory!s}: {e!s}"
+                PlexUtilLogger.get_logger().debug(description)
+                continue
+            snapshot[directory] = (mtime_ns, entries)
+            # Content changes are tracked in the subdirectories
+            directories.extend(
+                directory / name
+                for name, (is_dir, _, _) in entries.items()
+                if is_dir
+            )
+        return snapshot
+
+    @staticmethod
+    def read_entries(directory: Path) -> Entries:
+        """
+        Lists a directory, stating its files
+
+        Args:
+            directory (Path): The directory to list
+
+        Returns:
+            Entries: Entries keyed by name
+
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        entries: Entries = {}
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    entries[entry.name] = (True, 0, 0)
+                else:
+                    stat = entry.stat(follow_symlinks=False)
+                    entries[entry.name] = (
+                        False,
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                    )
+        return entries
+
+    def is_pending(self, directory: Path) -> bool:
+        """
+        Whether a directory has changes waiting to be reported
+
+        Args:
+            directory (Path): The directory to check
+
+        Returns:
+            bool: Is the directory, or one of its ancestors, pending
+        """
+        return any(directory.is_relative_to(x) for x in self.pending)
+
+    @staticmethod
+    def diff(old: Snapshot, new: Snapshot) -> set[Path]:
+        """
+        Directories that need a scan to reflect the changes
+        between two snapshots
+
+        Args:
+            old (Snapshot): The previous snapshot
+            new (Snapshot): The current snapshot
+
+        Returns:
+            set[Path]: The changed directories
+        """
+        changed = set()
+        for directory, (_, entries) in new.items():
+            if directory not in old:
+                changed.add(directory)
+                continue
+
+            old_entries = old[directory][1]
+
+            for name in old_entries.keys() | entries.keys():
+                old_entry = old_entries.get(name)
+                entry = entries.get(name)
+                if old_entry == entry:
+                    continue
+                # An added subdirectory is reported on its own
+                if old_entry is None and entry is not None and entry[0]:
+                    continue
+                changed.add(directory)
+                break
+        return changed
+
+    def add(self, directory: Path, now: float) -> None:
+        """
+        Queues a changed directory, merging it with any pending
+        ancestor or descendant
+
+        Args:
+            directory (Path): The changed directory
+            now (float): When the change was seen
+
+        Returns:
+            None: This method does not return a value
+        """
+        for pending, (first_seen, _) in self.pending.items():
+            if directory == pending or directory.is_relative_to(pending):
+                self.pending[pending] = (first_seen, now)
+                return
+
+        first_seen = now
+        for pending in list(self.pending):
+            if pending.is_relative_to(directory):
+                first_seen = min(first_seen, self.pending.pop(pending)[0])
+        self.pending[directory] = (first_seen, now)
+
+    def pop_due(self, now: float) -> list[Path]:
+        """
+        Removes and returns the directories that went quiet,
+        or that have been held back for too long
+
+        Args:
+            now (float): Current time
+
+        Returns:
+            list[Path]: The directories to scan
+        """
+        due = [
+            directory
+            for directory, (first_seen, last_seen) in self.pending.items()
+            if now - last_seen >= self.debounce_seconds
+            or now - first_seen >= self.max_delay_seconds
+        ]
+        for directory in due:
+            del self.pending[directory]
+        return sorted(due)
+
+    def poll(self) -> list[Path]:
+        """
+        Takes a new snapshot, queues the changes since the previous one
+
+        Returns:
+            list[Path]: The directories due for a scan
+        """
+        snapshot = self.take_snapshot(previous=self.snapshot)
+        changed = DirWatcher.diff(old=self.snapshot, new=snapshot)
+        self.snapshot = snapshot
+
+        now = self.clock()
+        for directory in sorted(changed):
+            self.add(directory=directory, now=now)
+        return self.pop_due(now=now)
+
+    def run(
+        self, on_batch: Callable[[list[Path]], None], stop_event: Event
+    ) -> None:
+        """
+        Polls until stop_event is set, handing every batch of
+        changed directories to on_batch
+
+        Args:
+            on_batch (Callable[[list[Path]], None]): Receives the
+            directories due for a scan
+            stop_event (Event): Set to stop watching
+
+        Returns:
+            None: This method does not return a value
+        """
+        while not stop_event.wait(timeout=self.poll_interval_seconds):
+            batch = self.poll()
+            if batch:
+                on_batch(batch)
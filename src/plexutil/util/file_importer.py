@@ -6,22 +6,38 @@ import os
 import platform
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-
-import toml
+from typing import TYPE_CHECKING
 
 if platform.system() == "Windows":
     import win32evtlog  # pyright: ignore # noqa: PGH003
     import win32evtlogutil  # pyright: ignore # noqa: PGH003
 
-import yaml
-
 from plexutil.dto.bootstrap_paths_dto import BootstrapPathsDTO
+from plexutil.dto.library_spec_dto import LibrarySpecDTO
+from plexutil.dto.music_playlist_dto import MusicPlaylistDTO
+from plexutil.dto.server_profile_dto import ServerProfileDTO
+from plexutil.dto.server_spec_dto import ServerSpecDTO
+from plexutil.dto.song_dto import SongDTO
+from plexutil.enums.agent import Agent
+from plexutil.enums.language import Language
+from plexutil.enums.library_type import LibraryType
+from plexutil.enums.scanner import Scanner
+from plexutil.exception.user_error import UserError
 from plexutil.plex_util_logger import PlexUtilLogger
 from plexutil.static import Static
 
+if TYPE_CHECKING:
+    from typing import TextIO
+
 
 class FileImporter(Static):
     encoding = "utf-8"
+    # Files holding tokens are readable by their owner only
+    PRIVATE_FILE_MODE = 0o600
+    # Logs older than this are deleted
+    LOG_RETENTION_DAYS = 30
+    # Min time between two sweeps of the log directory
+    LOG_SWEEP_INTERVAL_HOURS = 24
 
     @staticmethod
     def get_project_root() -> Path:
@@ -34,14 +50,228 @@ class FileImporter(Static):
         return Path(__file__).parent.parent.parent
 
     @staticmethod
-    def get_logging_config(logging_config_path: Path) -> dict:
+    def get_logging_config(
+        logging_config_path: Path, cache_path: Path | None = None
+    ) -> dict:
+        """
+        Reads the YAML logging config, served from a JSON copy
+        that is reused until the YAML changes (mtime or size)
+        so YAML is neither imported nor parsed on most starts
+
+        Args:
+            logging_config_path (Path): Location of the YAML config
+            cache_path (Path | None): Location of the JSON copy,
+            None to always parse the YAML
+
+        Returns:
+            dict: The logging config, as expected by dictConfig
+        """
+        stat = logging_config_path.stat()
+        key = [stat.st_mtime_ns, stat.st_size]
+
+        if cache_path:
+            try:
+                with cache_path.open(
+                    "r", errors="strict", encoding=FileImporter.encoding
+                ) as file:
+                    cache = json.load(file)
+                if cache["key"] == key:
+                    return cache["config"]
+            except (OSError, ValueError, KeyError, TypeError):
+                # Missing, stale format or corrupted, rebuilt below
+                pass
+
+        import yaml  # noqa: PLC0415
+
         with logging_config_path.open(
             "r", errors="strict", encoding=FileImporter.encoding
         ) as file:
-            return yaml.safe_load(file)
+            config = yaml.safe_load(file)
+
+        if cache_path:
+            # Written aside then renamed, concurrent starts never
+            # read a partial copy
+            temp_path = cache_path.with_name(
+                f"{cache_path.name}.{os.getpid()!s}.tmp"
+            )
+            try:
+                with temp_path.open(
+                    "w", errors="strict", encoding=FileImporter.encoding
+                ) as file:
+                    json.dump({"key": key, "config": config}, file)
+                temp_path.replace(cache_path)
+            except OSError:
+                # The cache is an optimization, start without it
+                temp_path.unlink(missing_ok=True)
+
+        return config
+
+    @staticmethod
+    def sweep_logs(log_dir: Path, marker_path: Path) -> None:
+        """
+        Deletes the logs older than LOG_RETENTION_DAYS, at most once
+        every LOG_SWEEP_INTERVAL_HOURS as tracked by the marker file
+
+        Args:
+            log_dir (Path): The directory holding the logs
+            marker_path (Path): Touched on every sweep
+
+        Returns:
+            None: This method does not return a value
+        """
+        now = datetime.now(tz=UTC)
+        try:
+            last_sweep = datetime.fromtimestamp(
+                marker_path.stat().st_mtime, tz=UTC
+            )
+            interval = timedelta(hours=FileImporter.LOG_SWEEP_INTERVAL_HOURS)
+            # A marker in the future (clock change) triggers a sweep
+            if timedelta(0) <= now - last_sweep < interval:
+                return
+        except FileNotFoundError:
+            pass
+
+        log_limit_date = now - timedelta(days=FileImporter.LOG_RETENTION_DAYS)
+        for log_file in log_dir.iterdir():
+            if not log_file.is_file():
+                continue
+            log_date = datetime.fromtimestamp(log_file.stat().st_ctime, tz=UTC)
+            if log_date < log_limit_date:
+                log_file.unlink()
+
+        marker_path.touch()
+
+    @staticmethod
+    def get_spec(spec_path: Path) -> list[ServerSpecDTO]:
+        """
+        Reads a YAML (or TOML, by extension) spec declaring the desired
+        state of one or more servers:
+
+        servers:
+          - name: MyServer
+            settings: {ButlerStartHour: 2}
+            libraries:
+              - name: Movies
+                type: movie
+                locations: [/storage/media/movies]
+                agent: tv.plex.agents.movie      # Optional
+                scanner: Plex Movie              # Optional
+                language: en-US                  # Optional
+                settings: {enableCinemaTrailers: false}
+            playlists:
+              - library: Music
+                name: Chill
+                songs: ["Artist - Title", {artist: Artist, title: Title}]
+
+        Args:
+            spec_path (Path): Location of the spec file
+
+        Returns:
+            list[ServerSpecDTO]: The servers declared in the spec
+
+        Raises:
+            UserError: If the spec cannot be read or is malformed
+        """
+        import toml  # noqa: PLC0415
+        import yaml  # noqa: PLC0415
+
+        try:
+            with spec_path.open(
+                "r", errors="strict", encoding=FileImporter.encoding
+            ) as file:
+                if spec_path.suffix.lower() == ".toml":
+                    # IndexError on some malformed arrays i.e mixed types
+                    spec = toml.load(file)
+                else:
+                    spec = yaml.safe_load(file)
+        except (
+            OSError,
+            yaml.YAMLError,
+            toml.TomlDecodeError,
+            IndexError,
+        ) as e:
+            description = f"Could not read spec {spec_path!s}: {e!s}"
+            raise UserError(description) from e
+
+        try:
+            return [
+                FileImporter.__get_server_spec(server)
+                for server in spec["servers"]
+            ]
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            description = (
+                f"Malformed spec {spec_path!s}: {type(e).__name__} {e!s}"
+            )
+            raise UserError(description) from e
+
+    @staticmethod
+    def __get_server_spec(server: dict) -> ServerSpecDTO:
+        libraries = []
+        for library in server.get("libraries") or []:
+            library_type = FileImporter.__get_library_type(library["type"])
+            agent = library.get("agent")
+            scanner = library.get("scanner")
+            language = library.get("language")
+            libraries.append(
+                LibrarySpecDTO(
+                    name=library["name"],
+                    library_type=library_type,
+                    agent=Agent.get_from_str(agent, library_type)
+                    if agent
+                    else Agent.get_default(library_type),
+                    scanner=Scanner.get_from_str(scanner, library_type)
+                    if scanner
+                    else Scanner.get_default(library_type),
+                    language=Language.get_from_str(language)
+                    if language
+                    else Language.get_default(),
+                    locations=[Path(x) for x in library["locations"]],
+                    settings=dict(library.get("settings") or {}),
+                )
+            )
+
+        playlists = {}
+        for playlist in server.get("playlists") or []:
+            songs = []
+            for song in playlist.get("songs") or []:
+                if isinstance(song, str):
+                    artist, title = song.split(" - ", 1)
+                    songs.append(SongDTO(artist=artist, title=title))
+                else:
+                    songs.append(
+                        SongDTO(artist=song["artist"], title=song["title"])
+                    )
+            playlists.setdefault(playlist["library"], []).append(
+                MusicPlaylistDTO(name=playlist["name"], songs=songs)
+            )
+
+        return ServerSpecDTO(
+            name=server["name"],
+            settings=dict(server.get("settings") or {}),
+            libraries=libraries,
+            playlists=playlists,
+        )
+
+    @staticmethod
+    def __get_library_type(candidate: str) -> LibraryType:
+        # Playlists are declared apart, only media Libraries are accepted
+        for library_type in (
+            LibraryType.MOVIE,
+            LibraryType.TV,
+            LibraryType.MUSIC,
+        ):
+            if candidate.lower() == library_type.get_value():
+                return library_type
+        library_type = LibraryType.get_from_str(candidate)
+        if library_type is LibraryType.MUSIC_PLAYLIST:
+            description = "Playlists are declared under playlists"
+            raise UserError(description)
+        return library_type
 
     @staticmethod
     def get_pyproject() -> dict:
+        import toml  # noqa: PLC0415
+
         return toml.load(
             FileImporter.get_project_root().parent / "pyproject.toml"
         )
@@ -57,11 +287,107 @@ class FileImporter(Static):
         data = {}
         data["token"] = token
         data["X-Plex-Client-Identifier"] = client_dentifier
-        with location.open(
-            "w", errors="strict", encoding=FileImporter.encoding
-        ) as file:
+        with FileImporter.open_private(location) as file:
+            json.dump(data, file, indent=4, ensure_ascii=False)
+
+    @staticmethod
+    def get_server_profiles(location: Path) -> list[ServerProfileDTO]:
+        """
+        Reads the saved server connection profiles
+
+        Args:
+            location (Path): Location of the profiles file
+
+        Returns:
+            list[ServerProfileDTO]: Most recently used first,
+            empty if none saved or the file is unreadable
+        """
+        try:
+            with location.open(encoding=FileImporter.encoding) as file:
+                data = json.load(file)
+            return [
+                ServerProfileDTO(
+                    name=x["name"],
+                    machine_identifier=x["machine_identifier"],
+                    base_url=x["base_url"],
+                    token=x["token"],
+                )
+                for x in data["servers"]
+            ]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            description = f"Ignoring unreadable {location!s}: {e!s}"
+            PlexUtilLogger.get_logger().debug(description)
+            return []
+
+    @staticmethod
+    def save_server_profile(location: Path, profile: ServerProfileDTO) -> None:
+        """
+        Saves a server connection profile as the most recently used,
+        replacing any profile of the same server
+
+        Args:
+            location (Path): Location of the profiles file
+            profile (ServerProfileDTO): The profile to save
+
+        Returns:
+            None: This method does not return a value
+        """
+        profiles = FileImporter.get_server_profiles(location)
+        if profiles and profiles[0] == profile:
+            return
+
+        profiles = [profile] + [
+            x
+            for x in profiles
+            if x.machine_identifier != profile.machine_identifier
+        ]
+        data = {
+            "servers": [
+                {
+                    "name": x.name,
+                    "machine_identifier": x.machine_identifier,
+                    "base_url": x.base_url,
+                    "token": x.token,
+                }
+                for x in profiles
+            ]
+        }
+        with FileImporter.open_private(location) as file:
             json.dump(data, file, indent=4, ensure_ascii=False)
 
+    @staticmethod
+    def open_private(location: Path) -> TextIO:
+        """
+        Opens a file for writing, readable and writable by its owner only
+        An existing file is truncated and narrowed to the same mode
+
+        Args:
+            location (Path): Location of the file
+
+        Returns:
+            TextIO: The file, open for writing
+        """
+        # Created with the mode, never readable by others even briefly
+        descriptor = os.open(
+            location,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            FileImporter.PRIVATE_FILE_MODE,
+        )
+        try:
+            # The mode above only applies to a new file
+            location.chmod(FileImporter.PRIVATE_FILE_MODE)
+            return os.fdopen(
+                descriptor,
+                "w",
+                errors="strict",
+                encoding=FileImporter.encoding,
+            )
+        except BaseException:
+            os.close(descriptor)
+            raise
+
     @staticmethod
     def bootstrap() -> BootstrapPathsDTO:
         try:
@@ -96,21 +422,17 @@ class FileImporter(Static):
             plexutil_dir = Path(home_folder) / "plexutil"
             auth_dir = plexutil_dir / "auth"
             log_dir = plexutil_dir / "log"
+            cache_dir = plexutil_dir / "cache"
 
             plexutil_dir.mkdir(exist_ok=True)
             auth_dir.mkdir(exist_ok=True)
             log_dir.mkdir(exist_ok=True)
 
-            # Delete logs older than 30 days
-            for log_file in log_dir.iterdir():
-                if not log_file.is_file():
-                    continue
-                log_date = datetime.fromtimestamp(
-                    log_file.stat().st_ctime, tz=UTC
-                )
-                log_limit_date = datetime.now(tz=UTC) - timedelta(days=30)
-                if log_date < log_limit_date:
-                    log_file.unlink()
+            cache_dir.mkdir(exist_ok=True)
+
+            FileImporter.sweep_logs(
+                log_dir=log_dir, marker_path=cache_dir / "log_sweep"
+            )
 
             log_config_file_path = (
                 FileImporter.get_project_root()
@@ -119,7 +441,10 @@ class FileImporter(Static):
                 / "log_config.yaml"
             )
 
-            log_config = FileImporter.get_logging_config(log_config_file_path)
+            log_config = FileImporter.get_logging_config(
+                logging_config_path=log_config_file_path,
+                cache_path=cache_dir / "log_config.json",
+            )
 
             PlexUtilLogger(log_dir, log_config)
 
@@ -129,9 +454,12 @@ class FileImporter(Static):
             return BootstrapPathsDTO(
                 auth_dir=auth_dir,
                 log_dir=log_dir,
+                cache_dir=cache_dir,
                 private_key_dir=auth_dir / "private.key",
                 public_key_dir=auth_dir / "public.key",
                 token_dir=auth_dir / "token.json",
+                server_profiles_dir=auth_dir / "servers.json",
+                account_cache_dir=auth_dir / "account.json",
                 plexutil_playlists_db_dir=Path.cwd() / "playlists.db",
             )
 
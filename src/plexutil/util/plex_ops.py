@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from plexapi.exceptions import NotFound
+from plexapi.exceptions import BadRequest, NotFound
 
 from plexutil.core.prompt import Prompt
 from plexutil.dto.dropdown_item_dto import DropdownItemDTO
 from plexutil.dto.library_setting_dto import LibrarySettingDTO
 from plexutil.dto.song_dto import SongDTO
 from plexutil.enums.server_setting import ServerSetting
-from plexutil.exception.plex_media_missing_error import PlexMediaMissingError
 from plexutil.exception.unexpected_naming_pattern_error import (
     UnexpectedNamingPatternError,
 )
@@ -19,9 +22,13 @@ from plexutil.static import Static
 from plexutil.util.icons import Icons
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from plexapi.audio import Track
     from plexapi.library import LibrarySection
     from plexapi.server import PlexServer
+    from plexapi.settings import Setting
+    from plexapi.video import Movie, Show
 
 
 class PlexOps(Static):
@@ -31,6 +38,8 @@ class PlexOps(Static):
     ) -> None:
         """
         Sets Plex Server Settings
+        Only the settings whose value differs from the server are saved
+        Logs a warning if setting doesn't exist
 
         Args:
             plex_server (plexapi.server.PlexServer): A Plex Server instance
@@ -40,27 +49,146 @@ class PlexOps(Static):
 
         """
         server_settings = ServerSetting.get_all()
+        desired = {}
 
         for server_setting in server_settings:
             dropdown = server_setting.get_dropdown()
-            is_from_server = False
-            user_response = server_setting.get_default_selection()
-            plex_setting = plex_server.settings.get(server_setting.get_name())
-            if plex_setting:
-                user_response = plex_setting.value
-                is_from_server = True
-
-                dropdown = PlexOps.override_dropdown_default(
-                    dropdown=dropdown, value=user_response
+            try:
+                plex_setting = plex_server.settings.get(
+                    server_setting.get_name()
+                )
+            except NotFound:
+                description = (
+                    f"{Icons.WARNING} Could not load server setting "
+                    f"{server_setting.get_name()}\n"
+                    f"Skipping -> {server_setting.get_name()}"
                 )
+                PlexUtilLogger.get_logger().warning(description)
+                continue
+
+            dropdown = PlexOps.override_dropdown_default(
+                dropdown=dropdown, value=plex_setting.value
+            )
             response = Prompt.confirm_library_setting(
-                library_setting=server_setting.to_dto(
-                    is_from_server=is_from_server
-                ),
+                library_setting=server_setting.to_dto(is_from_server=True),
+            )
+            desired[plex_setting.id] = response.user_response
+
+        PlexOps.apply_server_settings(plex_server=plex_server, desired=desired)
+
+    @staticmethod
+    def apply_server_settings(
+        plex_server: PlexServer,
+        desired: dict[str, bool | int | str],
+        is_plan_logged: bool = True,
+    ) -> dict[str, bool | int | str]:
+        """
+        Saves the Server Settings whose value differs from the server
+        Logs a warning for every setting not found or not accepted
+
+        Args:
+            plex_server (plexapi.server.PlexServer): A Plex Server instance
+            desired (dict[str, bool | int | str]): Values keyed by setting id
+            is_plan_logged (bool): Report the settings plan
+
+        Returns:
+            dict[str, bool | int | str]: The values saved, keyed by setting id
+        """
+        plex_settings = {}
+        for name in desired:
+            try:
+                plex_settings[name] = plex_server.settings.get(name)
+            except NotFound:
+                description = (
+                    f"{Icons.WARNING} Could not load server setting "
+                    f"{name}\n"
+                    f"Skipping -> {name}"
+                )
+                PlexUtilLogger.get_logger().warning(description)
+
+        changes = PlexOps.diff_settings(desired=desired, current=plex_settings)
+        if is_plan_logged:
+            PlexOps.log_settings_plan(
+                title="Server",
+                changes=changes,
+                unchanged_count=len(plex_settings) - len(changes),
             )
-            plex_setting.set(response.user_response)
 
-        plex_server.settings.save()
+        applied = {}
+        for name, (_, value) in changes.items():
+            try:
+                plex_settings[name].set(value)
+                applied[name] = value
+            except BadRequest as e:
+                description = (
+                    f"{Icons.WARNING} Server Setting not accepted: {e!s}\n"
+                    f"Skipping -> {name}:{value}"
+                )
+                PlexUtilLogger.get_logger().warning(description)
+
+        if applied:
+            plex_server.settings.save()
+        return applied
+
+    @staticmethod
+    def diff_settings(
+        desired: dict[str, bool | int | str],
+        current: dict[str, Setting],
+    ) -> dict[str, tuple[bool | int | str, bool | int | str]]:
+        """
+        Compares desired setting values to the ones on the server
+
+        Args:
+            desired (dict[str, bool | int | str]): Values keyed by setting id
+            current (dict[str, Setting]): Settings from a single fetch,
+            keyed by setting id
+
+        Returns:
+            dict[str, tuple[bool | int | str, bool | int | str]]:
+            (current, desired) values of the settings that differ,
+            keyed by setting id
+        """
+        changes = {}
+        for name, value in desired.items():
+            plex_setting = current.get(name)
+            if plex_setting is None:
+                continue
+            current_value = plex_setting.value
+            if isinstance(current_value, bool) or isinstance(value, bool):
+                # Toggles may come back as 0/1
+                is_changed = bool(current_value) != bool(value)
+            else:
+                is_changed = str(current_value) != str(value)
+            if is_changed:
+                changes[name] = (current_value, value)
+        return changes
+
+    @staticmethod
+    def log_settings_plan(
+        title: str,
+        changes: dict[str, tuple[bool | int | str, bool | int | str]],
+        unchanged_count: int,
+    ) -> None:
+        """
+        Reports the settings about to change
+
+        Args:
+            title (str): What the settings belong to
+            changes (dict[str, tuple[bool | int | str, bool | int | str]]):
+            (current, desired) values keyed by setting id
+            unchanged_count (int): Amount of settings left as they are
+
+        Returns:
+            None: This method does not return a value
+        """
+        description = f"\nSettings plan | {title}\n"
+        if changes:
+            for name, (current_value, value) in changes.items():
+                description += f"-> {name}: {current_value!s} -> {value!s}\n"
+        else:
+            description += "No changes\n"
+        description += f"Unchanged: {unchanged_count!s}"
+        PlexUtilLogger.get_console_logger().info(description)
 
     @staticmethod
     def set_library_settings(
@@ -69,31 +197,58 @@ class PlexOps(Static):
     ) -> None:
         """
         Sets Library Settings
+        Fetches the Section settings once, collects every response,
+        then applies them in a single request
         Logs a warning if setting doesn't exist
 
         Args:
-            settings (LibrarySettingDTO): The Setting to apply to this Library
+            section (LibrarySection): The Library to apply the settings to
+            settings (list[LibrarySettingDTO]): The Settings to apply
 
         Returns:
             None: This method does not return a value
         """
+        try:
+            server_settings = {x.id: x for x in section.settings() if x}
+        except NotFound:
+            description = (
+                f"{Icons.WARNING} Could not load library settings of "
+                f"{section.title}\n"
+                f"Skipping -> {[x.name for x in settings]!s}"
+            )
+            PlexUtilLogger.get_logger().warning(description)
+            return
+
+        plan = PlexOps.plan_library_settings(
+            settings=settings, server_settings=server_settings
+        )
+        PlexOps.apply_library_settings(
+            section=section, plan=plan, server_settings=server_settings
+        )
+
+    @staticmethod
+    def plan_library_settings(
+        settings: list[LibrarySettingDTO],
+        server_settings: dict[str, Setting],
+    ) -> dict[str, bool | int | str]:
+        """
+        Collects the responses for Library Settings
+        Settings marked is_from_server are prompted with their current value
+        Logs a warning if setting doesn't exist
+
+        Args:
+            settings (list[LibrarySettingDTO]): The Settings to prompt for
+            server_settings (dict[str, Setting]): The Section settings
+            currently on the server, keyed by id
+
+        Returns:
+            dict[str, bool | int | str]: Responses keyed by setting id
+        """
+        plan = {}
         for setting in settings:
             if setting.is_from_server:
                 name = setting.name
-                plex_setting = None
-                try:
-                    server_settings = section.settings()
-                    for server_setting in server_settings:
-                        if server_setting and server_setting.id == name:
-                            plex_setting = server_setting
-                except NotFound:
-                    description = (
-                        f"{Icons.WARNING} Could not load library setting "
-                        f"{name}\n"
-                        f"Skipping -> {name}"
-                    )
-                    PlexUtilLogger.get_logger().warning(description)
-                    continue
+                plex_setting = server_settings.get(name)
                 if plex_setting:
                     response = plex_setting.value
 
@@ -133,16 +288,119 @@ class PlexOps(Static):
             else:
                 response = Prompt.confirm_library_setting(setting)
 
-            try:
-                section.editAdvanced(**{response.name: response.user_response})
-            except NotFound:
-                description = (
-                    f"{Icons.WARNING} Library Setting not accepted "
-                    f"by the server: {response.name}\n"
-                    f"Skipping -> {response.name}:{response.user_response}"
-                )
-                PlexUtilLogger.get_logger().warning(description)
+            plan[response.name] = response.user_response
+        return plan
+
+    @staticmethod
+    def apply_library_settings(
+        section: LibrarySection,
+        plan: dict[str, bool | int | str],
+        server_settings: dict[str, Setting],
+        is_plan_logged: bool = True,
+    ) -> dict[str, bool | int | str]:
+        """
+        Applies Library Settings in a single prefs update,
+        only the settings whose value differs from the server are sent
+        Falls back to one update per setting if the server rejects the batch
+        Logs a warning for every setting not accepted
+
+        Args:
+            section (LibrarySection): The Library to apply the settings to
+            plan (dict[str, bool | int | str]): Values keyed by setting id
+            server_settings (dict[str, Setting]): The Section settings
+            currently on the server, keyed by id
+            is_plan_logged (bool): Report the settings plan
+
+        Returns:
+            dict[str, bool | int | str]: The values applied, keyed by id
+        """
+        prefs = {}
+        for name, value in plan.items():
+            plex_setting = server_settings.get(name)
+            # Same validation editAdvanced does, without refetching settings
+            if plex_setting is None or not PlexOps.is_library_setting_valid(
+                value=value,
+                is_toggle=plex_setting.type == "bool",
+                enum_values=plex_setting.enumValues,
+            ):
+                PlexOps.warn_library_setting_rejected(name=name, value=value)
                 continue
+            prefs[name] = value
+
+        changes = PlexOps.diff_settings(desired=prefs, current=server_settings)
+        if is_plan_logged:
+            PlexOps.log_settings_plan(
+                title=section.title,
+                changes=changes,
+                unchanged_count=len(prefs) - len(changes),
+            )
+        prefs = {x: prefs[x] for x in changes}
+        if not prefs:
+            return prefs
+
+        try:
+            section.edit(**{f"prefs[{x}]": y for x, y in prefs.items()})
+        except (BadRequest, NotFound) as e:
+            description = (
+                f"Library Settings rejected as a batch: {e!s}\n"
+                "Applying one by one"
+            )
+            PlexUtilLogger.get_logger().debug(description)
+        else:
+            return prefs
+
+        applied = {}
+        for name, value in prefs.items():
+            try:
+                section.edit(**{f"prefs[{name}]": value})
+                applied[name] = value
+            except (BadRequest, NotFound):
+                PlexOps.warn_library_setting_rejected(name=name, value=value)
+        return applied
+
+    @staticmethod
+    def is_library_setting_valid(
+        value: bool | int | str,
+        is_toggle: bool,
+        enum_values: list | dict | None,
+    ) -> bool:
+        """
+        Whether a Library Setting value would be accepted by the server
+
+        Args:
+            value (bool | int | str): The value to check
+            is_toggle (bool): Is the setting a yes/no
+            enum_values (list | dict | None): The values allowed,
+            None for free-form settings
+
+        Returns:
+            bool: Is the value valid
+        """
+        if is_toggle:
+            return value in {0: False, 1: True}
+        # Free-form settings have no enum to validate against
+        return enum_values is None or value in enum_values
+
+    @staticmethod
+    def warn_library_setting_rejected(
+        name: str, value: bool | int | str
+    ) -> None:
+        """
+        Logs a warning for a Library Setting that is skipped
+
+        Args:
+            name (str): The setting id
+            value (bool | int | str): The value rejected
+
+        Returns:
+            None: This method does not return a value
+        """
+        description = (
+            f"{Icons.WARNING} Library Setting not accepted "
+            f"by the server: {name}\n"
+            f"Skipping -> {name}:{value}"
+        )
+        PlexUtilLogger.get_logger().warning(description)
 
     @staticmethod
     def override_dropdown_default(
@@ -178,42 +436,146 @@ class PlexOps(Static):
         return dropdown_default
 
     @staticmethod
-    def get_song_dto(track: Track) -> SongDTO:
+    def get_count(section: LibrarySection, libtype: str) -> int:
         """
-        Maps a Track to a SongDTO
+        Counts the items of a libtype in a Section
+        Requests zero items and reads the container's total size
 
         Args:
-            track (Track): The Track to map
+            section (LibrarySection): The Section to count
+            libtype (str): The type of items to count i.e. movie, show, track
+
         Returns:
-            SongDTO: The Track mapped to a SongDTO
-        Raises:
-            UnexpectedNamingPatternError: If file does not
-            follow Artist - Title pattern
+            int: Amount of items in the Section
         """
-        return PlexOps.__resolve_track_name(track=track)
+        return (
+            section.totalViewSize(libtype=libtype, includeCollections=False)
+            or 0
+        )
+
+    @staticmethod
+    def iter_section(
+        section: LibrarySection,
+        libtype: str,
+        page_size: int,
+        filters: dict | None = None,
+    ) -> Iterator[Movie | Show | Track]:
+        """
+        Yields every item of a libtype in a Section, one page at a time
+        Only a single page of items is held in memory
+
+        Args:
+            section (LibrarySection): The Section to page through
+            libtype (str): The type of items to yield i.e. movie, show, track
+            page_size (int): Amount of items requested per page
+            filters (dict | None): plexapi advanced filters i.e.
+            {"updatedAt>>": datetime}
+
+        Returns:
+            Iterator[Movie | Show | Track]: The items in the Section
+        """
+        container_start = 0
+        while True:
+            page = section.search(
+                libtype=libtype,
+                container_start=container_start,
+                container_size=page_size,
+                maxresults=page_size,
+                filters=filters,
+            )
+            yield from page
+
+            if len(page) < page_size:
+                return
+            container_start = container_start + page_size
 
     @staticmethod
-    def get_track(song_dto: SongDTO, tracks: list[Track]) -> Track:
+    def is_under_paths(media: Movie | Show | Track, paths: list[str]) -> bool:
         """
-        Returns the Track that matches the provided SongDTO
+        Whether any file or folder of an item is under one of paths
 
         Args:
-            song_dto (SongDTO): The Song to find
-            tracks (list[Track]): Where to look for the SongDTO
+            media (Movie | Show | Track): The item, its locations
+            come with the listing, no request is made
+            paths (list[str]): Server paths
+
         Returns:
-            Track: The found Track
+            bool: True if the item is located under any of paths
+        """
+        prefixes = [x.rstrip("/\\") for x in paths]
+        return any(
+            location == prefix
+            or location.startswith((f"{prefix}/", f"{prefix}\\"))
+            for location in media.locations
+            for prefix in prefixes
+        )
+
+    @staticmethod
+    def refresh_media(
+        media: Iterable[Movie | Show | Track],
+        max_workers: int,
+        max_per_second: float,
+    ) -> int:
+        """
+        Refreshes the metadata of every media item on a bounded pool
+        Requests are spaced to never exceed max_per_second
+        Logs a warning for every item that fails to refresh
+
+        Args:
+            media (Iterable[Movie | Show | Track]): The items to refresh,
+            consumed lazily so a paged stream is accepted
+            max_workers (int): Max concurrent refresh requests
+            max_per_second (float): Max refresh requests per second
+
+        Returns:
+            int: Amount of items refreshed
+        """
+        interval = 1 / max_per_second
+        lock = threading.Lock()
+        next_request = time.monotonic()
+
+        def refresh(item: Movie | Show | Track) -> None:
+            nonlocal next_request
+            with lock:
+                now = time.monotonic()
+                delay = max(0.0, next_request - now)
+                next_request = max(now, next_request) + interval
+            time.sleep(delay)
+            item.refresh()
+
+        refreshed = 0
+        iterator = iter(media)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Only a few batches are in flight, keeps memory bounded
+            while batch := list(islice(iterator, max_workers * 4)):
+                futures = [executor.submit(refresh, x) for x in batch]
+                for item, future in zip(batch, futures, strict=True):
+                    try:
+                        future.result()
+                        refreshed = refreshed + 1
+                    except Exception as e:  # noqa: BLE001
+                        description = (
+                            f"{Icons.WARNING} Could not refresh: "
+                            f"{item.title} | Reason: {e!s} | Skipping..."
+                        )
+                        PlexUtilLogger.get_logger().warning(description)
+
+        return refreshed
+
+    @staticmethod
+    def get_song_dto(track: Track) -> SongDTO:
+        """
+        Maps a Track to a SongDTO
+
+        Args:
+            track (Track): The Track to map
+        Returns:
+            SongDTO: The Track mapped to a SongDTO
         Raises:
-            PlexMediaMissingError: if SongDTO does not match any of the Tracks
             UnexpectedNamingPatternError: If file does not
             follow Artist - Title pattern
         """
-        for track in tracks:
-            dto = PlexOps.__resolve_track_name(track=track)
-            artist = dto.artist
-            title = dto.title
-            if artist == song_dto.artist and title == song_dto.title:
-                return track
-        raise PlexMediaMissingError
+        return PlexOps.__resolve_track_name(track=track)
 
     @staticmethod
     def __resolve_track_name(track: Track) -> SongDTO:
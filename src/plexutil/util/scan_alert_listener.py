@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from plexapi.alert import AlertListener
+
+from plexutil.plex_util_logger import PlexUtilLogger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from plexapi.server import PlexServer
+    from websocket import WebSocketApp
+
+
+class ScanAlertListener(AlertListener):
+    def __init__(
+        self,
+        plex_server: PlexServer,
+        callback: Callable[[dict], None],
+        callback_error: Callable[[Exception], None],
+    ) -> None:
+        """
+        AlertListener that can be stopped at any time, including before
+        its websocket has connected: a stop requested early closes the
+        websocket as soon as it opens, the thread never lingers
+
+        Args:
+            plex_server (PlexServer): The server to listen to
+            callback (Callable[[dict], None]): Receives every notification
+            callback_error (Callable[[Exception], None]): Receives errors
+        """
+        super().__init__(
+            plex_server, callback=callback, callbackError=callback_error
+        )
+        self.stopped = threading.Event()
+        self.app: WebSocketApp | None = None
+
+    def run(self) -> None:
+        try:
+            import websocket  # noqa: PLC0415
+        except ImportError as e:
+            self._onError(e)
+            return
+
+        url = self._server.url(self.key, includeToken=True).replace(
+            "http", "ws"
+        )
+        self.app = websocket.WebSocketApp(
+            url,
+            on_open=self.on_open,
+            on_message=self._onMessage,
+            on_error=self._onError,
+            socket=self._socket,
+        )
+        if not self.stopped.is_set():
+            self.app.run_forever()
+        description = "Notification stream closed"
+        PlexUtilLogger.get_logger().debug(description)
+
+    def on_open(self, app: WebSocketApp) -> None:
+        """
+        Websocket open callback, closes it if a stop came in meanwhile
+
+        Args:
+            app (WebSocketApp): The opened websocket
+
+        Returns:
+            None: This method does not return a value
+        """
+        if self.stopped.is_set():
+            app.close()
+
+    def stop(self) -> None:
+        """
+        Stops listening, whether the websocket is connected or not
+
+        Returns:
+            None: This method does not return a value
+        """
+        self.stopped.set()
+        app = self.app
+        if app is not None:
+            app.close()
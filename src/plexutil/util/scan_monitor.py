@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from plexutil.plex_util_logger import PlexUtilLogger
+from plexutil.util.scan_alert_listener import ScanAlertListener
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from plexapi.server import PlexServer
+
+
+class ScanMonitor:
+    # Time allowed for a triggered scan to show up as an activity
+    START_GRACE_SECONDS = 5
+    # Max time between progress callbacks while waiting on events
+    HEARTBEAT_SECONDS = 1
+    # Activities are re-read now and then in case an event was missed
+    RESYNC_SECONDS = 60
+    # Backoff bounds used when no notification stream is available
+    POLL_MIN_SECONDS = 1
+    POLL_MAX_SECONDS = 30
+    # Max time to wait on the notification thread when stopping
+    STOP_TIMEOUT_SECONDS = 5
+
+    def __init__(self, plex_server: PlexServer) -> None:
+        """
+        Tracks the scanning/updating activities of a Plex Server
+        from its notification stream, falling back to polling
+        the activities with exponential backoff when the stream
+        is unavailable
+
+        Args:
+            plex_server (PlexServer): The server to monitor
+        """
+        self.plex_server = plex_server
+        self.activities: dict[str, str] = {}
+        self.is_activity_seen = False
+        self.is_stream_failed = False
+        self.listener: ScanAlertListener | None = None
+        self.lock = threading.Lock()
+        self.changed = threading.Event()
+
+    @staticmethod
+    def is_scan_activity(title: str) -> bool:
+        """
+        Whether an activity title describes a scan/update of a Library
+
+        Args:
+            title (str): The activity title
+
+        Returns:
+            bool: Is this a scan/update activity
+        """
+        title = (title or "").lower()
+        return "updating" in title or "scanning" in title
+
+    def start(self) -> None:
+        """
+        Starts listening for activity notifications
+        To be called before triggering a scan, so no event is missed
+
+        Returns:
+            None: This method does not return a value
+        """
+        self.sync()
+        try:
+            self.listener = ScanAlertListener(
+                plex_server=self.plex_server,
+                callback=self.on_alert,
+                callback_error=self.on_alert_error,
+            )
+            self.listener.start()
+        except Exception as e:  # noqa: BLE001
+            description = f"Notification stream unavailable: {e!s}"
+            PlexUtilLogger.get_logger().debug(description)
+            self.is_stream_failed = True
+
+    def stop(self) -> None:
+        """
+        Stops listening for activity notifications
+
+        Returns:
+            None: This method does not return a value
+        """
+        listener = self.listener
+        self.listener = None
+        if listener is None:
+            return
+        # Safe before the websocket connects, it closes once open
+        listener.stop()
+        listener.join(timeout=ScanMonitor.STOP_TIMEOUT_SECONDS)
+        if listener.is_alive():
+            description = "Notification thread still closing, left behind"
+            PlexUtilLogger.get_logger().debug(description)
+
+    def sync(self) -> None:
+        """
+        Replaces the tracked activities with the ones currently
+        reported by the server
+
+        Returns:
+            None: This method does not return a value
+        """
+        activities = {
+            x.uuid: ScanMonitor.__describe(x.title, x.subtitle, x.progress)
+            for x in self.plex_server.activities
+            if ScanMonitor.is_scan_activity(x.title)
+        }
+        with self.lock:
+            self.activities = activities
+            self.is_activity_seen = self.is_activity_seen or bool(activities)
+        self.changed.set()
+
+    def on_alert(self, data: dict) -> None:
+        """
+        Notification stream callback, tracks activity start/update/end
+
+        Args:
+            data (dict): A NotificationContainer sent by the server
+
+        Returns:
+            None: This method does not return a value
+        """
+        if data.get("type") != "activity":
+            return
+
+        for notification in data.get("ActivityNotification", []):
+            activity = notification.get("Activity", {})
+            title = activity.get("title", "")
+            if not ScanMonitor.is_scan_activity(title):
+                continue
+
+            uuid = notification.get("uuid") or activity.get("uuid")
+            with self.lock:
+                if notification.get("event") == "ended":
+                    self.activities.pop(uuid, None)
+                else:
+                    self.activities[uuid] = ScanMonitor.__describe(
+                        title,
+                        activity.get("subtitle", ""),
+                        activity.get("progress"),
+                    )
+                self.is_activity_seen = True
+        self.changed.set()
+
+    def on_alert_error(self, error: Exception) -> None:
+        """
+        Notification stream error callback, switches to polling
+
+        Args:
+            error (Exception): The error raised by the stream
+
+        Returns:
+            None: This method does not return a value
+        """
+        description = f"Notification stream error: {error!s}"
+        PlexUtilLogger.get_logger().debug(description)
+        self.is_stream_failed = True
+        self.changed.set()
+
+    def is_streaming(self) -> bool:
+        """
+        Whether activities are being received from the notification stream
+
+        Returns:
+            bool: Is the notification stream alive
+        """
+        return (
+            not self.is_stream_failed
+            and self.listener is not None
+            and self.listener.is_alive()
+        )
+
+    def wait(self, on_progress: Callable[[str], None]) -> None:
+        """
+        Blocks until no scan/update activity remains on the server
+
+        Args:
+            on_progress (Callable[[str], None]): Receives a description
+            of the running activities whenever they change, and at least
+            every HEARTBEAT_SECONDS while streaming
+
+        Returns:
+            None: This method does not return a value
+        """
+        start = time.monotonic()
+        last_sync = start
+        delay = ScanMonitor.POLL_MIN_SECONDS
+
+        while True:
+            with self.lock:
+                activities = list(self.activities.values())
+                is_activity_seen = self.is_activity_seen
+
+            elapsed = time.monotonic() - start
+            if not activities:
+                if is_activity_seen:
+                    return
+                if elapsed > ScanMonitor.START_GRACE_SECONDS:
+                    # Confirm with the server before giving up on the scan
+                    self.sync()
+                    with self.lock:
+                        if not self.activities:
+                            return
+                    continue
+
+            on_progress(" | ".join(activities))
+
+            if self.is_streaming():
+                self.changed.wait(timeout=ScanMonitor.HEARTBEAT_SECONDS)
+                self.changed.clear()
+                if time.monotonic() - last_sync > ScanMonitor.RESYNC_SECONDS:
+                    self.sync()
+                    last_sync = time.monotonic()
+            else:
+                time.sleep(delay)
+                delay = min(delay * 2, ScanMonitor.POLL_MAX_SECONDS)
+                self.sync()
+
+    @staticmethod
+    def __describe(title: str, subtitle: str, progress: int | None) -> str:
+        description = f"{title} {subtitle or ''}".strip()
+        if progress is not None:
+            description = f"{description} ({progress!s}%)"
+        return description
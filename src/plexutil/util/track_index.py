@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from plexutil.exception.unexpected_naming_pattern_error import (
+    UnexpectedNamingPatternError,
+)
+from plexutil.util.plex_ops import PlexOps
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from plexapi.audio import Track
+
+    from plexutil.dto.song_dto import SongDTO
+
+
+class TrackIndex:
+    def __init__(self, tracks: Iterable[Track]) -> None:
+        """
+        Resolves every Track to a SongDTO in a single pass,
+        keyed by (artist, title)
+        Tracks that don't follow the Artist - Title pattern are collected
+        in unexpected_naming_tracks instead of being indexed
+
+        Args:
+            tracks (Iterable[Track]): The Tracks to index,
+            consumed once so a paged stream is accepted
+        """
+        self.tracks: dict[SongDTO, Track] = {}
+        self.unexpected_naming_tracks: list[Track] = []
+
+        for track in tracks:
+            try:
+                song_dto = PlexOps.get_song_dto(track=track)
+            except UnexpectedNamingPatternError:
+                self.unexpected_naming_tracks.append(track)
+                continue
+            # First occurrence wins, same as a linear scan would
+            self.tracks.setdefault(song_dto, track)
+
+    def get_songs(self) -> list[SongDTO]:
+        """
+        All the indexed Songs
+
+        Returns:
+            list[SongDTO]: The Songs in this index
+        """
+        return list(self.tracks.keys())
+
+    def get_tracks(
+        self, song_dtos: list[SongDTO]
+    ) -> tuple[list[Track], list[SongDTO]]:
+        """
+        Returns the Tracks that match the provided SongDTOs
+
+        Args:
+            song_dtos (list[SongDTO]): The Songs to find
+        Returns:
+            tuple[list[Track], list[SongDTO]]: The found Tracks,
+            and the Songs that did not match any Track
+        """
+        tracks = []
+        missing = []
+        for song_dto in song_dtos:
+            track = self.tracks.get(song_dto)
+            if track is None:
+                missing.append(song_dto)
+            else:
+                tracks.append(track)
+        return tracks, missing
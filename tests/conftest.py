@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from plexutil.plex_util_logger import PlexUtilLogger
+from plexutil.util.scan_monitor import ScanMonitor
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def plex_util_logger(tmp_path_factory: pytest.TempPathFactory) -> None:
+    """
+    Initializes the singleton logger, logging to a temporary directory
+    """
+    log_dir: Path = tmp_path_factory.mktemp("log")
+    log_config = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "regular_file_handler": {
+                "class": "logging.FileHandler",
+                "level": "DEBUG",
+            },
+        },
+        "loggers": {
+            "regular": {
+                "level": "DEBUG",
+                "handlers": ["regular_file_handler"],
+            },
+            "console": {
+                "level": "INFO",
+                "handlers": ["regular_file_handler"],
+            },
+        },
+    }
+    PlexUtilLogger(log_dir, log_config)
+
+
+@pytest.fixture
+def scan_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    No notification stream, scan activities are polled without delay
+    """
+    monkeypatch.setitem(sys.modules, "websocket", None)
+    monkeypatch.setattr(ScanMonitor, "POLL_MIN_SECONDS", 0.01)
+    monkeypatch.setattr(ScanMonitor, "POLL_MAX_SECONDS", 0.01)
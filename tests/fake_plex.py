@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from plexapi.library import MovieSection
+
+from plexutil.dto.bootstrap_paths_dto import BootstrapPathsDTO
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# When the Section was last updated, prior to the tests
+LAST_UPDATED_AT = datetime(2026, 1, 1)  # noqa: DTZ001
+
+
+class FakeMovie:
+    def __init__(self, title: str, location: str, is_changed: bool) -> None:
+        self.title = title
+        self.locations = [location]
+        self.updatedAt = LAST_UPDATED_AT + timedelta(
+            days=1 if is_changed else -1
+        )
+        self.refreshed = 0
+
+    def refresh(self) -> None:
+        self.refreshed = self.refreshed + 1
+
+
+class FakeMovieSection(MovieSection):
+    """
+    Serves items from memory and records the requests it receives,
+    every scan shows up as a single activity on the server
+    """
+
+    def __init__(self, server: FakeServer, title: str) -> None:
+        self._server = server
+        self.title = title
+        self.updatedAt = LAST_UPDATED_AT
+        self.items: list[FakeMovie] = []
+        self.update_paths: list[str | None] = []
+        self.refreshed = 0
+
+    def update(self, path: str | None = None) -> None:  # pyright: ignore # noqa: PGH003
+        self.update_paths.append(path)
+        self._server.scans.append(path)
+
+    def refresh(self) -> None:  # pyright: ignore # noqa: PGH003
+        self.refreshed = self.refreshed + 1
+
+    def search(  # pyright: ignore # noqa: PGH003
+        self,
+        container_start: int = 0,
+        container_size: int = 0,
+        filters: dict | None = None,
+        **kwargs,  # noqa: ANN003, ARG002
+    ) -> list[FakeMovie]:
+        items = self.items
+        updated_since = (filters or {}).get("updatedAt>>")
+        if updated_since:
+            items = [x for x in items if x.updatedAt > updated_since]
+        return items[container_start : container_start + container_size]
+
+    def totalViewSize(self, **kwargs) -> int:  # pyright: ignore # noqa: ANN003, ARG002, N802, PGH003
+        return len(self.items)
+
+
+class FakeLibrary:
+    def __init__(self, sections: list[FakeMovieSection]) -> None:
+        self.plex_sections = sections
+
+    def sections(self) -> list[FakeMovieSection]:
+        return self.plex_sections
+
+    def _invalidateCachedProperties(self) -> None:  # noqa: N802
+        return
+
+
+class FakeServer:
+    """
+    A Linux server whose scans each run for a single activity poll
+    """
+
+    platform = "Linux"
+
+    def __init__(self) -> None:
+        self.scans: list[str | None] = []
+        self.section = FakeMovieSection(server=self, title="Movies")
+        self.library = FakeLibrary([self.section])
+
+    @property
+    def activities(self) -> list[SimpleNamespace]:
+        running = [
+            SimpleNamespace(
+                uuid=str(index),
+                title="Scanning",
+                subtitle=path,
+                progress=None,
+            )
+            for index, path in enumerate(self.scans)
+        ]
+        self.scans = []
+        return running
+
+    def url(self, key: str, includeToken: bool = False) -> str:  # noqa: ARG002, N803
+        return f"http://localhost:32400{key}"
+
+
+def get_bootstrap_paths_dto(tmp_path: Path) -> BootstrapPathsDTO:
+    return BootstrapPathsDTO(
+        auth_dir=tmp_path,
+        log_dir=tmp_path,
+        cache_dir=tmp_path,
+        public_key_dir=tmp_path,
+        private_key_dir=tmp_path,
+        token_dir=tmp_path,
+        server_profiles_dir=tmp_path,
+        account_cache_dir=tmp_path,
+        plexutil_playlists_db_dir=tmp_path,
+    )
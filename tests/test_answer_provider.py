@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+from plexutil.exception.user_error import UserError
+from plexutil.util.answer_provider import AnswerProvider
+
+FIRST_SESSION = "a" * 32
+SECOND_SESSION = "b" * 32
+
+
+def write_log(path: Path, records: list[tuple[str, str, str]]) -> Path:
+    lines = []
+    for session, title, answer in records:
+        record = json.dumps(
+            {"session": session, "title": title, "answer": answer}
+        )
+        lines.append(
+            f"2026-01-01 DEBUG {AnswerProvider.RECORD_PREFIX}{record}\n"
+        )
+    path.write_text("".join(lines), encoding=AnswerProvider.ENCODING)
+    return path
+
+
+@pytest.fixture
+def log(tmp_path: Path) -> Path:
+    return write_log(
+        tmp_path / "2026-1-1.log",
+        [
+            (FIRST_SESSION, "Library Name", "Old Movies"),
+            (FIRST_SESSION, "Language", "en-US"),
+            (SECOND_SESSION, "Library Name", "Movies"),
+            (SECOND_SESSION, "Language", "es-ES"),
+        ],
+    )
+
+
+def test_replays_last_session(log: Path) -> None:
+    answer_provider = AnswerProvider(replay_path=log)
+
+    assert answer_provider.get_answer("Library Name") == "Movies"
+    assert answer_provider.get_answer("Language") == "es-ES"
+    assert answer_provider.get_answer("Library Name") is None
+
+
+def test_replays_chosen_session(log: Path) -> None:
+    replay_path, replay_session = AnswerProvider.parse_replay(
+        f"{log!s}:{FIRST_SESSION}"
+    )
+    answer_provider = AnswerProvider(
+        replay_path=replay_path, replay_session=replay_session
+    )
+
+    assert answer_provider.get_answer("Library Name") == "Old Movies"
+    assert answer_provider.get_answer("Language") == "en-US"
+
+
+def test_unknown_session_is_rejected(log: Path) -> None:
+    with pytest.raises(UserError):
+        AnswerProvider(replay_path=log, replay_session="c" * 32)
+
+
+def test_parse_replay_without_session() -> None:
+    assert AnswerProvider.parse_replay("C:\\logs\\2026-1-1.log") == (
+        Path("C:\\logs\\2026-1-1.log"),
+        None,
+    )
+
+
+def test_precedence_env_then_file_then_replay(
+    log: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    answers = tmp_path / "answers.yaml"
+    answers.write_text(
+        "Library Name: File Movies\nLanguage: fr-FR\n",
+        encoding=AnswerProvider.ENCODING,
+    )
+    monkeypatch.setenv("PLEXUTIL_ANSWER_LIBRARY_NAME", "Env Movies")
+    answer_provider = AnswerProvider(answers_path=answers, replay_path=log)
+
+    assert answer_provider.get_answer("Library Name") == "Env Movies"
+    assert answer_provider.get_answer("Language") == "fr-FR"
+
+    monkeypatch.delenv("PLEXUTIL_ANSWER_LIBRARY_NAME")
+    answer_provider.answers.clear()
+    # Answers given by other sources left the replay untouched
+    assert answer_provider.get_answer("Library Name") == "Movies"
+    assert answer_provider.get_answer("Language") == "es-ES"
+
+
+def test_recorded_answers_carry_the_session(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with caplog.at_level(logging.DEBUG, logger="regular"):
+        AnswerProvider.record(title="Library Name", answer="Movies")
+
+    _, _, record = (
+        caplog.records[-1].getMessage().partition(AnswerProvider.RECORD_PREFIX)
+    )
+    assert json.loads(record) == {
+        "session": AnswerProvider.SESSION_ID,
+        "title": "Library Name",
+        "answer": "Movies",
+    }
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import stat
+import sys
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+from plexapi.myplex import MyPlexAccount, MyPlexResource
+
+from plexutil.util.cached_plex_account import CachedPlexAccount
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ACCOUNT_XML = (
+    '<user authToken="{token}" username="me" scrobbleTypes="">'
+    '<subscription active="0"/><profile/><entitlements/><roles/><services/>'
+    "</user>"
+)
+RESOURCES_XML = (
+    "<MediaContainer>"
+    '<resource name="MyServer" clientIdentifier="abc" provides="server"/>'
+    "</MediaContainer>"
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def requests(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Answers plex.tv from memory, records every request made
+    """
+    requests = []
+
+    def query(account: MyPlexAccount, url: str, *_, **__) -> ET.Element:  # noqa: ANN002, ANN003
+        requests.append(url)
+        if url == MyPlexResource.key:
+            return ET.fromstring(RESOURCES_XML)  # noqa: S314
+        return ET.fromstring(ACCOUNT_XML.format(token=account._token))  # noqa: S314
+
+    monkeypatch.setattr(MyPlexAccount, "query", query)
+    return requests
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(
+        "plexutil.util.cached_plex_account.time",
+        SimpleNamespace(time=clock.time),
+    )
+    return clock
+
+
+def sign_in(token: str, cache_path: Path) -> list[str]:
+    account = CachedPlexAccount(token=token, cache_path=cache_path)
+    return [x.name for x in account.resources()]
+
+
+def test_cache_reused_within_ttl(
+    tmp_path: Path, requests: list[str], clock: FakeClock
+) -> None:
+    cache_path = tmp_path / "account.json"
+
+    assert sign_in("token", cache_path) == ["MyServer"]
+    assert len(requests) == 2
+
+    clock.now += CachedPlexAccount.TTL_SECONDS - 1
+    assert sign_in("token", cache_path) == ["MyServer"]
+    assert len(requests) == 2
+
+
+def test_cache_expires_after_ttl(
+    tmp_path: Path, requests: list[str], clock: FakeClock
+) -> None:
+    cache_path = tmp_path / "account.json"
+    sign_in("token", cache_path)
+
+    clock.now += CachedPlexAccount.TTL_SECONDS
+    sign_in("token", cache_path)
+
+    assert len(requests) == 4
+
+
+def test_cache_from_the_future_is_not_trusted(
+    tmp_path: Path, requests: list[str], clock: FakeClock
+) -> None:
+    cache_path = tmp_path / "account.json"
+    sign_in("token", cache_path)
+
+    # The clock went back
+    clock.now -= 1
+    sign_in("token", cache_path)
+
+    assert len(requests) == 4
+
+
+def test_new_token_starts_afresh(
+    tmp_path: Path, requests: list[str], clock: FakeClock
+) -> None:
+    cache_path = tmp_path / "account.json"
+    sign_in("token", cache_path)
+
+    sign_in("other token", cache_path)
+    assert len(requests) == 4
+
+    # The previous token's cache was replaced
+    clock.now += 1
+    sign_in("token", cache_path)
+    assert len(requests) == 6
+
+
+@pytest.mark.usefixtures("clock")
+def test_invalidate_drops_the_cache(
+    tmp_path: Path, requests: list[str]
+) -> None:
+    cache_path = tmp_path / "account.json"
+    account = CachedPlexAccount(token="token", cache_path=cache_path)
+    account.resources()
+
+    account.invalidate()
+    account.resources()
+
+    assert len(requests) == 3
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+@pytest.mark.usefixtures("requests", "clock")
+def test_cache_is_private(tmp_path: Path) -> None:
+    cache_path = tmp_path / "account.json"
+    sign_in("token", cache_path)
+
+    assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+from plexutil.model.lookup_name_entity import LookupNameEntity
+from plexutil.service.db_manager import (
+    db_manager,
+    get_chunk_size,
+    load_lookup_names,
+    max_variables,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_max_variables_matches_connection_limit() -> None:
+    connection = sqlite3.connect(":memory:")
+    try:
+        limit = connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    finally:
+        connection.close()
+
+    assert max_variables == limit
+    assert get_chunk_size(3) == limit // 3
+
+
+def test_lookup_names_beyond_variable_limit(tmp_path: Path) -> None:
+    names = [f"Song {x!s}" for x in range(max_variables + 5)]
+
+    with db_manager(tmp_path / "lookup.db", []) as db:
+        load_lookup_names(db, names)
+        assert LookupNameEntity.select().count() == len(names)
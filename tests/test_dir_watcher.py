@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from plexutil.core.movie_library import MovieLibrary
+from plexutil.enums.user_request import UserRequest
+from plexutil.exception.library_op_error import LibraryOpError
+from plexutil.util.dir_watcher import DirWatcher
+from tests.fake_plex import FakeServer, get_bootstrap_paths_dto
+
+DEBOUNCE = DirWatcher.DEBOUNCE_SECONDS
+MAX_DELAY = DirWatcher.MAX_DELAY_SECONDS
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def get_library(server: FakeServer, locations: list[Path]) -> MovieLibrary:
+    return MovieLibrary(
+        plex_server=server,  # pyright: ignore # noqa: PGH003
+        user_request=UserRequest.WATCH,
+        bootstrap_paths_dto=get_bootstrap_paths_dto(locations[0]),
+        locations=locations,
+        name="Movies",
+    )
+
+
+def age(root: Path) -> None:
+    """
+    Backdates every mtime under root, as for a library left untouched
+    """
+    past = 1_000_000_000
+    for directory, _, files in os.walk(root):
+        for name in files:
+            os.utime(Path(directory) / name, (past, past))
+        os.utime(directory, (past, past))
+
+
+@pytest.fixture
+def root(tmp_path: Path) -> Path:
+    root = tmp_path / "movies"
+    (root / "Movie A").mkdir(parents=True)
+    (root / "Movie A" / "a.mkv").write_bytes(b"a")
+    (root / "Movie B").mkdir()
+    (root / "Movie B" / "b.mkv").write_bytes(b"b")
+    return root
+
+
+def test_batches_changed_directory_once_quiet(root: Path) -> None:
+    clock = FakeClock()
+    watcher = DirWatcher(roots=[root], clock=clock)
+
+    (root / "Movie A" / "a.srt").write_bytes(b"sub")
+    assert watcher.poll() == []
+
+    clock.now = DEBOUNCE - 1
+    assert watcher.poll() == []
+
+    clock.now = DEBOUNCE
+    assert watcher.poll() == [root / "Movie A"]
+    assert watcher.poll() == []
+
+
+def test_new_directory_tree_is_reported_as_its_top(root: Path) -> None:
+    clock = FakeClock()
+    watcher = DirWatcher(roots=[root], clock=clock)
+
+    season = root / "Show" / "Season 1"
+    season.mkdir(parents=True)
+    (season / "e1.mkv").write_bytes(b"e1")
+    watcher.poll()
+
+    clock.now = DEBOUNCE
+    assert watcher.poll() == [root / "Show"]
+
+
+def test_removed_directory_is_reported_as_its_parent(root: Path) -> None:
+    clock = FakeClock()
+    watcher = DirWatcher(roots=[root], clock=clock)
+
+    (root / "Movie B" / "b.mkv").unlink()
+    (root / "Movie B").rmdir()
+    watcher.poll()
+
+    clock.now = DEBOUNCE
+    assert watcher.poll() == [root]
+
+
+def test_growing_file_keeps_directory_pending(root: Path) -> None:
+    clock = FakeClock()
+    age(root)
+    watcher = DirWatcher(roots=[root], clock=clock)
+
+    part = root / "Movie A" / "a.part"
+    part.write_bytes(b"x")
+    assert watcher.poll() == []
+
+    clock.now = DEBOUNCE - 1
+    with part.open("ab") as file:
+        file.write(b"more")
+    # Growing in place leaves the directory mtime untouched
+    age(root / "Movie A")
+    assert watcher.poll() == []
+
+    clock.now = DEBOUNCE + 1
+    assert watcher.poll() == []
+
+    clock.now = 2 * DEBOUNCE - 1
+    assert watcher.poll() == [root / "Movie A"]
+
+
+def test_busy_directory_is_batched_after_max_delay(root: Path) -> None:
+    clock = FakeClock()
+    watcher = DirWatcher(roots=[root], clock=clock)
+
+    step = DEBOUNCE / 2
+    while clock.now < MAX_DELAY:
+        (root / "Movie A" / f"{clock.now!s}.part").write_bytes(b"x")
+        assert watcher.poll() == []
+        clock.now += step
+
+    (root / "Movie A" / "last.part").write_bytes(b"x")
+    assert watcher.poll() == [root / "Movie A"]
+
+
+def test_quiet_directories_are_not_listed(
+    root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = FakeClock()
+    age(root)
+    watcher = DirWatcher(roots=[root], clock=clock)
+
+    listed = []
+    read_entries = DirWatcher.read_entries
+
+    def spy(directory: Path) -> dict:
+        listed.append(directory)
+        return read_entries(directory)
+
+    monkeypatch.setattr(DirWatcher, "read_entries", staticmethod(spy))
+
+    assert watcher.poll() == []
+    assert listed == []
+
+    (root / "Movie B" / "b.srt").write_bytes(b"sub")
+    watcher.poll()
+    assert listed == [root / "Movie B"]
+
+
+@pytest.mark.usefixtures("scan_polling")
+def test_watch_scans_changed_directories(
+    root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    server = FakeServer()
+    library = get_library(server, locations=[root])
+    stop_event = threading.Event()
+
+    # Changes are made once the initial snapshot is taken
+    started = threading.Event()
+    run = DirWatcher.run
+
+    def spy(watcher: DirWatcher, **kwargs: object) -> None:
+        started.set()
+        run(watcher, **kwargs)  # pyright: ignore # noqa: PGH003
+
+    monkeypatch.setattr(DirWatcher, "run", spy)
+    thread = threading.Thread(
+        target=library.watch,
+        kwargs={
+            "stop_event": stop_event,
+            "poll_interval_seconds": 0.05,
+            "debounce_seconds": 0.5,
+            "max_delay_seconds": 5,
+        },
+    )
+    thread.start()
+    try:
+        assert started.wait(timeout=10)
+        (root / "Movie C").mkdir()
+        (root / "Movie C" / "c.mkv").write_bytes(b"c")
+        (root / "Movie A" / "a.srt").write_bytes(b"sub")
+        deadline = time.monotonic() + 10
+        while len(server.section.update_paths) < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+    finally:
+        stop_event.set()
+        thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    # One path-scoped scan per changed directory, not the whole Library
+    assert sorted(server.section.update_paths) == [
+        (root / "Movie A").as_posix(),
+        (root / "Movie C").as_posix(),
+    ]
+    assert server.section.refreshed == 0
+
+
+def test_watch_requires_local_locations(tmp_path: Path) -> None:
+    library = get_library(FakeServer(), locations=[tmp_path / "missing"])
+    with pytest.raises(LibraryOpError):
+        library.watch(stop_event=threading.Event())
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from plexutil.dto.server_profile_dto import ServerProfileDTO
+from plexutil.util.file_importer import FileImporter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOG_CONFIG = """
+version: 1
+loggers:
+  regular:
+    level: DEBUG
+"""
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    config_path = tmp_path / "log_config.yaml"
+    config_path.write_text(LOG_CONFIG, encoding=FileImporter.encoding)
+    return config_path
+
+
+def read_without_yaml(
+    config_path: Path, cache_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> dict:
+    with monkeypatch.context() as context:
+        # Any attempt to parse the YAML fails
+        context.setitem(sys.modules, "yaml", None)
+        return FileImporter.get_logging_config(config_path, cache_path)
+
+
+def test_cache_serves_unchanged_config(
+    config_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_path = tmp_path / "log_config.json"
+
+    config = FileImporter.get_logging_config(config_path, cache_path)
+
+    assert config["loggers"]["regular"]["level"] == "DEBUG"
+    assert read_without_yaml(config_path, cache_path, monkeypatch) == config
+
+
+def test_cache_invalidated_by_size(
+    config_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_path = tmp_path / "log_config.json"
+    FileImporter.get_logging_config(config_path, cache_path)
+    config_stat = config_path.stat()
+
+    config_path.write_text(
+        LOG_CONFIG.replace("DEBUG", "WARNING"),
+        encoding=FileImporter.encoding,
+    )
+    # Same mtime, only the size tells the change apart
+    os.utime(
+        config_path, ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns)
+    )
+
+    config = FileImporter.get_logging_config(config_path, cache_path)
+    assert config["loggers"]["regular"]["level"] == "WARNING"
+    assert read_without_yaml(config_path, cache_path, monkeypatch) == config
+
+
+def test_cache_invalidated_by_mtime(
+    config_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_path = tmp_path / "log_config.json"
+    FileImporter.get_logging_config(config_path, cache_path)
+    config_stat = config_path.stat()
+
+    # Same size, only the mtime tells the change apart
+    config_path.write_text(
+        LOG_CONFIG.replace("DEBUG", "ERROR"), encoding=FileImporter.encoding
+    )
+    os.utime(
+        config_path,
+        ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns + 10**9),
+    )
+    assert config_path.stat().st_size == config_stat.st_size
+
+    config = FileImporter.get_logging_config(config_path, cache_path)
+    assert config["loggers"]["regular"]["level"] == "ERROR"
+    assert read_without_yaml(config_path, cache_path, monkeypatch) == config
+
+
+def test_corrupted_cache_is_rebuilt(config_path: Path, tmp_path: Path) -> None:
+    cache_path = tmp_path / "log_config.json"
+    cache_path.write_text("{not json", encoding=FileImporter.encoding)
+
+    config = FileImporter.get_logging_config(config_path, cache_path)
+
+    assert config["version"] == 1
+    with cache_path.open(encoding=FileImporter.encoding) as file:
+        assert json.load(file)["config"] == config
+
+
+@pytest.fixture
+def log_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # ctime cannot be backdated, every log counts as expired instead
+    monkeypatch.setattr(FileImporter, "LOG_RETENTION_DAYS", -1)
+    log_dir = tmp_path / "log"
+    log_dir.mkdir()
+    return log_dir
+
+
+def test_sweep_deletes_expired_logs_and_marks(
+    log_dir: Path, tmp_path: Path
+) -> None:
+    marker_path = tmp_path / ".last_sweep"
+    (log_dir / "2026-1-1.log").write_text("", encoding=FileImporter.encoding)
+    (log_dir / "archive").mkdir()
+
+    FileImporter.sweep_logs(log_dir, marker_path)
+
+    assert [x.name for x in log_dir.iterdir()] == ["archive"]
+    assert marker_path.exists()
+
+
+def test_sweep_runs_once_per_interval(log_dir: Path, tmp_path: Path) -> None:
+    marker_path = tmp_path / ".last_sweep"
+    marker_path.touch()
+    log_path = log_dir / "2026-1-1.log"
+    log_path.write_text("", encoding=FileImporter.encoding)
+
+    FileImporter.sweep_logs(log_dir, marker_path)
+    assert log_path.exists()
+
+    hours = FileImporter.LOG_SWEEP_INTERVAL_HOURS + 1
+    past = time.time() - hours * 3600
+    os.utime(marker_path, (past, past))
+
+    FileImporter.sweep_logs(log_dir, marker_path)
+    assert not log_path.exists()
+    assert marker_path.stat().st_mtime > past
+
+
+def test_sweep_runs_on_marker_in_future(log_dir: Path, tmp_path: Path) -> None:
+    marker_path = tmp_path / ".last_sweep"
+    marker_path.touch()
+    future = time.time() + 3600
+    os.utime(marker_path, (future, future))
+    log_path = log_dir / "2026-1-1.log"
+    log_path.write_text("", encoding=FileImporter.encoding)
+
+    FileImporter.sweep_logs(log_dir, marker_path)
+
+    assert not log_path.exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_server_profiles_are_private(tmp_path: Path) -> None:
+    location = tmp_path / "servers.json"
+    # Left readable by a previous version
+    location.write_text('{"servers": []}', encoding=FileImporter.encoding)
+    location.chmod(0o644)
+    profile = ServerProfileDTO(
+        name="MyServer",
+        machine_identifier="abc",
+        base_url="http://localhost:32400",
+        token="secret",
+    )
+
+    FileImporter.save_server_profile(location, profile)
+
+    assert stat.S_IMODE(location.stat().st_mode) == 0o600
+    assert FileImporter.get_server_profiles(location) == [profile]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_token_is_private(tmp_path: Path) -> None:
+    location = tmp_path / "token.json"
+
+    FileImporter.save_jwt(location, token="secret", client_dentifier="id")
+
+    assert stat.S_IMODE(location.stat().st_mode) == 0o600
+    assert FileImporter.get_jwt(location) == ("secret", "id")
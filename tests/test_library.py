@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from plexutil.core.movie_library import MovieLibrary
+from plexutil.enums.refresh_mode import RefreshMode
+from plexutil.enums.user_request import UserRequest
+from plexutil.exception.library_op_error import LibraryOpError
+from tests.fake_plex import FakeMovie, FakeServer, get_bootstrap_paths_dto
+
+LOCATION = Path("/storage/movies")
+
+
+pytestmark = pytest.mark.usefixtures("scan_polling")
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    server = FakeServer()
+    server.section.items = [
+        FakeMovie("A", f"{LOCATION!s}/Movie A/a.mkv", is_changed=True),
+        FakeMovie("B", f"{LOCATION!s}/Movie B/b.mkv", is_changed=True),
+        FakeMovie("B2", f"{LOCATION!s}/Movie B2/b2.mkv", is_changed=True),
+        FakeMovie("A old", f"{LOCATION!s}/Movie A/old.mkv", is_changed=False),
+    ]
+    return server
+
+
+def get_library(server: FakeServer, tmp_path: Path) -> MovieLibrary:
+    return MovieLibrary(
+        plex_server=server,  # pyright: ignore # noqa: PGH003
+        user_request=UserRequest.UPDATE,
+        bootstrap_paths_dto=get_bootstrap_paths_dto(tmp_path),
+        locations=[LOCATION],
+        name="Movies",
+    )
+
+
+def get_refreshed(server: FakeServer) -> list[str]:
+    return [x.title for x in server.section.items if x.refreshed]
+
+
+def test_path_update_refreshes_changed_items_under_paths(
+    server: FakeServer, tmp_path: Path
+) -> None:
+    library = get_library(server, tmp_path)
+    library.refresh_mode = RefreshMode.CHANGED
+
+    library.update(paths=[Path("Movie B")])
+
+    assert server.section.update_paths == [f"{LOCATION!s}/Movie B"]
+    # Movie B2 shares the prefix but is another directory
+    assert get_refreshed(server) == ["B"]
+    assert server.section.refreshed == 0
+
+
+def test_path_update_refreshes_all_items_under_paths(
+    server: FakeServer, tmp_path: Path
+) -> None:
+    library = get_library(server, tmp_path)
+    library.refresh_mode = RefreshMode.ALL
+
+    library.update(paths=[LOCATION / "Movie A"])
+
+    assert get_refreshed(server) == ["A", "A old"]
+
+
+def test_update_without_paths_refreshes_section(
+    server: FakeServer, tmp_path: Path
+) -> None:
+    library = get_library(server, tmp_path)
+    library.refresh_mode = RefreshMode.SECTION
+
+    library.update()
+
+    assert server.section.update_paths == [None]
+    assert server.section.refreshed == 1
+    assert get_refreshed(server) == []
+
+
+def test_update_rejects_paths_outside_locations(
+    server: FakeServer, tmp_path: Path
+) -> None:
+    library = get_library(server, tmp_path)
+
+    with pytest.raises(LibraryOpError):
+        library.update(paths=[Path("Movie A/../../elsewhere")])
+    assert server.section.update_paths == []
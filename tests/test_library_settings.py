@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+from plexapi.exceptions import BadRequest
+
+from plexutil.core.prompt import Prompt
+from plexutil.dto.dropdown_item_dto import DropdownItemDTO
+from plexutil.dto.library_setting_dto import LibrarySettingDTO
+from plexutil.util.plex_ops import PlexOps
+
+
+def get_setting(
+    name: str, value: bool | int | str, enum_values: dict | None = None
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=name,
+        value=value,
+        type="bool" if isinstance(value, bool) else "int",
+        enumValues=enum_values,
+    )
+
+
+class FakeSection:
+    """
+    Records the prefs edits, rejects any edit holding a rejected key
+    """
+
+    def __init__(self, rejected: set[str] | None = None) -> None:
+        self.title = "Movies"
+        self.rejected = rejected or set()
+        self.edits: list[dict] = []
+
+    def edit(self, **kwargs: bool | int | str) -> None:
+        self.edits.append(kwargs)
+        if any(f"prefs[{x}]" in kwargs for x in self.rejected):
+            description = "400 Bad Request"
+            raise BadRequest(description)
+
+
+@pytest.fixture
+def server_settings() -> dict[str, SimpleNamespace]:
+    return {
+        "enableCinemaTrailers": get_setting("enableCinemaTrailers", True),
+        "episodeSort": get_setting("episodeSort", -1, {-1: "", 0: "", 1: ""}),
+        "showOrdering": get_setting("showOrdering", 0, {0: "", 1: ""}),
+    }
+
+
+def test_unchanged_settings_are_not_sent(
+    server_settings: dict[str, SimpleNamespace],
+) -> None:
+    section = FakeSection()
+
+    applied = PlexOps.apply_library_settings(
+        section=section,  # pyright: ignore # noqa: PGH003
+        plan={"enableCinemaTrailers": True, "episodeSort": 1},
+        server_settings=server_settings,  # pyright: ignore # noqa: PGH003
+    )
+
+    assert applied == {"episodeSort": 1}
+    assert section.edits == [{"prefs[episodeSort]": 1}]
+
+
+def test_nothing_sent_without_changes(
+    server_settings: dict[str, SimpleNamespace],
+) -> None:
+    section = FakeSection()
+
+    applied = PlexOps.apply_library_settings(
+        section=section,  # pyright: ignore # noqa: PGH003
+        plan={"enableCinemaTrailers": 1, "episodeSort": -1},
+        server_settings=server_settings,  # pyright: ignore # noqa: PGH003
+    )
+
+    assert applied == {}
+    assert section.edits == []
+
+
+def test_rejected_batch_is_applied_one_by_one(
+    server_settings: dict[str, SimpleNamespace],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    section = FakeSection(rejected={"showOrdering"})
+
+    with caplog.at_level(logging.WARNING, logger="regular"):
+        applied = PlexOps.apply_library_settings(
+            section=section,  # pyright: ignore # noqa: PGH003
+            plan={
+                "enableCinemaTrailers": False,
+                "episodeSort": 0,
+                "showOrdering": 1,
+            },
+            server_settings=server_settings,  # pyright: ignore # noqa: PGH003
+        )
+
+    assert applied == {"enableCinemaTrailers": False, "episodeSort": 0}
+    assert section.edits == [
+        {
+            "prefs[enableCinemaTrailers]": False,
+            "prefs[episodeSort]": 0,
+            "prefs[showOrdering]": 1,
+        },
+        {"prefs[enableCinemaTrailers]": False},
+        {"prefs[episodeSort]": 0},
+        {"prefs[showOrdering]": 1},
+    ]
+    assert "Skipping -> showOrdering:1" in caplog.text
+
+
+def test_invalid_and_unknown_settings_are_not_sent(
+    server_settings: dict[str, SimpleNamespace],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    section = FakeSection()
+
+    with caplog.at_level(logging.WARNING, logger="regular"):
+        applied = PlexOps.apply_library_settings(
+            section=section,  # pyright: ignore # noqa: PGH003
+            plan={"episodeSort": 7, "missing": 1, "showOrdering": 1},
+            server_settings=server_settings,  # pyright: ignore # noqa: PGH003
+        )
+
+    assert applied == {"showOrdering": 1}
+    assert "Skipping -> episodeSort:7" in caplog.text
+    assert "Skipping -> missing:1" in caplog.text
+
+
+def test_plan_prompts_with_server_values(
+    server_settings: dict[str, SimpleNamespace],
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    prompted = []
+
+    def confirm(library_setting: LibrarySettingDTO) -> LibrarySettingDTO:
+        prompted.append(library_setting)
+        if library_setting.is_dropdown:
+            default = next(x for x in library_setting.dropdown if x.is_default)
+            return replace(library_setting, user_response=default.value)
+        return library_setting
+
+    monkeypatch.setattr(
+        Prompt, "confirm_library_setting", staticmethod(confirm)
+    )
+    settings = [
+        LibrarySettingDTO(
+            name="episodeSort",
+            is_dropdown=True,
+            dropdown=[
+                DropdownItemDTO(display_name="Oldest", value=0),
+                DropdownItemDTO(display_name="Default", value=-1),
+            ],
+            is_from_server=True,
+        ),
+        LibrarySettingDTO(name="missing", is_toggle=True, is_from_server=True),
+        LibrarySettingDTO(name="enableBIFGeneration", user_response=1),
+    ]
+
+    with caplog.at_level(logging.WARNING, logger="regular"):
+        plan = PlexOps.plan_library_settings(
+            settings=settings,
+            server_settings=server_settings,  # pyright: ignore # noqa: PGH003
+        )
+
+    # The server value is offered as the dropdown default
+    assert plan == {"episodeSort": -1, "enableBIFGeneration": 1}
+    assert [x.name for x in prompted] == ["episodeSort", "enableBIFGeneration"]
+    assert "Skipping -> missing" in caplog.text
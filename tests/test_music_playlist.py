@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from plexutil.core.library_factory import LibraryFactory
+from plexutil.core.music_playlist import MusicPlaylist
+from plexutil.dto.bootstrap_paths_dto import BootstrapPathsDTO
+from plexutil.enums.user_request import UserRequest
+from plexutil.service.music_playlist_service import MusicPlaylistService
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+class FakeTrack:
+    def __init__(self, name: str) -> None:
+        self.title = name
+        self.originalTitle = None
+        self.grandparentTitle = "Artist"
+        self.locations = [f"/music/Artist - {name}.flac"]
+
+
+class FakePlaylist:
+    def __init__(self, title: str, is_broken: bool = False) -> None:
+        self.title = title
+        self.is_broken = is_broken
+
+    def items(self) -> list[FakeTrack]:
+        if self.is_broken:
+            description = "Connection reset"
+            raise ConnectionError(description)
+        return [FakeTrack(f"{self.title} Song")]
+
+
+class FakeSection:
+    def __init__(self, playlists: list[FakePlaylist]) -> None:
+        self.plex_playlists = playlists
+
+    def playlists(self) -> list[FakePlaylist]:
+        return self.plex_playlists
+
+
+class StubMusicPlaylist(MusicPlaylist):
+    def __init__(self, tmp_path: Path, section: FakeSection, **kwargs) -> None:  # noqa: ANN003
+        super().__init__(
+            plex_server=None,  # pyright: ignore # noqa: PGH003
+            user_request=UserRequest.DOWNLOAD,
+            bootstrap_paths_dto=get_bootstrap_paths_dto(tmp_path),
+            **kwargs,
+        )
+        self.section = section
+
+    def get_section(self) -> FakeSection:  # pyright: ignore # noqa: PGH003
+        return self.section
+
+
+def get_bootstrap_paths_dto(tmp_path: Path) -> BootstrapPathsDTO:
+    return BootstrapPathsDTO(
+        auth_dir=tmp_path,
+        log_dir=tmp_path,
+        cache_dir=tmp_path,
+        public_key_dir=tmp_path,
+        private_key_dir=tmp_path,
+        token_dir=tmp_path,
+        server_profiles_dir=tmp_path,
+        account_cache_dir=tmp_path,
+        plexutil_playlists_db_dir=tmp_path / "playlists.db",
+    )
+
+
+def test_download_reports_failed_playlists(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    section = FakeSection(
+        [
+            FakePlaylist("Chill"),
+            FakePlaylist("Broken", is_broken=True),
+            FakePlaylist("Gym"),
+        ]
+    )
+    music_playlist = StubMusicPlaylist(tmp_path=tmp_path, section=section)
+
+    with caplog.at_level(logging.INFO, logger="console"):
+        music_playlist.download()
+
+    service = MusicPlaylistService(tmp_path / "playlists.db")
+    assert sorted(x.name for x in service.get_all()) == ["Chill", "Gym"]
+    assert "Downloaded 2 playlists" in caplog.text
+    assert "1 playlists could not be downloaded" in caplog.text
+    assert "-> Broken" in caplog.text
+
+
+def test_download_respects_max_workers(tmp_path: Path) -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class SlowPlaylist(FakePlaylist):
+        def items(self) -> list[FakeTrack]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.05)
+            with lock:
+                active -= 1
+            return super().items()
+
+    section = FakeSection([SlowPlaylist(f"P{x!s}") for x in range(8)])
+    music_playlist = StubMusicPlaylist(
+        tmp_path=tmp_path, section=section, max_workers=2
+    )
+    music_playlist.download()
+
+    assert peak <= 2
+
+
+def test_factory_passes_max_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        "plexutil.core.prompt.Prompt.confirm_library",
+        lambda libraries, **_: libraries[-1],
+    )
+    library = LibraryFactory.get(
+        plex_server=None,  # pyright: ignore # noqa: PGH003
+        user_request=UserRequest.DOWNLOAD,
+        bootstrap_paths_dto=get_bootstrap_paths_dto(tmp_path),
+        max_workers=3,
+    )
+    assert isinstance(library, MusicPlaylist)
+    assert library.max_workers == 3
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from plexutil.core.prompt import Prompt
+from plexutil.enums.library_type import LibraryType
+
+
+class SlowSection:
+    """
+    Answers the count request once released
+    """
+
+    def __init__(self, uuid: str, size: int) -> None:
+        self.uuid = uuid
+        self.title = uuid
+        self.size = size
+        self.released = threading.Event()
+        self.requests = 0
+
+    def totalViewSize(self, **kwargs) -> int:  # noqa: ANN003, ARG002, N802
+        self.requests = self.requests + 1
+        self.released.wait()
+        return self.size
+
+
+@pytest.fixture(autouse=True)
+def section_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Prompt, "section_counts", {})
+    monkeypatch.setattr(Prompt, "section_counts_pending", set())
+
+
+def wait_for_count(section: SlowSection) -> dict[str, int | None]:
+    deadline = time.monotonic() + 10
+    while True:
+        counts = Prompt.get_section_counts(
+            sections=[section],  # pyright: ignore # noqa: PGH003
+            library_type=LibraryType.MOVIE,
+        )
+        if counts[section.uuid] is not None:
+            return counts
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_counts_never_block() -> None:
+    section = SlowSection(uuid="movies", size=42)
+
+    start = time.monotonic()
+    counts = Prompt.get_section_counts(
+        sections=[section],  # pyright: ignore # noqa: PGH003
+        library_type=LibraryType.MOVIE,
+    )
+
+    assert counts == {"movies": None}
+    assert time.monotonic() - start < 1
+    counting = [x for x in threading.enumerate() if x.name == "count-movies"]
+    assert counting
+    assert all(x.daemon for x in counting)
+
+    section.released.set()
+    assert wait_for_count(section) == {"movies": 42}
+    # A single request, the pending count is not started twice
+    assert section.requests == 1
+
+
+def test_failed_count_is_retried() -> None:
+    section = SlowSection(uuid="movies", size=7)
+    section.released.set()
+    failures = SimpleNamespace(left=1)
+    total_view_size = section.totalViewSize
+
+    def flaky(**kwargs: object) -> int:
+        if failures.left:
+            failures.left = failures.left - 1
+            description = "Connection reset"
+            raise ConnectionError(description)
+        return total_view_size(**kwargs)
+
+    section.totalViewSize = flaky  # pyright: ignore # noqa: PGH003
+
+    assert wait_for_count(section) == {"movies": 7}
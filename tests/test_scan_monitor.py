@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import sys
+import threading
+import types
+
+import pytest
+
+from plexutil.util.scan_monitor import ScanMonitor
+
+# Time the fake websocket takes to connect
+CONNECT_SECONDS = 0.2
+
+
+class FakeWebSocketApp:
+    """
+    Mimics websocket-client: run_forever resets any earlier close,
+    connects, calls on_open and blocks until closed
+    """
+
+    def __init__(self, url: str, on_open, **kwargs) -> None:  # noqa: ANN001, ANN003, ARG002
+        self.url = url
+        self.on_open = on_open
+        self.closed = threading.Event()
+
+    def run_forever(self) -> None:
+        self.closed.clear()
+        threading.Event().wait(CONNECT_SECONDS)
+        self.on_open(self)
+        self.closed.wait()
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+class FakeServer:
+    activities: tuple = ()
+
+    def url(self, key: str, includeToken: bool = False) -> str:  # noqa: ARG002, N803
+        return f"http://localhost:32400{key}"
+
+
+@pytest.fixture(autouse=True)
+def websocket(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("websocket")
+    module.WebSocketApp = FakeWebSocketApp  # pyright: ignore # noqa: PGH003
+    monkeypatch.setitem(sys.modules, "websocket", module)
+
+
+def test_stop_before_connected_ends_listener() -> None:
+    scan_monitor = ScanMonitor(plex_server=FakeServer())  # pyright: ignore # noqa: PGH003
+    scan_monitor.start()
+    listener = scan_monitor.listener
+    assert listener is not None
+
+    scan_monitor.stop()
+
+    assert not listener.is_alive()
+
+
+def test_stop_after_connected_ends_listener() -> None:
+    scan_monitor = ScanMonitor(plex_server=FakeServer())  # pyright: ignore # noqa: PGH003
+    scan_monitor.start()
+    listener = scan_monitor.listener
+    assert listener is not None
+    threading.Event().wait(CONNECT_SECONDS * 2)
+    assert scan_monitor.is_streaming()
+
+    scan_monitor.stop()
+
+    assert not listener.is_alive()
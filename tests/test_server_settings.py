@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from plexapi.exceptions import BadRequest, NotFound
+
+from plexutil.util.plex_ops import PlexOps
+
+
+class FakeSetting:
+    def __init__(self, name: str, value: bool | int | str) -> None:
+        self.id = name
+        self.value = value
+        self.set_values: list[bool | int | str] = []
+
+    def set(self, value: bool | int | str) -> None:
+        if value == "rejected":
+            description = "400 Bad Request"
+            raise BadRequest(description)
+        self.set_values.append(value)
+
+
+class FakeSettings:
+    def __init__(self, settings: list[FakeSetting]) -> None:
+        self.settings = {x.id: x for x in settings}
+        self.saves = 0
+
+    def get(self, name: str) -> FakeSetting:
+        if name not in self.settings:
+            raise NotFound(name)
+        return self.settings[name]
+
+    def save(self) -> None:
+        self.saves = self.saves + 1
+
+
+class FakeServer:
+    def __init__(self, settings: list[FakeSetting]) -> None:
+        self.settings = FakeSettings(settings)
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer(
+        [
+            FakeSetting("FSEventLibraryUpdatesEnabled", True),
+            FakeSetting("ScheduledLibraryUpdateInterval", 3600),
+            FakeSetting("FriendlyName", "Plex"),
+        ]
+    )
+
+
+def get_set_values(server: FakeServer) -> dict[str, list]:
+    return {
+        x.id: x.set_values
+        for x in server.settings.settings.values()
+        if x.set_values
+    }
+
+
+def test_only_changed_settings_are_saved(
+    server: FakeServer, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO, logger="console"):
+        applied = PlexOps.apply_server_settings(
+            plex_server=server,  # pyright: ignore # noqa: PGH003
+            desired={
+                # Toggles may come back as 0/1
+                "FSEventLibraryUpdatesEnabled": 1,
+                "ScheduledLibraryUpdateInterval": "3600",
+                "FriendlyName": "Media",
+            },
+        )
+
+    assert applied == {"FriendlyName": "Media"}
+    assert get_set_values(server) == {"FriendlyName": ["Media"]}
+    assert server.settings.saves == 1
+    assert "Settings plan | Server" in caplog.text
+    assert "-> FriendlyName: Plex -> Media" in caplog.text
+    assert "Unchanged: 2" in caplog.text
+
+
+def test_save_skipped_without_changes(
+    server: FakeServer, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO, logger="console"):
+        applied = PlexOps.apply_server_settings(
+            plex_server=server,  # pyright: ignore # noqa: PGH003
+            desired={"FSEventLibraryUpdatesEnabled": True},
+        )
+
+    assert applied == {}
+    assert get_set_values(server) == {}
+    assert server.settings.saves == 0
+    assert "No changes" in caplog.text
+
+
+def test_missing_and_rejected_settings_are_skipped(
+    server: FakeServer, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING, logger="regular"):
+        applied = PlexOps.apply_server_settings(
+            plex_server=server,  # pyright: ignore # noqa: PGH003
+            desired={
+                "Missing": 1,
+                "FriendlyName": "rejected",
+                "ScheduledLibraryUpdateInterval": 900,
+            },
+            is_plan_logged=False,
+        )
+
+    assert applied == {"ScheduledLibraryUpdateInterval": 900}
+    assert server.settings.saves == 1
+    assert "Skipping -> Missing" in caplog.text
+    assert "Skipping -> FriendlyName:rejected" in caplog.text
+
+
+def test_diff_settings_returns_current_and_desired(
+    server: FakeServer,
+) -> None:
+    changes = PlexOps.diff_settings(
+        desired={
+            "FSEventLibraryUpdatesEnabled": False,
+            "FriendlyName": "Plex",
+            "Missing": 1,
+        },
+        current=server.settings.settings,  # pyright: ignore # noqa: PGH003
+    )
+
+    assert changes == {"FSEventLibraryUpdatesEnabled": (True, False)}
@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from plexapi.exceptions import NotFound
+from plexapi.library import MovieSection, MusicSection
+
+from plexutil.core.prompt import Prompt
+from plexutil.core.spec_applier import SpecApplier
+from plexutil.dto.music_playlist_dto import MusicPlaylistDTO
+from plexutil.dto.song_dto import SongDTO
+from plexutil.enums.agent import Agent
+from plexutil.enums.language import Language
+from plexutil.enums.library_type import LibraryType
+from plexutil.enums.scanner import Scanner
+from plexutil.exception.user_error import UserError
+from plexutil.util.file_importer import FileImporter
+from tests.fake_plex import get_bootstrap_paths_dto
+
+SPEC_YAML = """
+servers:
+  - name: MyServer
+    settings: {FriendlyName: Media}
+    libraries:
+      - name: Movies
+        type: movie
+        locations: [/storage/movies]
+        settings: {enableCinemaTrailers: false}
+      - name: Music
+        type: music
+        locations: [/storage/music]
+        language: es-ES
+    playlists:
+      - library: Music
+        name: Chill
+        songs: ["Artist - One", {artist: Artist, title: Two}]
+"""
+
+SPEC_TOML = """
+[[servers]]
+name = "MyServer"
+settings = {FriendlyName = "Media"}
+
+[[servers.libraries]]
+name = "Movies"
+type = "movie"
+locations = ["/storage/movies"]
+settings = {enableCinemaTrailers = false}
+
+[[servers.libraries]]
+name = "Music"
+type = "music"
+locations = ["/storage/music"]
+language = "es-ES"
+
+[[servers.playlists]]
+library = "Music"
+name = "Chill"
+songs = [
+    {artist = "Artist", title = "One"},
+    {artist = "Artist", title = "Two"},
+]
+"""
+
+
+class FakeSetting:
+    def __init__(self, name: str, value: bool | int | str) -> None:
+        self.id = name
+        self.value = value
+        self.type = "bool" if isinstance(value, bool) else "text"
+        self.enumValues = None
+
+    def set(self, value: bool | int | str) -> None:
+        self.value = value
+
+
+class FakeServerSettings:
+    def __init__(self, settings: list[FakeSetting]) -> None:
+        self.settings = {x.id: x for x in settings}
+
+    def get(self, name: str) -> FakeSetting:
+        if name not in self.settings:
+            raise NotFound(name)
+        return self.settings[name]
+
+    def save(self) -> None:
+        return
+
+
+class FakeTrack:
+    def __init__(self, title: str) -> None:
+        self.title = title
+        self.originalTitle = None
+        self.grandparentTitle = "Artist"
+        self.locations = [f"/storage/music/Artist - {title}.flac"]
+
+
+class FakePlaylist:
+    def __init__(self, title: str, tracks: list[FakeTrack]) -> None:
+        self.title = title
+        self.tracks = list(tracks)
+
+    def items(self) -> list[FakeTrack]:
+        return list(self.tracks)
+
+    def addItems(self, items: list[FakeTrack]) -> None:  # noqa: N802
+        self.tracks.extend(items)
+
+    def removeItems(self, items: list[FakeTrack]) -> None:  # noqa: N802
+        self.tracks = [x for x in self.tracks if x not in items]
+
+
+class SectionState:
+    """
+    A Section held in memory, edits change it as the server would
+    """
+
+    def __init__(
+        self,
+        title: str,
+        library_type: LibraryType,
+        locations: list[str],
+        language: str = Language.get_default().get_value(),
+    ) -> None:
+        self.title = title
+        self.agent = Agent.get_default(library_type).get_value()
+        self.scanner = Scanner.get_default(library_type).get_value()
+        self.language = language
+        self.locations = locations
+        setting = FakeSetting("enableCinemaTrailers", value=True)
+        self.prefs = {setting.id: setting}
+        self.tracks: list[FakeTrack] = []
+        self.plex_playlists: list[FakePlaylist] = []
+        self.edits: list[dict] = []
+
+    def edit(self, **kwargs) -> None:  # noqa: ANN003
+        self.edits.append(kwargs)
+        for key, value in kwargs.items():
+            if key.startswith("prefs["):
+                self.set_pref(key[len("prefs[") : -1], value)
+            elif key == "location":
+                self.locations = value
+            else:
+                setattr(self, key, value)
+
+    def set_pref(self, name: str, value: bool | int | str) -> None:
+        setting = self.prefs[name]
+        if setting.type == "bool":
+            value = bool(int(value))
+        setting.value = value
+
+    def settings(self) -> list[FakeSetting]:
+        return list(self.prefs.values())
+
+    def search(
+        self,
+        container_start: int = 0,
+        container_size: int = 0,
+        **kwargs,  # noqa: ANN003, ARG002
+    ) -> list[FakeTrack]:
+        return self.tracks[container_start : container_start + container_size]
+
+    def playlists(self) -> list[FakePlaylist]:
+        return self.plex_playlists
+
+    def createPlaylist(  # noqa: N802
+        self, title: str, items: list[FakeTrack]
+    ) -> FakePlaylist:
+        playlist = FakePlaylist(title=title, tracks=items)
+        self.plex_playlists.append(playlist)
+        return playlist
+
+
+class FakeMovieSection(SectionState, MovieSection):
+    pass
+
+
+class FakeMusicSection(SectionState, MusicSection):
+    pass
+
+
+class FakeLibrary:
+    def __init__(self, sections: list[SectionState]) -> None:
+        self.plex_sections = sections
+
+    def sections(self) -> list[SectionState]:
+        return list(self.plex_sections)
+
+    def _invalidateCachedProperties(self) -> None:  # noqa: N802
+        return
+
+
+class FakeServer:
+    """
+    Holds a Music Library and its Chill Playlist, Libraries created
+    through the sections endpoint are added to it
+    """
+
+    platform = "Linux"
+
+    def __init__(self) -> None:
+        self.settings = FakeServerSettings([FakeSetting("FriendlyName", "")])
+        music = FakeMusicSection(
+            title="Music",
+            library_type=LibraryType.MUSIC,
+            locations=["/storage/music"],
+        )
+        music.tracks = [FakeTrack(x) for x in ("One", "Two", "Three")]
+        music.plex_playlists = [FakePlaylist("Chill", [music.tracks[2]])]
+        self.library = FakeLibrary([music])
+        self._session = SimpleNamespace(post=None)
+
+    def query(self, part: str, method: object) -> None:  # noqa: ARG002
+        url = urlsplit(part)
+        query = parse_qsl(url.query)
+        values = dict(query)
+        section = FakeMovieSection(
+            title=values["name"],
+            library_type=LibraryType.MOVIE,
+            locations=[y for x, y in query if x == "location"],
+            language=values["language"],
+        )
+        section.agent = values["agent"]
+        section.scanner = values["scanner"]
+        for key, value in query:
+            if key.startswith("prefs["):
+                section.set_pref(key[len("prefs[") : -1], value)
+        self.library.plex_sections.append(section)
+
+
+class FakeAccount:
+    def __init__(self, server: FakeServer) -> None:
+        self.server = server
+
+    def resource(self, name: str) -> FakeServer:
+        if name != "MyServer":
+            raise NotFound(name)
+        return self.server
+
+
+@pytest.fixture
+def spec_path(tmp_path: Path) -> Path:
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(SPEC_YAML, encoding=FileImporter.encoding)
+    return spec_path
+
+
+def test_yaml_spec(spec_path: Path) -> None:
+    (server_spec,) = FileImporter.get_spec(spec_path)
+
+    assert server_spec.name == "MyServer"
+    assert server_spec.settings == {"FriendlyName": "Media"}
+    movies, music = server_spec.libraries
+    assert movies.library_type is LibraryType.MOVIE
+    assert movies.locations == [Path("/storage/movies")]
+    assert movies.agent is Agent.get_default(LibraryType.MOVIE)
+    assert movies.language is Language.get_default()
+    assert movies.settings == {"enableCinemaTrailers": False}
+    assert music.language is Language.get_from_str("es-ES")
+    assert server_spec.playlists == {
+        "Music": [
+            MusicPlaylistDTO(
+                name="Chill",
+                songs=[
+                    SongDTO(artist="Artist", title="One"),
+                    SongDTO(artist="Artist", title="Two"),
+                ],
+            )
+        ]
+    }
+
+
+def test_toml_spec_matches_yaml(spec_path: Path, tmp_path: Path) -> None:
+    toml_path = tmp_path / "spec.toml"
+    toml_path.write_text(SPEC_TOML, encoding=FileImporter.encoding)
+
+    assert FileImporter.get_spec(toml_path) == FileImporter.get_spec(spec_path)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "servers: [",
+        "{libraries: []}",
+        "{servers: [{settings: {}}]}",
+        "{servers: [{name: S, libraries: [{name: M, type: x}]}]}",
+        "{servers: [{name: S, libraries: [{name: M, type: movie}]}]}",
+        (
+            "{servers: [{name: S, libraries: "
+            "[{name: P, type: music_playlist, locations: []}]}]}"
+        ),
+        (
+            "{servers: [{name: S, playlists: "
+            "[{library: Music, name: P, songs: [No Separator]}]}]}"
+        ),
+    ],
+)
+def test_invalid_spec_is_rejected(tmp_path: Path, spec: str) -> None:
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(spec, encoding=FileImporter.encoding)
+
+    with pytest.raises(UserError):
+        FileImporter.get_spec(spec_path)
+
+
+def test_malformed_toml_is_rejected(tmp_path: Path) -> None:
+    spec_path = tmp_path / "spec.toml"
+    # Arrays mixing strings and tables are not supported by toml
+    spec_path.write_text(
+        'songs = ["Artist - One", {artist = "Artist", title = "Two"}]',
+        encoding=FileImporter.encoding,
+    )
+
+    with pytest.raises(UserError):
+        FileImporter.get_spec(spec_path)
+
+
+def test_missing_spec_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(UserError):
+        FileImporter.get_spec(tmp_path / "missing.yaml")
+
+
+def test_apply_is_idempotent(
+    spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        Prompt,
+        "connect_server",
+        staticmethod(lambda plex_resource: plex_resource),
+    )
+    server = FakeServer()
+    spec_applier = SpecApplier(
+        plex_account=FakeAccount(server),  # pyright: ignore # noqa: PGH003
+        bootstrap_paths_dto=get_bootstrap_paths_dto(tmp_path),
+    )
+    server_specs = FileImporter.get_spec(spec_path)
+
+    operations = spec_applier.apply(server_specs)
+
+    assert operations == [
+        "Set server setting: FriendlyName -> Media",
+        "Created library: Movies",
+        "Modified library: Music (language)",
+        "Added to playlist: Chill (2 songs)",
+        "Removed from playlist: Chill (1 songs)",
+    ]
+    movies = next(
+        x for x in server.library.plex_sections if x.title == "Movies"
+    )
+    assert movies.prefs["enableCinemaTrailers"].value is False
+    chill = server.library.plex_sections[0].plex_playlists[0]
+    assert sorted(x.title for x in chill.tracks) == ["One", "Two"]
+
+    assert spec_applier.apply(server_specs) == []